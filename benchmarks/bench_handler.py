@@ -0,0 +1,247 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Drive handler() end-to-end against local fakes and record throughput and latency.
+
+Usage:
+    python -m benchmarks.bench_handler --requests 200 --concurrency 16 --model-latency-ms 50
+    python -m benchmarks.bench_handler --baseline benchmarks/results/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.fakes import FakeChatServer, FakeRedditServer, fake_backends
+
+DEFAULT_OUTPUT = Path(__file__).parent / "results" / "latest.json"
+
+# Metrics where a higher value is a regression
+LOWER_IS_BETTER = ["p50_ms", "p95_ms", "p99_ms", "memory_per_request_kb"]
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an unsorted list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def configure(args: argparse.Namespace, base_url: str, reddit_url: str) -> Any:
+    """Point the agent at the fakes and return the main module."""
+    os.environ.update({
+        "OPENAI_API_KEY": "sk-benchmark",
+        "OPENAI_BASE_URL": base_url,
+        "REDDIT_CLIENT_ID": "benchmark",
+        "REDDIT_CLIENT_SECRET": "benchmark",
+        "REDDIT_USERNAME": "benchmark_user",
+        "REDDIT_PASSWORD": "benchmark",
+    })
+    os.environ.pop("OPENROUTER_API_KEY", None)
+
+    import reddit_post_generator.main  # noqa: F401
+
+    main = sys.modules["reddit_post_generator.main"]
+    config = main.load_config()
+    config["agent_pool"] = {**config.get("agent_pool", {}), "size": args.pool_size, "max_waiting": None}
+    config["metrics"] = {**config.get("metrics", {}), "enabled": False}
+    config["pipeline"] = {**config.get("pipeline", {}), "enabled": args.pipeline}
+    # Requests are measured end-to-end, so none of them is queued as a background job
+    config["jobs"] = {**config.get("jobs", {}), "enabled": False}
+    # The fake API has no quota, so only the client's own overhead is measured
+    config["reddit"] = {
+        **config.get("reddit", {}),
+        "client": args.reddit_client,
+        "requests_per_minute": 1_000_000,
+        "auth_url": f"{reddit_url}/api/v1/access_token",
+        "api_url": reddit_url,
+    }
+    # Caches would turn repeated topics into hits; only keep them when asked to
+    for section in config.get("cache", {}).values():
+        if isinstance(section, dict):
+            section["enabled"] = args.caches
+            section["backend"] = "memory"
+    main._config = config
+    return main
+
+
+def request_messages(index: int, pipeline: bool) -> list[dict[str, str]]:
+    """Build one request with a unique topic."""
+    job = {"topic": f"benchmark topic {index}", "subreddit": f"bench{index % 5}", "post_type": "discussion"}
+    content = json.dumps(job) if pipeline else f"Create a discussion post about {job['topic']} for r/{job['subreddit']}"
+    return [{"role": "user", "content": content}]
+
+
+async def drive(main: Any, args: argparse.Namespace) -> dict[str, Any]:
+    """Send every request through handler() at the configured concurrency."""
+    handle = main.stream_handler if args.stream else main.handler
+    await main.ensure_initialized()
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+    first_bytes: list[float] = []
+    errors: list[str] = []
+
+    async def one(index: int) -> None:
+        first_byte = None
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                if args.stream:
+                    async for _ in handle(request_messages(index, args.pipeline)):
+                        if first_byte is None:
+                            first_byte = time.perf_counter() - start
+                    first_bytes.append(first_byte)
+                else:
+                    result = await handle(request_messages(index, args.pipeline))
+                    # Pipeline reports failures in the result rather than raising
+                    if args.pipeline and not json.loads(result)["success"]:
+                        errors.append(json.dumps(json.loads(result)["error"]))
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+            latencies.append(time.perf_counter() - start)
+
+    # Warm-up requests keep import and connection setup out of the measurement
+    for index in range(args.warmup):
+        await one(-1 - index)
+    latencies.clear()
+    first_bytes.clear()
+    errors.clear()
+
+    if args.trace_memory:
+        tracemalloc.start()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(args.requests)))
+    elapsed = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    memory_kb = (rss_after - rss_before) / args.requests
+    if args.trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory_kb = peak / 1024 / min(args.requests, args.concurrency)
+
+    ms = [latency * 1000 for latency in latencies]
+    return {
+        "requests": args.requests,
+        "errors": len(errors),
+        "error_samples": errors[:5],
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_s": round(args.requests / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(ms, 0.5), 2),
+        "p95_ms": round(percentile(ms, 0.95), 2),
+        "p99_ms": round(percentile(ms, 0.99), 2),
+        "max_ms": round(max(ms, default=0.0), 2),
+        "ttfb_p50_ms": round(percentile([t * 1000 for t in first_bytes], 0.5), 2) if first_bytes else None,
+        "memory_per_request_kb": round(memory_kb, 1),
+        "memory_method": "tracemalloc_peak" if args.trace_memory else "rss_growth",
+    }
+
+
+def compare(result: dict[str, Any], baseline: dict[str, Any], max_regression: float) -> list[str]:
+    """Return a message for every metric that regressed beyond max_regression."""
+    regressions = []
+    base, current = baseline["results"], result["results"]
+    for metric in LOWER_IS_BETTER:
+        if base.get(metric) and current.get(metric, 0) > base[metric] * (1 + max_regression):
+            regressions.append(f"{metric}: {base[metric]} -> {current[metric]}")
+    if base.get("requests_per_s") and current["requests_per_s"] < base["requests_per_s"] * (1 - max_regression):
+        regressions.append(f"requests_per_s: {base['requests_per_s']} -> {current['requests_per_s']}")
+    return regressions
+
+
+def run_benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    """Start the fakes, run the benchmark and return the result document."""
+    server = FakeChatServer(latency=args.model_latency_ms / 1000).start()
+    reddit = FakeRedditServer(latency=args.reddit_latency_ms / 1000).start()
+    try:
+        with fake_backends(args.search_latency_ms / 1000, args.reddit_latency_ms / 1000):
+            main = configure(args, server.base_url, reddit.base_url)
+            results = asyncio.run(drive(main, args))
+        results["model_calls"] = server.model.requests
+    finally:
+        server.stop()
+        reddit.stop()
+
+    return {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "settings": {
+            key: getattr(args, key)
+            for key in (
+                "requests",
+                "concurrency",
+                "pool_size",
+                "model_latency_ms",
+                "search_latency_ms",
+                "reddit_latency_ms",
+                "reddit_client",
+                "pipeline",
+                "stream",
+                "caches",
+            )
+        },
+        "results": results,
+    }
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """Create and configure the argument parser."""
+    parser = argparse.ArgumentParser(description="Offline benchmark for the Reddit Post Generator handler")
+    parser.add_argument("--requests", type=int, default=100, help="Number of measured requests")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight at once")
+    parser.add_argument("--pool-size", type=int, default=8, help="Agent pool size")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured warm-up requests")
+    parser.add_argument("--model-latency-ms", type=float, default=50.0, help="Fake model latency per call")
+    parser.add_argument("--search-latency-ms", type=float, default=100.0, help="Fake DuckDuckGo latency per search")
+    parser.add_argument("--reddit-latency-ms", type=float, default=30.0, help="Fake Reddit latency per API call")
+    parser.add_argument(
+        "--reddit-client", choices=["async", "praw"], default="async", help="Reddit client the agent uses"
+    )
+    parser.add_argument("--pipeline", action="store_true", help="Send JSON jobs through the staged pipeline")
+    parser.add_argument("--stream", action="store_true", help="Use the streaming handler and record time to first byte")
+    parser.add_argument("--caches", action="store_true", help="Keep the research, subreddit and LLM caches enabled")
+    parser.add_argument("--trace-memory", action="store_true", help="Measure memory with tracemalloc (slower)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to save the results JSON")
+    parser.add_argument("--baseline", type=Path, help="Results JSON to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed relative regression (0.2 = 20%%)")
+    return parser
+
+
+def main() -> None:
+    """Run the benchmark, save the results and compare against a baseline."""
+    args = create_argument_parser().parse_args()
+    result = run_benchmark(args)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(result, indent=2) + "\n")
+    print(json.dumps(result["results"], indent=2))
+    print(f"💾 Results saved to {args.output}")
+
+    if args.baseline:
+        regressions = compare(result, json.loads(args.baseline.read_text()), args.max_regression)
+        if regressions:
+            print("❌ Regressions against baseline:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+        print("✅ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
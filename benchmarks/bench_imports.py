@@ -0,0 +1,125 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Measure cold import time of the package and the CLI, and which heavy dependencies they load.
+
+Every sample runs in a fresh interpreter, so nothing is already in ``sys.modules``.
+
+Usage:
+    python -m benchmarks.bench_imports --repeat 10
+    python -m benchmarks.bench_imports --baseline benchmarks/results/imports-baseline.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+DEFAULT_OUTPUT = Path(__file__).parent / "results" / "imports.json"
+
+# Modules each target is measured importing
+TARGETS = {
+    "package": "reddit_post_generator",
+    "main": "reddit_post_generator.main",
+}
+
+# Dependencies that must only load once the agent is initialized or the server starts
+HEAVY_MODULES = ["agno", "bindu", "openai", "praw", "ddgs", "uvicorn", "httpx", "pydantic"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def _python(*args: str) -> str:
+    """Run this interpreter with ``args`` and return its stdout."""
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True).stdout  # noqa: S603
+
+
+def probe(module: str) -> dict[str, Any]:
+    """Import ``module`` in a fresh interpreter; return its import time and the heavy modules it loaded."""
+    output = _python("-c", _PROBE.format(module=module, heavy=HEAVY_MODULES))
+    return json.loads(output.splitlines()[-1])
+
+
+def time_cli_help() -> float:
+    """Wall time of ``python -m reddit_post_generator --help``, interpreter startup included, in ms."""
+    start = time.perf_counter()
+    _python("-m", "reddit_post_generator", "--help")
+    return (time.perf_counter() - start) * 1000
+
+
+def run_benchmark(repeat: int) -> dict[str, Any]:
+    """Sample every target ``repeat`` times and return the result document."""
+    results: dict[str, Any] = {}
+    for name, module in TARGETS.items():
+        samples = [probe(module) for _ in range(repeat)]
+        results[f"{name}_import_ms"] = round(statistics.median(s["ms"] for s in samples), 1)
+        results[f"{name}_heavy_modules"] = samples[0]["heavy"]
+    results["cli_help_ms"] = round(statistics.median(time_cli_help() for _ in range(repeat)), 1)
+
+    return {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "settings": {"repeat": repeat},
+        "results": results,
+    }
+
+
+def compare(result: dict[str, Any], baseline: dict[str, Any], max_regression: float) -> list[str]:
+    """Return a message for every import that got slower beyond max_regression or loads a heavy module."""
+    regressions = []
+    base, current = baseline["results"], result["results"]
+    for metric, value in current.items():
+        if metric.endswith("_ms") and base.get(metric) and value > base[metric] * (1 + max_regression):
+            regressions.append(f"{metric}: {base[metric]} -> {value}")
+        if metric.endswith("_heavy_modules") and value:
+            regressions.append(f"{metric}: {', '.join(value)} loaded at import")
+    return regressions
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """Create and configure the argument parser."""
+    parser = argparse.ArgumentParser(description="Cold import time benchmark for the Reddit Post Generator")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per target; the median is kept")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to save the results JSON")
+    parser.add_argument("--baseline", type=Path, help="Results JSON to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed relative regression (0.2 = 20%%)")
+    return parser
+
+
+def main() -> None:
+    """Run the benchmark, save the results and fail on regressions."""
+    args = create_argument_parser().parse_args()
+    result = run_benchmark(args.repeat)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(result, indent=2) + "\n")
+    print(json.dumps(result["results"], indent=2))
+    print(f"💾 Results saved to {args.output}")
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else {"results": {}}
+    regressions = compare(result, baseline, args.max_regression)
+    if regressions:
+        print("❌ Import regressions:\n  " + "\n  ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Measure the memory each request leaves behind in bindu's task storage.
+
+Requests run through handler() against local fakes, and each reply is stored the
+way bindu's worker stores it: as the task's last message and as its artifact.
+The same requests are measured with raw results in upstream's unbounded storage
+and with projected results in the bounded storage.
+
+Usage:
+    python -m benchmarks.bench_memory --requests 200 --max-tasks 50
+    python -m benchmarks.bench_memory --baseline benchmarks/results/memory-baseline.json
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import sys
+import tracemalloc
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from benchmarks import bench_handler
+from benchmarks.fakes import FakeChatServer, FakeRedditServer, fake_backends
+
+DEFAULT_OUTPUT = Path(__file__).parent / "results" / "memory.json"
+
+# Metrics where a higher value is a regression
+LOWER_IS_BETTER = ["bounded_retained_kb_per_request", "bounded_task_payload_kb"]
+
+
+async def store_request(main: Any, storage: Any, index: int) -> None:
+    """Run one request and store its reply as bindu's worker does."""
+    from bindu.server.workers.helpers.result_processor import ResultProcessor
+    from bindu.utils.worker_utils import ArtifactBuilder, MessageConverter
+
+    messages = bench_handler.request_messages(index, pipeline=False)
+    context_id = uuid4()
+    task = await storage.submit_task(
+        context_id,
+        {
+            "message_id": uuid4(),
+            "task_id": uuid4(),
+            "context_id": context_id,
+            "kind": "message",
+            "role": "user",
+            "parts": [{"kind": "text", "text": messages[-1]["content"]}],
+        },
+    )
+    await storage.update_task(task["id"], state="working")
+
+    results = ResultProcessor.normalize_result(await main.handler(messages))
+    await storage.update_task(
+        task["id"],
+        state="completed",
+        new_artifacts=ArtifactBuilder.from_result(results),
+        new_messages=MessageConverter.to_protocol_messages(results, task["id"], context_id),
+    )
+
+
+async def measure(main: Any, storage: Any, projector: Any, requests: int) -> dict[str, Any]:
+    """Memory left behind by ``requests`` stored requests, once garbage is collected."""
+    main.result_projector = projector
+    # One unstored request first, so lazily built state isn't counted against the measured ones
+    await main.handler(bench_handler.request_messages(-1, pipeline=False))
+
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    for index in range(requests):
+        await store_request(main, storage, index)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+
+    payload = len(json.dumps(list(storage.tasks.values()), default=str))
+    return {
+        "retained_kb_per_request": round((after - before) / 1024 / requests, 2),
+        "stored_tasks": len(storage.tasks),
+        "task_payload_kb": round(payload / 1024 / max(len(storage.tasks), 1), 2),
+    }
+
+
+async def drive(main: Any, args: argparse.Namespace) -> dict[str, Any]:
+    """Measure upstream's storage with raw results, then the bounded storage with projected results."""
+    from bindu.server.storage.memory_storage import InMemoryStorage
+
+    from reddit_post_generator.results import ResultProjector
+    from reddit_post_generator.retention import BoundedMemoryStorage
+
+    await main.ensure_initialized()
+    scenarios = {
+        "unbounded": (InMemoryStorage(), ResultProjector("raw")),
+        "bounded": (
+            BoundedMemoryStorage(max_tasks=args.max_tasks, max_age_seconds=None),
+            ResultProjector.from_config(main.get_config()),
+        ),
+    }
+
+    results: dict[str, Any] = {}
+    tracemalloc.start()
+    try:
+        for name, (storage, projector) in scenarios.items():
+            measured = await measure(main, storage, projector, args.requests)
+            results.update({f"{name}_{metric}": value for metric, value in measured.items()})
+    finally:
+        tracemalloc.stop()
+
+    if results["unbounded_retained_kb_per_request"] > 0:
+        results["retained_reduction"] = round(
+            1 - results["bounded_retained_kb_per_request"] / results["unbounded_retained_kb_per_request"], 3
+        )
+    return results
+
+
+def compare(result: dict[str, Any], baseline: dict[str, Any], max_regression: float) -> list[str]:
+    """Return a message for every metric that regressed beyond max_regression."""
+    regressions = []
+    base, current = baseline["results"], result["results"]
+    for metric in LOWER_IS_BETTER:
+        if base.get(metric) and current.get(metric, 0) > base[metric] * (1 + max_regression):
+            regressions.append(f"{metric}: {base[metric]} -> {current[metric]}")
+    return regressions
+
+
+def run_benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    """Start the fakes, run both scenarios and return the result document."""
+    server = FakeChatServer().start()
+    reddit = FakeRedditServer().start()
+    handler_args = bench_handler.create_argument_parser().parse_args(["--pool-size=1"])
+    try:
+        with fake_backends(0.0, 0.0):
+            main = bench_handler.configure(handler_args, server.base_url, reddit.base_url)
+            results = asyncio.run(drive(main, args))
+    finally:
+        server.stop()
+        reddit.stop()
+
+    return {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "settings": {"requests": args.requests, "max_tasks": args.max_tasks},
+        "results": results,
+    }
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """Create and configure the argument parser."""
+    parser = argparse.ArgumentParser(description="Task storage memory benchmark for the Reddit Post Generator")
+    parser.add_argument("--requests", type=int, default=200, help="Stored requests per scenario")
+    parser.add_argument("--max-tasks", type=int, default=50, help="Finished tasks the bounded storage keeps")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to save the results JSON")
+    parser.add_argument("--baseline", type=Path, help="Results JSON to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed relative regression (0.2 = 20%%)")
+    return parser
+
+
+def main() -> None:
+    """Run the benchmark, save the results and compare against a baseline."""
+    args = create_argument_parser().parse_args()
+    result = run_benchmark(args)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(result, indent=2) + "\n")
+    print(json.dumps(result["results"], indent=2))
+    print(f"💾 Results saved to {args.output}")
+
+    if args.baseline:
+        regressions = compare(result, json.loads(args.baseline.read_text()), args.max_regression)
+        if regressions:
+            print("❌ Regressions against baseline:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+        print("✅ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Local stand-ins for the chat-completion API, DuckDuckGo and Reddit."""
+
+import json
+import re
+import threading
+import time
+import urllib.parse
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from unittest.mock import patch
+
+# Order in which the fake model calls whichever of these tools the agent offers;
+# within a step only the first offered alternative is called
+TOOL_SCRIPT = [("research_topic", "web_search"), ("get_subreddit_info",), ("get_subreddit_rules",), ("create_post",)]
+
+_SUBREDDIT_RE = re.compile(r'"subreddit":\s*"([^"]+)"')
+_TOPIC_RE = re.compile(r'"topic":\s*"([^"]+)"')
+
+
+def _tokens(text: str) -> int:
+    # Rough chat-model tokenization, good enough for usage accounting
+    return max(1, len(text) // 4)
+
+
+class FakeChatCompletions:
+    """Scripted OpenAI-compatible model: calls each offered tool once, then answers."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """Answer every request after ``latency`` seconds."""
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def complete(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Return the assistant message for one chat completion request."""
+        with self._lock:
+            self.requests += 1
+        time.sleep(self.latency)
+
+        messages = body.get("messages", [])
+        prompt = "\n".join(str(m.get("content") or "") for m in messages if m.get("role") == "user")
+        subreddit = _SUBREDDIT_RE.search(prompt) or re.search(r"r/(\w+)", prompt)
+        topic = _TOPIC_RE.search(prompt)
+        subreddit_name = subreddit.group(1) if subreddit else "benchmarks"
+        topic_text = topic.group(1) if topic else prompt[:80]
+
+        offered = {tool["function"]["name"] for tool in body.get("tools", []) or []}
+        called = {
+            call["function"]["name"]
+            for message in messages
+            if message.get("role") == "assistant"
+            for call in message.get("tool_calls") or []
+        }
+        arguments = {
+            "research_topic": {"topic": topic_text, "keywords": ["news", "guide"]},
+            "web_search": {"query": topic_text, "max_results": 5},
+            "get_subreddit_info": {"subreddit_name": subreddit_name},
+            "get_subreddit_rules": {"subreddit_name": subreddit_name},
+            "create_post": {
+                "subreddit": subreddit_name,
+                "title": f"Let's talk about {topic_text}",
+                "content": f"Some findings about {topic_text}.",
+            },
+        }
+        for step in TOOL_SCRIPT:
+            name = next((name for name in step if name in offered), None)
+            if name is not None and not called.intersection(step):
+                call = {
+                    "id": f"call_{uuid.uuid4().hex[:12]}",
+                    "type": "function",
+                    "function": {"name": name, "arguments": json.dumps(arguments[name])},
+                }
+                return {"role": "assistant", "content": None, "tool_calls": [call]}
+
+        if body.get("response_format", {}).get("type") == "json_schema":
+            content = json.dumps({
+                "title": f"Let's talk about {topic_text}",
+                "content": f"Some findings about {topic_text}.\n\n- First point\n- Second point",
+                "flair": None,
+            })
+        else:
+            content = (
+                f"# Reddit Post Generated Successfully\n\n- **Subreddit:** {subreddit_name}\n"
+                f"- **Title:** Let's talk about {topic_text}\n- https://example.com/{uuid.uuid4().hex[:8]}"
+            )
+        return {"role": "assistant", "content": content}
+
+    def response(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Wrap the assistant message in a chat.completion payload with usage."""
+        message = self.complete(body)
+        prompt_tokens = _tokens(json.dumps(body.get("messages", [])))
+        completion_tokens = _tokens(json.dumps(message))
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": message,
+                    "finish_reason": "tool_calls" if message.get("tool_calls") else "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    def stream(self, body: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """Yield chat.completion.chunk payloads: one per tool call, or one per word of content."""
+        payload = self.response(body)
+        message = payload["choices"][0]["message"]
+        base = {"id": payload["id"], "object": "chat.completion.chunk", "created": payload["created"]}
+        base["model"] = payload["model"]
+
+        if message.get("tool_calls"):
+            deltas = [{"role": "assistant", "tool_calls": [{"index": 0, **message["tool_calls"][0]}]}]
+        else:
+            deltas = [{"role": "assistant", "content": word} for word in re.findall(r"\S+\s*", message["content"])]
+
+        for delta in deltas:
+            yield {**base, "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+        finish = "tool_calls" if message.get("tool_calls") else "stop"
+        yield {**base, "choices": [{"index": 0, "delta": {}, "finish_reason": finish}]}
+        yield {**base, "choices": [], "usage": payload["usage"]}
+
+
+class FakeChatServer:
+    """Serve FakeChatCompletions at ``/v1/chat/completions`` on a background thread."""
+
+    def __init__(self, latency: float = 0.0, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Bind the server; port 0 picks a free port."""
+        self.model = FakeChatCompletions(latency)
+        model = self.model
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self) -> None:
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self.send_error(404)
+                    return
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+
+                if body.get("stream"):
+                    chunks = b"".join(f"data: {json.dumps(chunk)}\n\n".encode() for chunk in model.stream(body))
+                    data = chunks + b"data: [DONE]\n\n"
+                    content_type = "text/event-stream"
+                else:
+                    data = json.dumps(model.response(body)).encode()
+                    content_type = "application/json"
+
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                return
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        """Return the OpenAI-compatible base URL to point the model client at."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "FakeChatServer":
+        """Start serving on a daemon thread."""
+        threading.Thread(target=self._server.serve_forever, name="fake-chat", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class FakeDDGS:
+    """Drop-in for ``ddgs.DDGS`` returning synthetic results after a fixed delay."""
+
+    latency = 0.0
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Accept and ignore DDGS's options."""
+
+    def __enter__(self) -> "FakeDDGS":
+        """Return the client, as DDGS does."""
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Do nothing; there is nothing to close."""
+        return None
+
+    def _results(self, query: str, max_results: int | None) -> list[dict[str, str]]:
+        time.sleep(self.latency)
+        slug = re.sub(r"\W+", "-", query.lower()).strip("-")
+        return [
+            {"title": f"{query} - result {i}", "href": f"https://example.com/{slug}/{i}", "body": f"About {query}."}
+            for i in range(max_results or 5)
+        ]
+
+    def text(self, query: str, max_results: int | None = None, **kwargs: Any) -> list[dict[str, str]]:
+        """Return synthetic web results for ``query``."""
+        return self._results(query, max_results)
+
+    def news(self, query: str, max_results: int | None = None, **kwargs: Any) -> list[dict[str, str]]:
+        """Return synthetic news results for ``query``."""
+        return [{**r, "date": "2026-01-01", "source": "Example News"} for r in self._results(query, max_results)]
+
+
+class FakeSubmission:
+    """Enough of ``praw.models.Submission`` for the agent's tools."""
+
+    def __init__(self, subreddit: str, title: str) -> None:
+        """Create a post in ``subreddit`` with a random id."""
+        self.id = uuid.uuid4().hex[:6]
+        self.title = title
+        self.permalink = f"/r/{subreddit}/comments/{self.id}/"
+        self.url = f"https://reddit.com{self.permalink}"
+        self.created_utc = time.time()
+        self.author = "benchmark_user"
+        self.link_flair_text = None
+        self.score = 1
+        self.selftext = ""
+        self.subreddit = subreddit
+        self.subreddit_name_prefixed = f"r/{subreddit}"
+
+
+class FakeSubreddit:
+    """Enough of ``praw.models.Subreddit`` for the agent's tools."""
+
+    def __init__(self, name: str, latency: float) -> None:
+        """Describe r/``name``; its network calls sleep for ``latency`` seconds."""
+        self.latency = latency
+        self.display_name = name
+        self.title = f"r/{name}"
+        self.description = f"A community about {name}."
+        self.public_description = self.description
+        self.subscribers = 125_000
+        self.active_user_count = 1_200
+        self.created_utc = 1_200_000_000.0
+        self.over18 = False
+        self.url = f"/r/{name}/"
+        self.rules = [
+            type(
+                "Rule",
+                (),
+                {
+                    "short_name": "Be civil",
+                    "description": "No insults.",
+                    "kind": "all",
+                    "violation_reason": "Incivility",
+                },
+            )(),
+        ]
+        self.flair = type("Flair", (), {"link_templates": [{"text": "Discussion", "id": "f1"}]})()
+
+    def post_requirements(self) -> dict[str, Any]:
+        """Return fixed posting requirements."""
+        time.sleep(self.latency)
+        return {"title_text_max_length": 300, "body_restriction_policy": "none"}
+
+    def top(self, time_filter: str = "all", limit: int | None = 10) -> list[FakeSubmission]:
+        """Return ``limit`` synthetic top posts."""
+        time.sleep(self.latency)
+        return [FakeSubmission(self.display_name, f"Top post {i}") for i in range(limit or 10)]
+
+    def submit(self, title: str, selftext: str | None = None, url: str | None = None, **kwargs: Any) -> FakeSubmission:
+        """Return a new post without sending anything."""
+        time.sleep(self.latency)
+        return FakeSubmission(self.display_name, title)
+
+
+class FakeReddit:
+    """Drop-in for ``praw.Reddit`` whose network calls sleep for a fixed delay."""
+
+    latency = 0.0
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Accept and ignore PRAW's credentials."""
+        self.user = type("User", (), {"me": staticmethod(lambda: "benchmark_user")})()
+
+    def subreddit(self, name: str) -> FakeSubreddit:
+        """Return a FakeSubreddit for ``name``."""
+        time.sleep(self.latency)
+        return FakeSubreddit(name, self.latency)
+
+
+def reddit_api_get(path: str) -> Any:
+    """Answer one read-only OAuth API call for a FakeSubreddit, or None for unknown paths."""
+    parts = path.strip("/").split("/")
+    subreddit = FakeSubreddit(parts[1] if parts[0] == "r" else parts[2], 0.0)
+    if path.endswith("/about"):
+        fields = ("display_name", "title", "description", "public_description", "subscribers", "over18")
+        about = {key: getattr(subreddit, key) for key in (*fields, "created_utc", "url")}
+        return {"data": {**about, "active_user_count": subreddit.active_user_count}}
+    if path.endswith("/about/rules"):
+        fields = ("short_name", "description", "kind", "violation_reason")
+        return {"rules": [{key: getattr(rule, key) for key in fields} for rule in subreddit.rules]}
+    if path.endswith("/api/link_flair_v2"):
+        return subreddit.flair.link_templates
+    if path.endswith("/post_requirements"):
+        return subreddit.post_requirements()
+    if path.endswith("/top"):
+        return {"data": {"children": [{"data": vars(post)} for post in subreddit.top()]}}
+    return None
+
+
+class FakeRedditServer:
+    """Serve the parts of Reddit's OAuth API used by AsyncRedditClient on a background thread."""
+
+    def __init__(self, latency: float = 0.0, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Bind the server; port 0 picks a free port."""
+        self.latency = latency
+        self.requests = 0
+        self.token_requests = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _reply(self, payload: Any) -> None:
+                with server._lock:
+                    server.requests += 1
+                time.sleep(server.latency)
+                data = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                # A quota far above what the benchmark uses, so pacing never kicks in
+                self.send_header("X-Ratelimit-Remaining", "100000")
+                self.send_header("X-Ratelimit-Reset", "60")
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:
+                payload = reddit_api_get(self.path.split("?")[0])
+                if payload is None:
+                    self.send_error(404)
+                else:
+                    self._reply(payload)
+
+            def do_POST(self) -> None:
+                body = dict(
+                    urllib.parse.parse_qsl(self.rfile.read(int(self.headers.get("Content-Length", 0))).decode())
+                )
+                if self.path.endswith("/access_token"):
+                    with server._lock:
+                        server.token_requests += 1
+                    self._reply({"access_token": uuid.uuid4().hex, "token_type": "bearer", "expires_in": 3600})
+                elif self.path.endswith("/api/submit"):
+                    post_id = uuid.uuid4().hex[:6]
+                    url = f"https://www.reddit.com/r/{body.get('sr')}/comments/{post_id}/"
+                    self._reply({"json": {"errors": [], "data": {"id": post_id, "name": f"t3_{post_id}", "url": url}}})
+                else:
+                    self.send_error(404)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                return
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        """Return the URL to use for both Reddit's auth and API endpoints."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeRedditServer":
+        """Start serving on a daemon thread."""
+        threading.Thread(target=self._server.serve_forever, name="fake-reddit", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@contextmanager
+def fake_backends(search_latency: float = 0.0, reddit_latency: float = 0.0) -> Iterator[None]:
+    """Route DuckDuckGo and PRAW through the local fakes for the duration of the block."""
+    search = type("BenchDDGS", (FakeDDGS,), {"latency": search_latency})
+    reddit = type("BenchReddit", (FakeReddit,), {"latency": reddit_latency})
+    with patch("agno.tools.websearch.DDGS", search), patch("praw.Reddit", reddit):
+        yield
@@ -9,8 +9,23 @@
 
 """reddit-post-generator - A Bindu Agent."""
 
+from typing import Any
+
 from reddit_post_generator.__version__ import __version__
-from reddit_post_generator.main import cleanup, handler, initialize_agent, main
+
+# Re-exported from main on first access, so importing the package (or its light
+# modules) doesn't load agno, bindu and the model clients
+_MAIN_EXPORTS = {"cleanup", "handler", "initialize_agent", "main"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _MAIN_EXPORTS:
+        from reddit_post_generator import main as main_module
+
+        return getattr(main_module, name)
+    error_msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(error_msg)
+
 
 __all__ = [
     "__version__",
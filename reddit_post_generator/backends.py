@@ -0,0 +1,90 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Task storage and scheduler selection for running several server replicas."""
+
+import os
+from typing import Any
+
+# Backends bindu can start; anything else silently falls back to memory upstream
+STORAGE_TYPES = ("memory", "postgres")
+SCHEDULER_TYPES = ("memory", "redis")
+
+# agent_config.json storage keys -> bindu.settings.app_settings.storage attributes
+POSTGRES_POOL_SETTINGS = {
+    "pool_min": "postgres_pool_min",
+    "pool_max": "postgres_pool_max",
+    "timeout_seconds": "postgres_timeout",
+    "command_timeout_seconds": "postgres_command_timeout",
+}
+
+
+def resolve_storage(storage: dict[str, Any]) -> dict[str, Any]:
+    """Validate the storage section and fill in the Postgres URL from DATABASE_URL."""
+    storage_type = storage.get("type", "memory")
+    if storage_type not in STORAGE_TYPES:
+        error_msg = (
+            f"Unsupported storage type '{storage_type}'. bindu supports {', '.join(STORAGE_TYPES)}; "
+            "use postgres for storage shared between replicas."
+        )
+        raise ValueError(error_msg)
+
+    resolved = {**storage, "type": storage_type}
+    if storage_type == "postgres":
+        resolved["postgres_url"] = storage.get("postgres_url") or os.getenv("DATABASE_URL")
+        if not resolved["postgres_url"]:
+            error_msg = "Postgres storage requires storage.postgres_url or DATABASE_URL."
+            raise ValueError(error_msg)
+    return resolved
+
+
+def resolve_scheduler(scheduler: dict[str, Any]) -> dict[str, Any]:
+    """Validate the scheduler section and fill in the Redis URL from REDIS_URL."""
+    scheduler_type = scheduler.get("type", "memory")
+    if scheduler_type not in SCHEDULER_TYPES:
+        error_msg = (
+            f"Unsupported scheduler type '{scheduler_type}'. bindu supports {', '.join(SCHEDULER_TYPES)}; "
+            "use redis for a task queue shared between replicas."
+        )
+        raise ValueError(error_msg)
+
+    resolved = {**scheduler, "type": scheduler_type}
+    if scheduler_type == "redis":
+        resolved["redis_url"] = scheduler.get("redis_url") or os.getenv("REDIS_URL")
+        if not resolved["redis_url"]:
+            error_msg = "Redis scheduler requires scheduler.redis_url or REDIS_URL."
+            raise ValueError(error_msg)
+    return resolved
+
+
+def configure_backends(config: dict[str, Any]) -> dict[str, Any]:
+    """Resolve storage and scheduler, apply Postgres pool settings and return the updated config.
+
+    bindu builds its Postgres connection pool from ``app_settings.storage``, so the
+    pool keys in agent_config.json are copied there before the server starts.
+    """
+    from bindu.settings import app_settings
+
+    storage = resolve_storage(config.get("storage", {}))
+    scheduler = resolve_scheduler(config.get("scheduler", {}))
+
+    if storage["type"] == "postgres":
+        for key, setting in POSTGRES_POOL_SETTINGS.items():
+            if storage.get(key) is not None:
+                setattr(app_settings.storage, setting, storage[key])
+
+    # Replicas only share work when both the queue and the task store are shared
+    if (storage["type"] == "memory") != (scheduler["type"] == "memory"):
+        print(
+            f"⚠️  {storage['type']} storage with a {scheduler['type']} scheduler: "
+            "replicas will not see each other's tasks"
+        )
+
+    print(f"🗄️  Storage: {storage['type']}, scheduler: {scheduler['type']}")
+    return {**config, "storage": storage, "scheduler": scheduler}
@@ -0,0 +1,203 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Batch post generation: many jobs in one request, one research phase per topic."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+from reddit_post_generator.deadlines import Deadline, deadline_scope
+from reddit_post_generator.research import normalize_query
+
+RunFn = Callable[[list[dict[str, str]]], Awaitable[Any]]
+
+
+def _last_user_json(messages: list[dict[str, str]]) -> Any:
+    """Return the latest user message parsed as JSON, or None if it isn't JSON."""
+    user_messages = [m for m in messages if m.get("role") == "user"]
+    if not user_messages:
+        return None
+
+    content = str(user_messages[-1].get("content", "")).strip()
+    if not content.startswith(("{", "[")):
+        return None
+
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        return None
+
+
+def parse_job(messages: list[dict[str, str]]) -> dict[str, Any] | None:
+    """Return the job if the latest user message is a single structured request, else None."""
+    payload = _last_user_json(messages)
+    if isinstance(payload, dict) and payload.get("topic"):
+        return payload
+    return None
+
+
+def parse_timeout(messages: list[dict[str, str]]) -> float | None:
+    """Return the ``timeout_seconds`` a structured request asks for, if any."""
+    payload = _last_user_json(messages)
+    timeout = payload.get("timeout_seconds") if isinstance(payload, dict) else None
+    if isinstance(timeout, int | float) and not isinstance(timeout, bool) and timeout > 0:
+        return float(timeout)
+    return None
+
+
+def parse_dry_run(messages: list[dict[str, str]]) -> bool | None:
+    """Return whether a structured request asks for a draft only, or None if it doesn't say.
+
+    ``"dry_run": true`` and ``"submit": false`` both mean draft only.
+    """
+    payload = _last_user_json(messages)
+    if not isinstance(payload, dict):
+        return None
+    if "dry_run" in payload:
+        return bool(payload["dry_run"])
+    if "submit" in payload:
+        return not payload["submit"]
+    return None
+
+
+def parse_idempotency_key(messages: list[dict[str, str]]) -> str | None:
+    """Return the ``idempotency_key`` a structured request carries, if any."""
+    payload = _last_user_json(messages)
+    key = payload.get("idempotency_key") if isinstance(payload, dict) else None
+    if isinstance(key, str | int) and not isinstance(key, bool) and str(key):
+        return str(key)
+    return None
+
+
+def parse_async_request(messages: list[dict[str, str]]) -> dict[str, Any] | None:
+    """Return the request if it asks to be queued as a job (``"async": true``), else None."""
+    payload = _last_user_json(messages)
+    if isinstance(payload, dict) and payload.get("async") is True:
+        return payload
+    return None
+
+
+def parse_job_query(messages: list[dict[str, str]]) -> dict[str, Any] | None:
+    """Return ``job_id`` and ``wait`` if the request asks about a queued job, else None."""
+    payload = _last_user_json(messages)
+    if not isinstance(payload, dict) or not isinstance(payload.get("job_id"), str) or "topic" in payload:
+        return None
+    return {"job_id": payload["job_id"], "wait": bool(payload.get("wait", False))}
+
+
+def replace_payload(messages: list[dict[str, str]], payload: Any) -> list[dict[str, str]]:
+    """Return a copy of messages with the latest user message's content replaced by ``payload`` as JSON."""
+    replaced = [dict(m) for m in messages]
+    for message in reversed(replaced):
+        if message.get("role") == "user":
+            message["content"] = json.dumps(payload)
+            break
+    return replaced
+
+
+def parse_batch_jobs(messages: list[dict[str, str]]) -> list[dict[str, Any]] | None:
+    """Return the jobs if the latest user message is a batch request, else None.
+
+    A batch is a JSON object with a ``jobs`` list, or a bare JSON list, where each
+    job follows the input structure documented in skill.yaml.
+    """
+    payload = _last_user_json(messages)
+    jobs = payload.get("jobs") if isinstance(payload, dict) else payload
+    if not isinstance(jobs, list) or not all(isinstance(job, dict) and job.get("topic") for job in jobs):
+        return None
+    return jobs
+
+
+def research_prompt(topic: str, keywords: list[str]) -> list[dict[str, str]]:
+    """Build the messages for the shared research phase of one topic."""
+    content = f"RESEARCH ONLY - do not write or submit a Reddit post.\nResearch this topic with web search: {topic}\n"
+    if keywords:
+        content += f"Additional search terms: {', '.join(keywords)}\n"
+    content += "Return a concise list of key findings, each with its source URL."
+    return [{"role": "user", "content": content}]
+
+
+def job_prompt(job: dict[str, Any], research: str | None) -> list[dict[str, str]]:
+    """Build the messages for one subreddit job, reusing the topic's research."""
+    content = f"Create a Reddit post for this request:\n{json.dumps(job, indent=2)}"
+    if research:
+        content += (
+            "\n\nResearch for this topic has already been gathered. Use it instead of "
+            f"searching the web again:\n{research}"
+        )
+    return [{"role": "user", "content": content}]
+
+
+def result_text(result: Any) -> str:
+    """Return the final reply of a run as text: its content, with structured output as JSON."""
+    content = getattr(result, "content", result)
+    if isinstance(content, str):
+        return content
+    # Structured output (output_schema) is a pydantic model, which json.dumps would turn into its repr
+    if hasattr(content, "model_dump_json"):
+        return content.model_dump_json()
+    return json.dumps(content, default=str)
+
+
+async def run_batch(
+    jobs: list[dict[str, Any]],
+    run: RunFn,
+    max_concurrency: int = 3,
+    deadline: Deadline | None = None,
+    research_run: RunFn | None = None,
+) -> AsyncIterator[str]:
+    """Run every job and yield one JSON line per job as soon as it finishes.
+
+    Jobs that share a topic share one research run, made with ``research_run``
+    (``run`` if not given), which should be an agent without posting tools.
+    Research and drafting runs together never exceed ``max_concurrency`` at a
+    time. Every run shares the batch's ``deadline``.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def limited(messages: list[dict[str, str]], runner: RunFn = run) -> Any:
+        async with semaphore:
+            return await runner(messages)
+
+    async def research(topic: str, keywords: list[str]) -> str | None:
+        try:
+            with deadline_scope(deadline.child() if deadline else None):
+                return result_text(await limited(research_prompt(topic, keywords), research_run or run))
+        except Exception as e:
+            # Jobs fall back to researching on their own
+            print(f"⚠️  Shared research for {topic!r} failed: {type(e).__name__}")
+            return None
+
+    # One research task per distinct topic, merging every job's keywords
+    topics: dict[str, tuple[str, list[str]]] = {}
+    for job in jobs:
+        _, keywords = topics.setdefault(normalize_query(job["topic"]), (job["topic"], []))
+        keywords.extend(k for k in job.get("keywords", []) if k not in keywords)
+    research_tasks = {key: asyncio.create_task(research(topic, keywords)) for key, (topic, keywords) in topics.items()}
+
+    async def run_job(index: int, job: dict[str, Any]) -> dict[str, Any]:
+        notes = await research_tasks[normalize_query(job["topic"])]
+        summary = {"job_index": index, "topic": job["topic"], "subreddit": job.get("subreddit")}
+        try:
+            with deadline_scope(deadline.child() if deadline else None):
+                result = await limited(job_prompt(job, notes))
+        except Exception as e:
+            return {**summary, "success": False, "error": f"{type(e).__name__}: {e}"}
+        return {**summary, "success": True, "content": result_text(result)}
+
+    job_tasks = [asyncio.create_task(run_job(index, job)) for index, job in enumerate(jobs)]
+    try:
+        for finished in asyncio.as_completed(job_tasks):
+            yield json.dumps(await finished) + "\n"
+    finally:
+        # Stop outstanding work if the client goes away mid-stream
+        for task in [*job_tasks, *research_tasks.values()]:
+            task.cancel()
@@ -0,0 +1,283 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""In-memory and persistent caches shared by the agent's tools and models."""
+
+import copy
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+DEFAULT_CACHE_PATH = ".cache/reddit_post_generator.sqlite3"
+
+# Default time-to-live per subreddit field; rules and flairs change far less often than stats
+SUBREDDIT_FIELD_TTLS = {
+    "info": 24 * 3600,
+    "rules": 24 * 3600,
+    "flairs": 12 * 3600,
+    "requirements": 24 * 3600,
+    "stats": 3600,
+    "top_posts": 3600,
+}
+
+
+@dataclass
+class CacheStats:
+    """Hit, miss and eviction counters for a cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MemoryCache:
+    """In-process key/value cache with TTL expiry and LRU eviction.
+
+    Has the same interface as SQLiteCache, for callers that don't need entries
+    to survive a restart.
+    """
+
+    def __init__(self, ttl_seconds: float | None = None, max_entries: int | None = None) -> None:
+        """Create an empty cache; ``None`` disables expiry or the size limit."""
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+
+        # Callers may mutate what they get back, so never hand out the stored object
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        """Store value under key, evicting least recently used entries over max_entries."""
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.time() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (copy.deepcopy(value), expires_at)
+            self._entries.move_to_end(key)
+            if self.max_entries is not None:
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        """Remove key from the cache."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of entries, including expired ones not yet evicted."""
+        return len(self._entries)
+
+    def close(self) -> None:
+        """Release cached entries."""
+        self.clear()
+
+
+class SQLiteCache:
+    """Key/value cache with TTL expiry and LRU eviction, persisted in SQLite.
+
+    Several caches can share one database file by using different namespaces.
+    Values are stored as JSON, so anything ``json.dumps`` accepts can be cached.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        namespace: str = "default",
+        ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        """Open (or create) the cache database at ``path``, scoped to ``namespace``."""
+        self.path = Path(path)
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires_at REAL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_entries_lru ON cache_entries (namespace, last_access)")
+
+    @classmethod
+    def from_config(cls, config: dict, namespace: str) -> "SQLiteCache | None":
+        """Build a cache from the ``cache`` section of agent_config.json, or None if disabled."""
+        cache_config = config.get("cache", {})
+        section = cache_config.get(namespace, {})
+        if not section.get("enabled", True):
+            return None
+        return cls(
+            path=cache_config.get("path", DEFAULT_CACHE_PATH),
+            namespace=namespace,
+            ttl_seconds=section.get("ttl_seconds"),
+            max_entries=section.get("max_entries"),
+        )
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+
+            if row is None:
+                self.stats.misses += 1
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+                self.stats.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE cache_entries SET last_access = ? WHERE namespace = ? AND key = ?",
+                (now, self.namespace, key),
+            )
+            self.stats.hits += 1
+
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        """Store value under key, evicting least recently used entries over max_entries."""
+        now = time.time()
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = now + ttl if ttl is not None else None
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value), expires_at, now),
+            )
+            if self.max_entries is not None:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the least recently used ones beyond max_entries."""
+        cursor = self._conn.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at IS NOT NULL AND expires_at <= ?",
+            (self.namespace, time.time()),
+        )
+        self.stats.evictions += max(cursor.rowcount, 0)
+
+        cursor = self._conn.execute(
+            """
+            DELETE FROM cache_entries WHERE namespace = ? AND key IN (
+                SELECT key FROM cache_entries WHERE namespace = ?
+                ORDER BY last_access DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.namespace, self.namespace, self.max_entries),
+        )
+        self.stats.evictions += max(cursor.rowcount, 0)
+
+    def delete(self, key: str) -> None:
+        """Remove key from the cache."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+
+    def clear(self) -> None:
+        """Remove every entry in this cache's namespace."""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
+
+    def __len__(self) -> int:
+        """Return the number of entries in this cache's namespace."""
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?", (self.namespace,)
+            ).fetchone()
+        return count
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Either backend; both expose get/set/delete/clear/stats/close
+Cache = MemoryCache | SQLiteCache
+
+
+def create_cache(config: dict, namespace: str) -> Cache | None:
+    """Build the cache configured under ``cache.<namespace>`` in agent_config.json.
+
+    The section's ``backend`` picks ``"sqlite"`` (default, persistent) or
+    ``"memory"``; ``enabled: false`` disables the cache entirely.
+    """
+    section = config.get("cache", {}).get(namespace, {})
+    if not section.get("enabled", True):
+        return None
+
+    backend = section.get("backend", "sqlite")
+    if backend == "memory":
+        return MemoryCache(ttl_seconds=section.get("ttl_seconds"), max_entries=section.get("max_entries"))
+    if backend == "sqlite":
+        return SQLiteCache.from_config(config, namespace)
+
+    error_msg = f"Unknown cache backend for {namespace!r}: {backend!r} (expected 'sqlite' or 'memory')"
+    raise ValueError(error_msg)
@@ -0,0 +1,202 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Single-flight coalescing of identical requests and idempotent Reddit posting."""
+
+import asyncio
+import contextlib
+import contextvars
+import hashlib
+import inspect
+import json
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from reddit_post_generator.batch import parse_idempotency_key
+from reddit_post_generator.cache import Cache
+from reddit_post_generator.deadlines import current_deadline, enforce
+
+# Tools that create something on Reddit; at most one successful call per request and target
+POSTING_TOOLS = {"create_post"}
+
+# Request fields that don't change what gets generated, so retries differing only in them still match
+UNKEYED_FIELDS = {"idempotency_key", "timeout_seconds"}
+
+# Prefix of keys the client chose; only these are remembered by the post ledger
+IDEMPOTENCY_PREFIX = "idempotency:"
+
+
+def _canonical(content: str) -> Any:
+    text = content.strip()
+    if text.startswith(("{", "[")):
+        with contextlib.suppress(json.JSONDecodeError):
+            payload = json.loads(text)
+            if isinstance(payload, dict):
+                payload = {k: v for k, v in payload.items() if k not in UNKEYED_FIELDS}
+            return payload
+    return " ".join(text.split())
+
+
+def request_key(messages: list[dict[str, str]]) -> str:
+    """Key identical requests share: the client's ``idempotency_key``, else a hash of the messages.
+
+    Whitespace and the key order of JSON payloads don't change the hash.
+    """
+    explicit = parse_idempotency_key(messages)
+    if explicit is not None:
+        return f"{IDEMPOTENCY_PREFIX}{explicit}"
+    canonical = [[m.get("role"), _canonical(str(m.get("content", "")))] for m in messages]
+    digest = hashlib.sha256(json.dumps(canonical, sort_keys=True, default=str).encode()).hexdigest()
+    return f"request:{digest}"
+
+
+_current: contextvars.ContextVar[str | None] = contextvars.ContextVar("request_key", default=None)
+
+
+def current_request_key() -> str | None:
+    """Return the idempotency key of the request being handled, if any."""
+    return _current.get()
+
+
+@contextmanager
+def request_scope(key: str | None) -> Iterator[str | None]:
+    """Make ``key`` the current request key for everything run inside the block."""
+    token = _current.set(key)
+    try:
+        yield key
+    finally:
+        with contextlib.suppress(ValueError):
+            _current.reset(token)
+
+
+@dataclass
+class CoalesceStats:
+    """Counters reported on /metrics."""
+
+    runs: int = 0
+    joined: int = 0
+
+
+class PostLedger:
+    """Posts already made for each request key, kept in a (shared) cache.
+
+    A retried request, even one arriving after the first run finished or failed
+    half-way, gets the earlier post back instead of posting a second time. Only
+    requests with an explicit ``idempotency_key`` are remembered: identical
+    plain requests, like a recurring schedule, are meant to post again.
+    """
+
+    def __init__(self, cache: Cache) -> None:
+        """Keep the ledger in ``cache``, which workers may share."""
+        self.cache = cache
+        self.duplicates = 0
+
+    @staticmethod
+    def _key(scope: str) -> str | None:
+        # Message hashes only coalesce requests in flight; they never block a later post
+        key = current_request_key()
+        return f"{key}:{scope}" if key is not None and key.startswith(IDEMPOTENCY_PREFIX) else None
+
+    def get(self, scope: str) -> str | None:
+        """Return the stored response of the current request's post to ``scope``, if it already posted."""
+        key = self._key(scope)
+        previous = self.cache.get(key) if key is not None else None
+        if previous is not None:
+            self.duplicates += 1
+        return previous
+
+    def record(self, scope: str, response: Any) -> None:
+        """Remember a successful post's response for the current request."""
+        key = self._key(scope)
+        if key is None or not isinstance(response, str):
+            return
+        # Failures come back as plain strings or JSON errors and may be retried
+        try:
+            payload = json.loads(response)
+        except json.JSONDecodeError:
+            return
+        if isinstance(payload, dict) and not payload.get("error"):
+            self.cache.set(key, response)
+
+    async def _record_when_done(self, scope: str, awaitable: Awaitable[Any]) -> Any:
+        response = await awaitable
+        self.record(scope, response)
+        return response
+
+    def tool_hook(self, function_name: str, function_call: Callable, arguments: dict[str, Any]) -> Any:
+        """Make posting tools idempotent per request and subreddit (an agno tool hook)."""
+        if function_name not in POSTING_TOOLS:
+            return function_call(**arguments)
+        scope = f"{function_name}:{str(arguments.get('subreddit', '')).lower()}"
+        previous = self.get(scope)
+        if previous is not None:
+            return previous
+
+        response = function_call(**arguments)
+        if asyncio.iscoroutine(response) or asyncio.isfuture(response):
+            return self._record_when_done(scope, response)
+        self.record(scope, response)
+        return response
+
+    async def async_tool_hook(self, function_name: str, function_call: Callable, arguments: dict[str, Any]) -> Any:
+        """:meth:`tool_hook` for async runs, where agno only awaits hooks that are coroutine functions."""
+        response = self.tool_hook(function_name, function_call, arguments)
+        return await response if inspect.isawaitable(response) else response
+
+
+class RequestCoalescer:
+    """Runs concurrent identical requests once and hands every caller the same result.
+
+    The first request for a key starts the run; identical requests arriving while
+    it is in flight wait for it instead of starting their own. Each caller still
+    stops waiting at its own deadline, and the run is cancelled only once every
+    caller has gone away.
+    """
+
+    def __init__(self) -> None:
+        """Start with no requests in flight."""
+        self.stats = CoalesceStats()
+        self._in_flight: dict[str, asyncio.Task[Any]] = {}
+        self._waiters: dict[str, int] = {}
+
+    @classmethod
+    def from_config(cls, config: dict) -> "RequestCoalescer | None":
+        """Build a coalescer from the ``coalescing`` section of agent_config.json, or None if disabled."""
+        if not config.get("coalescing", {}).get("enabled", True):
+            return None
+        return cls()
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the result of ``factory()``, shared with every identical request in flight."""
+        task = self._in_flight.get(key)
+        leader = task is None
+        if task is None:
+            self.stats.runs += 1
+            with request_scope(key):
+                task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.stats.joined += 1
+
+        # Shield so one caller timing out or disconnecting doesn't cancel the others' run
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            # The run already enforces the first caller's deadline; later callers may have less time left
+            async with enforce(None if leader else current_deadline(), "Request"):
+                result = await asyncio.shield(task)
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+                if not task.done():
+                    task.cancel()
+        return result
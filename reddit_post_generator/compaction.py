@@ -0,0 +1,207 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Shrink tool results to a token budget before they are added to the model's context."""
+
+import asyncio
+import inspect
+import json
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from reddit_post_generator.history import estimate_tokens
+
+# Fields the agent never uses; the subreddit description is the full sidebar markdown
+DEFAULT_DROPPED_FIELDS = {
+    "get_subreddit_info": ["description", "created_utc", "url"],
+    "get_subreddit_stats": ["description", "created_utc"],
+    "get_subreddit_rules": ["violation_reason"],
+    "get_top_posts": ["subreddit", "subreddit_name_prefixed", "created_utc"],
+    "research_topic": ["hits", "score"],
+    "search_news": ["image"],
+}
+
+# Strings are never shortened below this many characters; lists lose items instead
+MIN_STRING_CHARS = 80
+
+_ELLIPSIS = "…"
+
+
+def _drop(value: Any, fields: set[str]) -> Any:
+    """Remove unused fields and empty values at every level."""
+    if isinstance(value, dict):
+        kept = {key: _drop(item, fields) for key, item in value.items() if key not in fields}
+        return {key: item for key, item in kept.items() if item not in (None, "", [], {})}
+    if isinstance(value, list):
+        return [_drop(item, fields) for item in value]
+    return value
+
+
+def _cap_strings(value: Any, max_chars: int) -> Any:
+    if isinstance(value, str):
+        return value if len(value) <= max_chars else value[:max_chars].rstrip() + _ELLIPSIS
+    if isinstance(value, dict):
+        return {key: _cap_strings(item, max_chars) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_cap_strings(item, max_chars) for item in value]
+    return value
+
+
+def _cap_lists(value: Any, max_items: int) -> Any:
+    if isinstance(value, dict):
+        return {key: _cap_lists(item, max_items) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_cap_lists(item, max_items) for item in value[:max_items]]
+    return value
+
+
+def _longest(value: Any, kind: type) -> int:
+    """Length of the longest string or list anywhere in value."""
+    if isinstance(value, dict):
+        return max((_longest(item, kind) for item in value.values()), default=0)
+    if isinstance(value, list):
+        own = len(value) if kind is list else 0
+        return max([own, *(_longest(item, kind) for item in value)])
+    return len(value) if isinstance(value, kind) else 0
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _largest_fitting(value: Any, shrink: Callable[[Any, int], Any], low: int, high: int, max_chars: int) -> int:
+    """Largest limit in [low, high] for which ``shrink(value, limit)`` fits max_chars, else low."""
+    while low < high:
+        middle = (low + high + 1) // 2
+        if len(_dumps(shrink(value, middle))) <= max_chars:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def fit_json(value: Any, max_chars: int, min_string_chars: int = MIN_STRING_CHARS) -> str:
+    """Serialize value compactly within max_chars.
+
+    Long strings are shortened first, all to the same length, then lists keep
+    only their first items; every item keeps its keys, so the result stays
+    valid JSON in the tool's own shape.
+    """
+    text = _dumps(value)
+    if len(text) <= max_chars:
+        return text
+
+    longest_string = _longest(value, str)
+    if longest_string > min_string_chars:
+        limit = _largest_fitting(value, _cap_strings, min_string_chars, longest_string, max_chars)
+        value = _cap_strings(value, limit)
+        text = _dumps(value)
+        if len(text) <= max_chars:
+            return text
+
+    longest_list = _longest(value, list)
+    if longest_list > 1:
+        value = _cap_lists(value, _largest_fitting(value, _cap_lists, 1, longest_list, max_chars))
+        text = _dumps(value)
+    # A single item can still be too big; then the budget wins over valid JSON
+    return text if len(text) <= max_chars else text[:max_chars].rstrip() + _ELLIPSIS
+
+
+@dataclass
+class CompactionStats:
+    """Tool output token accounting, reported on /metrics."""
+
+    calls: int = 0
+    original_tokens: int = 0
+    sent_tokens: int = 0
+    truncated: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        """Tokens kept out of the context by compaction."""
+        return self.original_tokens - self.sent_tokens
+
+
+class ToolOutputCompactor:
+    """Strips unused fields from tool JSON and fits each result into a token budget.
+
+    Tool results stay in the context for every later model turn of a run, so
+    raw search and subreddit payloads are usually the largest part of each
+    prompt. Errors and other plain-text results are only cut to the budget.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 1000,
+        tool_tokens: dict[str, int] | None = None,
+        dropped_fields: dict[str, list[str]] | None = None,
+        min_string_chars: int = MIN_STRING_CHARS,
+    ) -> None:
+        """Cap tool results at ``max_tokens``, or their ``tool_tokens`` override, dropping ``dropped_fields``."""
+        self.max_tokens = max_tokens
+        self.tool_tokens = tool_tokens or {}
+        self.dropped_fields = {**DEFAULT_DROPPED_FIELDS, **(dropped_fields or {})}
+        self.min_string_chars = min_string_chars
+        self.stats = CompactionStats()
+
+    @classmethod
+    def from_config(cls, config: dict) -> "ToolOutputCompactor | None":
+        """Build a compactor from the ``compaction`` section of agent_config.json, or None if disabled."""
+        section = config.get("compaction", {})
+        if not section.get("enabled", True):
+            return None
+        return cls(
+            max_tokens=section.get("tool_tokens", 1000),
+            tool_tokens=section.get("tool_token_overrides"),
+            dropped_fields=section.get("dropped_fields"),
+            min_string_chars=section.get("min_string_chars", MIN_STRING_CHARS),
+        )
+
+    def compact(self, function_name: str, result: Any) -> Any:
+        """Return the compact form of one tool result."""
+        if not isinstance(result, str):
+            return result
+
+        # Budgets are in estimated tokens, about four characters each
+        max_chars = self.tool_tokens.get(function_name, self.max_tokens) * 4
+        text = result.strip()
+        try:
+            payload = json.loads(text) if text.startswith(("{", "[")) else None
+        except json.JSONDecodeError:
+            payload = None
+
+        if payload is not None:
+            payload = _drop(payload, set(self.dropped_fields.get(function_name, [])))
+            truncated = len(_dumps(payload)) > max_chars
+            compacted = fit_json(payload, max_chars, self.min_string_chars)
+        else:
+            truncated = len(text) > max_chars
+            compacted = text[:max_chars].rstrip() + _ELLIPSIS if truncated else text
+
+        self.stats.calls += 1
+        self.stats.original_tokens += estimate_tokens(result)
+        self.stats.sent_tokens += estimate_tokens(compacted)
+        self.stats.truncated += truncated
+        return compacted
+
+    async def _compact_when_done(self, function_name: str, awaitable: Awaitable[Any]) -> Any:
+        return self.compact(function_name, await awaitable)
+
+    def tool_hook(self, function_name: str, function_call: Callable, arguments: dict[str, Any]) -> Any:
+        """Compact every tool result (an agno tool hook); it must come first so it sees the final result."""
+        result = function_call(**arguments)
+        if asyncio.iscoroutine(result) or asyncio.isfuture(result):
+            return self._compact_when_done(function_name, result)
+        return self.compact(function_name, result)
+
+    async def async_tool_hook(self, function_name: str, function_call: Callable, arguments: dict[str, Any]) -> Any:
+        """:meth:`tool_hook` for async runs, where agno only awaits hooks that are coroutine functions."""
+        result = self.tool_hook(function_name, function_call, arguments)
+        return await result if inspect.isawaitable(result) else result
@@ -0,0 +1,233 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Per-request deadlines propagated to every tool and model call."""
+
+import asyncio
+import contextlib
+import contextvars
+import inspect
+import json
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any
+
+# Writes are never abandoned mid-flight: the model would retry and could post twice
+UNINTERRUPTIBLE_TOOLS = {"create_post"}
+
+# Tools whose output is worth returning when a run is cut short
+FINDING_TOOLS = {"research_topic", "web_search", "search_news", "read_page"}
+
+PARTIAL_RESEARCH_HEADER = "Research was cut short by the request deadline. Findings so far:"
+
+# Sync tools run here so a hung DuckDuckGo or PRAW call can be given up on
+TOOL_WORKERS = 16
+_tool_executor = ThreadPoolExecutor(max_workers=TOOL_WORKERS, thread_name_prefix="tool")
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when a request, or one of its phases, runs out of time."""
+
+
+class Deadline:
+    """Time budget for one request, with caps for each tool and model call.
+
+    Tool and model calls get ``min(cap, remaining)``, so no single call can run
+    past the request's deadline. Results of research tools are kept in
+    ``findings`` so a run cut short can still return what it found.
+    """
+
+    def __init__(
+        self,
+        seconds: float,
+        tool_seconds: float | None = None,
+        model_seconds: float | None = None,
+        research_share: float = 0.5,
+        expires_at: float | None = None,
+    ) -> None:
+        """Allow ``seconds`` from now, or until the monotonic time ``expires_at`` if given."""
+        self.seconds = seconds
+        self.tool_seconds = tool_seconds
+        self.model_seconds = model_seconds
+        self.research_share = research_share
+        self.expires_at = expires_at if expires_at is not None else time.monotonic() + seconds
+        self.findings: list[tuple[str, str]] = []
+
+    @classmethod
+    def from_config(cls, config: dict, requested_seconds: float | None = None) -> "Deadline | None":
+        """Build a deadline from the ``deadlines`` section of agent_config.json, or None if disabled.
+
+        A ``timeout_seconds`` from the request payload replaces ``request_seconds``
+        but can't exceed ``max_request_seconds``.
+        """
+        section = config.get("deadlines", {})
+        if not section.get("enabled", True):
+            return None
+        seconds = requested_seconds or section.get("request_seconds", 180)
+        seconds = min(seconds, section.get("max_request_seconds", 600))
+        return cls(
+            seconds,
+            tool_seconds=section.get("tool_seconds", 30),
+            model_seconds=section.get("model_seconds", 90),
+            research_share=section.get("research_share", 0.5),
+        )
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """True once the deadline has passed."""
+        return self.remaining() <= 0
+
+    def budget(self, cap: float | None) -> float:
+        """Seconds one call may take: its cap, or less if the request has less left."""
+        return self.remaining() if cap is None else min(cap, self.remaining())
+
+    def child(self, share: float = 1.0) -> "Deadline":
+        """Return a sub-deadline for one phase or job, with a share of the remaining time and its own findings."""
+        seconds = self.remaining() * share
+        return Deadline(
+            seconds,
+            tool_seconds=self.tool_seconds,
+            model_seconds=self.model_seconds,
+            research_share=self.research_share,
+            expires_at=time.monotonic() + seconds,
+        )
+
+    def record(self, tool: str, result: Any) -> None:
+        """Keep a research tool's output in case the run is cut short."""
+        if tool in FINDING_TOOLS and isinstance(result, str) and not result.startswith("Error"):
+            self.findings.append((tool, result))
+
+
+_current: contextvars.ContextVar[Deadline | None] = contextvars.ContextVar("deadline", default=None)
+
+
+def current_deadline() -> Deadline | None:
+    """Return the deadline of the request being handled, if any."""
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Deadline | None) -> Iterator[Deadline | None]:
+    """Make ``deadline`` the current deadline for everything run inside the block."""
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        # An abandoned stream is closed from another task's context
+        with contextlib.suppress(ValueError):
+            _current.reset(token)
+
+
+@asynccontextmanager
+async def enforce(deadline: Deadline | None, what: str) -> AsyncIterator[None]:
+    """Cancel the block when ``deadline`` passes, raising DeadlineExceededError."""
+    if deadline is None:
+        yield
+        return
+    try:
+        async with asyncio.timeout(deadline.remaining()):
+            yield
+    except TimeoutError as e:
+        if not deadline.expired:
+            # A call inside timed out on its own budget, not the request's
+            raise
+        error_msg = f"{what} exceeded its {deadline.seconds:g}s deadline"
+        raise DeadlineExceededError(error_msg) from e
+
+
+def _timed_out(function_name: str, seconds: float) -> str:
+    return f"Error: {function_name} timed out after {seconds:.0f}s; continue with the information you already have"
+
+
+async def _await_tool(function_name: str, awaitable: Any, deadline: Deadline, budget: float) -> Any:
+    try:
+        result = await asyncio.wait_for(awaitable, timeout=budget)
+    except TimeoutError:
+        return _timed_out(function_name, budget)
+    deadline.record(function_name, result)
+    return result
+
+
+def deadline_tool_hook(function_name: str, function_call: Callable, arguments: dict[str, Any]) -> Any:
+    """Bound every tool call by the current request's deadline (an agno tool hook).
+
+    Calls that run out of budget return an error string, so the model moves on with
+    what it already has instead of the whole run failing.
+    """
+    deadline = current_deadline()
+    if deadline is None:
+        return function_call(**arguments)
+    if deadline.expired:
+        return f"Error: no time left to call {function_name}; finish with the information you already have"
+    if function_name in UNINTERRUPTIBLE_TOOLS:
+        return function_call(**arguments)
+
+    budget = deadline.budget(deadline.tool_seconds)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # Sync tools run on a worker thread (agno's own, in async runs); give up waiting after the budget
+        future = _tool_executor.submit(contextvars.copy_context().run, function_call, **arguments)
+        try:
+            result = future.result(timeout=budget)
+        except TimeoutError:
+            return _timed_out(function_name, budget)
+        deadline.record(function_name, result)
+        return result
+
+    # On the event loop agno hands hooks a coroutine that hasn't started yet
+    result = function_call(**arguments)
+    if asyncio.iscoroutine(result) or asyncio.isfuture(result):
+        return _await_tool(function_name, result, deadline, budget)
+    deadline.record(function_name, result)
+    return result
+
+
+async def async_deadline_tool_hook(function_name: str, function_call: Callable, arguments: dict[str, Any]) -> Any:
+    """Bound every tool call by the current request's deadline in async runs (an async agno tool hook)."""
+    result = deadline_tool_hook(function_name, function_call, arguments)
+    return await result if inspect.isawaitable(result) else result
+
+
+def _finding_lines(tool: str, result: str) -> list[str]:
+    try:
+        payload = json.loads(result)
+    except json.JSONDecodeError:
+        return [f"- {' '.join(result.split())[:300]}"]
+
+    if tool == "read_page" and isinstance(payload, dict):
+        return [
+            f"- {payload.get('title', '')}: {' '.join(str(payload.get('text', '')).split())[:300]} ({payload.get('url')})"
+        ]
+    items = payload.get("sources", []) if isinstance(payload, dict) else payload
+    lines = []
+    for item in items if isinstance(items, list) else []:
+        if isinstance(item, dict):
+            url = item.get("url") or item.get("href")
+            snippet = item.get("snippet") or item.get("body") or ""
+            lines.append(f"- {item.get('title', '')}: {snippet} ({url})")
+    return lines
+
+
+def summarize_findings(findings: list[tuple[str, str]], max_items: int = 10) -> str:
+    """Turn research tool output gathered so far into notes, or "" if there is none."""
+    lines: list[str] = []
+    for tool, result in findings:
+        for line in _finding_lines(tool, result):
+            if line not in lines:
+                lines.append(line)
+    if not lines:
+        return ""
+    return "\n".join([PARTIAL_RESEARCH_HEADER, *lines[:max_items]])
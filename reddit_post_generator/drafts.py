@@ -0,0 +1,59 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Draft-only (dry-run) requests: structured drafts for review, never posted."""
+
+from typing import Any
+
+from pydantic import Field
+
+from reddit_post_generator.pipeline import PostDraft
+
+
+class DraftReport(PostDraft):
+    """Structured output of the draft-only agent."""
+
+    subreddit: str = Field(..., description="Target subreddit, without the r/ prefix")
+    key_findings: list[str] = Field(default_factory=list, description="Up to five key findings from the research")
+    sources: list[str] = Field(default_factory=list, description="URLs of the sources the post is based on")
+    rule_warnings: list[str] = Field(
+        default_factory=list, description="Subreddit rules the draft may break, for the reviewer to check"
+    )
+
+
+def draft_report(result: Any, query: str, processing_time_ms: int) -> dict[str, Any]:
+    """Shape a draft-only run's result like skill.yaml's ``output_format``."""
+    content = getattr(result, "content", result)
+    metadata = {"query": query, "processing_time_ms": processing_time_ms, "post_status": "draft", "dry_run": True}
+    if isinstance(content, dict):
+        content = DraftReport.model_validate(content)
+    if not isinstance(content, DraftReport):
+        # e.g. a run cut short by its deadline returns plain text
+        return {"success": False, "error": {"stage": "draft", "message": str(content)}, "metadata": metadata}
+
+    return {
+        "success": True,
+        "post_details": {
+            "subreddit": content.subreddit,
+            "title": content.title,
+            "content": content.content,
+            "flair": content.flair,
+            "post_length": len(content.content),
+        },
+        "research_summary": {
+            "sources_used": len(set(content.sources)),
+            "key_findings": content.key_findings[:5],
+            "sources": content.sources,
+        },
+        "compliance_check": {
+            "subreddit_rules_passed": not content.rule_warnings,
+            "warnings": content.rule_warnings,
+        },
+        "metadata": metadata,
+    }
@@ -0,0 +1,137 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Compact conversation history so earlier runs don't resend full transcripts."""
+
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+# Tool results are replayed by some clients; the model never needs them again
+TOOL_ROLES = ("tool", "function")
+
+_CODE_BLOCK_RE = re.compile(r"```.*?```", re.DOTALL)
+_URL_RE = re.compile(r"https?://\S+")
+_PERMALINK_RE = re.compile(r"https?://(?:www\.)?reddit\.com/r/\S+/comments/\S+")
+_REPORT_FIELD_RE = re.compile(r"\*\*(Subreddit|Title|Status):\*\*\s*(.+)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return (len(text) + 3) // 4
+
+
+def message_tokens(messages: list[dict[str, Any]]) -> int:
+    """Estimated prompt tokens for a list of chat messages."""
+    return sum(estimate_tokens(str(message.get("content") or "")) for message in messages)
+
+
+@dataclass
+class HistoryStats:
+    """Token accounting across every compacted request."""
+
+    requests: int = 0
+    original_tokens: int = 0
+    sent_tokens: int = 0
+    evicted_messages: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        """Estimated tokens of history that were summarized or dropped instead of sent."""
+        return self.original_tokens - self.sent_tokens
+
+
+class HistoryManager:
+    """Replace earlier turns with short summaries and keep history within a token budget.
+
+    The latest user message and any system messages are always sent unchanged.
+    Earlier turns lose tool payloads, code blocks and links, the generator's
+    reports are reduced to their subreddit, title, status and permalink, and the
+    oldest turns are dropped first once ``max_turns`` or ``max_tokens`` is hit.
+    """
+
+    def __init__(
+        self, max_turns: int = 5, max_tokens: int = 3000, summary_chars: int = 300, max_summaries: int = 1024
+    ) -> None:
+        """Keep at most ``max_turns`` earlier turns within ``max_tokens``, each summary cut to ``summary_chars``."""
+        self.max_turns = max_turns
+        self.max_tokens = max_tokens
+        self.summary_chars = summary_chars
+        self.max_summaries = max_summaries
+        self.stats = HistoryStats()
+        # Clients replay the same earlier turns on every request, so summaries are kept
+        self._summaries: OrderedDict[str, str] = OrderedDict()
+
+    @classmethod
+    def from_config(cls, config: dict) -> "HistoryManager | None":
+        """Build a manager from the ``history`` section of agent_config.json, or None if disabled."""
+        history_config = config.get("history", {})
+        if not history_config.get("enabled", True):
+            return None
+        return cls(
+            max_turns=history_config.get("max_turns", 5),
+            max_tokens=history_config.get("max_tokens", 3000),
+            summary_chars=history_config.get("summary_chars", 300),
+        )
+
+    def summarize(self, message: dict[str, Any]) -> str:
+        """Return the compact form of one earlier message."""
+        content = str(message.get("content") or "")
+        key = hashlib.sha256(f"{message.get('role')}\0{content}".encode()).hexdigest()
+        summary = self._summaries.get(key)
+        if summary is not None:
+            self._summaries.move_to_end(key)
+            return summary
+
+        fields = _REPORT_FIELD_RE.findall(content) if message.get("role") == "assistant" else []
+        if fields:
+            parts = [f"{name}: {value.strip()}" for name, value in fields]
+            permalink = _PERMALINK_RE.search(content)
+            if permalink:
+                parts.append(permalink.group(0).rstrip(").,"))
+            summary = "Earlier post - " + " | ".join(parts)
+        else:
+            text = _URL_RE.sub("", _CODE_BLOCK_RE.sub("", content))
+            summary = _WHITESPACE_RE.sub(" ", text).strip()
+        if len(summary) > self.summary_chars:
+            summary = summary[: self.summary_chars].rstrip() + "…"
+
+        self._summaries[key] = summary
+        if len(self._summaries) > self.max_summaries:
+            self._summaries.popitem(last=False)
+        return summary
+
+    def compact(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return messages with earlier turns summarized and the oldest evicted first."""
+        if not messages:
+            return messages
+
+        *earlier, latest = messages
+        system = [message for message in earlier if message.get("role") == "system"]
+        history = [
+            {"role": message["role"], "content": self.summarize(message)}
+            for message in earlier
+            if message.get("role") not in ("system", *TOOL_ROLES) and message.get("content")
+        ]
+
+        # A turn is one user message plus the reply to it
+        kept = history[-self.max_turns * 2 :] if self.max_turns > 0 else []
+        budget = self.max_tokens - message_tokens([*system, latest])
+        while kept and message_tokens(kept) > budget:
+            kept.pop(0)
+
+        compacted = [*system, *kept, latest]
+        self.stats.requests += 1
+        self.stats.original_tokens += message_tokens(messages)
+        self.stats.sent_tokens += message_tokens(compacted)
+        self.stats.evicted_messages += len(earlier) - len(system) - len(kept)
+        return compacted
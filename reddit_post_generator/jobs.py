@@ -0,0 +1,427 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Durable job queue: submit a generation, get a job id at once, poll or wait for the result."""
+
+import asyncio
+import contextlib
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from reddit_post_generator.batch import replace_payload
+from reddit_post_generator.cache import DEFAULT_CACHE_PATH
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+FINISHED = (SUCCEEDED, FAILED)
+
+# Fields that only control queueing and are dropped before the job runs
+QUEUE_FIELDS = {"async", "priority"}
+
+RunFn = Callable[[list[dict[str, str]]], Awaitable[Any]]
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when a job is submitted while ``max_queued`` jobs are already waiting."""
+
+
+def _timestamp(seconds: float) -> str:
+    return datetime.fromtimestamp(seconds, UTC).isoformat()
+
+
+def job_result(result: Any) -> Any:
+    """Return a run's reply as JSON-serializable data, parsing replies that are themselves JSON."""
+    content = getattr(result, "content", result)
+    if isinstance(content, list):
+        return [job_result(item) for item in content]
+    if isinstance(content, str):
+        text = content.strip()
+        if text.startswith(("{", "[")):
+            with contextlib.suppress(json.JSONDecodeError):
+                return json.loads(text)
+        return content
+    return json.loads(json.dumps(content, default=str))
+
+
+@dataclass
+class Job:
+    """One queued generation and where it is."""
+
+    id: str
+    messages: list[dict[str, str]]
+    priority: int
+    status: str
+    attempts: int
+    max_attempts: int
+    created_at: float
+    updated_at: float
+    result: Any = None
+    error: str | None = None
+    position: int | None = None
+
+    def report(self) -> dict[str, Any]:
+        """Return what a client polling this job gets back."""
+        report: dict[str, Any] = {
+            "job_id": self.id,
+            "status": self.status,
+            "priority": self.priority,
+            "attempts": self.attempts,
+            "created_at": _timestamp(self.created_at),
+            "updated_at": _timestamp(self.updated_at),
+        }
+        if self.position is not None:
+            report["position"] = self.position
+        if self.status == SUCCEEDED:
+            report["result"] = self.result
+        if self.error is not None:
+            report["error"] = self.error
+        return report
+
+
+@dataclass
+class JobStats:
+    """Counters reported on /metrics."""
+
+    submitted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    retried: int = 0
+
+
+class JobStore:
+    """Jobs persisted in SQLite, so queued work survives restarts and is shared by every worker process.
+
+    A claimed job is leased for ``lease_seconds``; if its worker dies, the job is
+    claimed again once the lease runs out.
+    """
+
+    _COLUMNS = "id, messages, priority, status, attempts, max_attempts, created_at, updated_at, result, error"
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE_PATH) -> None:
+        """Open, or create, the job tables in the SQLite file at ``path``."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                messages TEXT NOT NULL,
+                priority INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                max_attempts INTEGER NOT NULL,
+                available_at REAL NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                result TEXT,
+                error TEXT
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_ready ON jobs (status, priority, created_at)")
+
+    def _job(self, row: tuple) -> Job:
+        job_id, messages, priority, status, attempts, max_attempts, created_at, updated_at, result, error = row
+        return Job(
+            id=job_id,
+            messages=json.loads(messages),
+            priority=priority,
+            status=status,
+            attempts=attempts,
+            max_attempts=max_attempts,
+            created_at=created_at,
+            updated_at=updated_at,
+            result=json.loads(result) if result is not None else None,
+            error=error,
+        )
+
+    def add(self, job_id: str, messages: list[dict[str, str]], priority: int, max_attempts: int) -> Job:
+        """Queue a new job."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, messages, priority, status, attempts, max_attempts, available_at, "
+                "created_at, updated_at) VALUES (?, ?, ?, ?, 0, ?, ?, ?, ?)",
+                (job_id, json.dumps(messages), priority, QUEUED, max_attempts, now, now, now),
+            )
+        return Job(job_id, messages, priority, QUEUED, 0, max_attempts, now, now)
+
+    def get(self, job_id: str) -> Job | None:
+        """Return a job with its queue position while it waits, or None if unknown."""
+        with self._lock:
+            row = self._conn.execute(f"SELECT {self._COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()  # noqa: S608
+            if row is None:
+                return None
+            job = self._job(row)
+            if job.status == QUEUED:
+                # Jobs ahead of this one: higher priority, or the same priority and older
+                (job.position,) = self._conn.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE status = ? AND "
+                    "(priority > ? OR (priority = ? AND created_at < ?))",
+                    (QUEUED, job.priority, job.priority, job.created_at),
+                ).fetchone()
+        return job
+
+    def claim(self, lease_seconds: float) -> Job | None:
+        """Take the most urgent ready job, or one whose worker's lease ran out, and mark it running."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Jobs whose worker died on their last attempt are not run again
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, updated_at = ? "
+                    "WHERE status = ? AND available_at <= ? AND attempts >= max_attempts",
+                    (FAILED, "Worker stopped during the last attempt", now, RUNNING, now),
+                )
+                row = self._conn.execute(
+                    f"SELECT {self._COLUMNS} FROM jobs WHERE status IN (?, ?) AND available_at <= ? "  # noqa: S608
+                    "ORDER BY priority DESC, created_at LIMIT 1",
+                    (QUEUED, RUNNING, now),
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = ?, attempts = attempts + 1, available_at = ?, updated_at = ? "
+                        "WHERE id = ?",
+                        (RUNNING, now + lease_seconds, now, row[0]),
+                    )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+        if row is None:
+            return None
+        job = self._job(row)
+        job.status, job.attempts, job.updated_at = RUNNING, job.attempts + 1, now
+        return job
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        fields["updated_at"] = time.time()
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self._conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id))  # noqa: S608
+
+    def complete(self, job_id: str, result: Any) -> None:
+        """Store a finished job's result."""
+        self._update(job_id, status=SUCCEEDED, result=json.dumps(result), error=None)
+
+    def retry(self, job_id: str, error: str, delay: float) -> None:
+        """Put a failed attempt back in the queue, to be claimed again after ``delay`` seconds."""
+        self._update(job_id, status=QUEUED, error=error, available_at=time.time() + delay)
+
+    def fail(self, job_id: str, error: str) -> None:
+        """Give up on a job."""
+        self._update(job_id, status=FAILED, error=error)
+
+    def release(self, job_id: str) -> None:
+        """Return a job interrupted by shutdown to the queue without counting the attempt."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, attempts = MAX(attempts - 1, 0), available_at = ?, updated_at = ? "
+                "WHERE id = ? AND status = ?",
+                (QUEUED, time.time(), time.time(), job_id, RUNNING),
+            )
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of jobs per status."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return dict.fromkeys((QUEUED, RUNNING, *FINISHED), 0) | dict(rows)
+
+    def prune(self, ttl_seconds: float) -> int:
+        """Delete finished jobs last updated more than ``ttl_seconds`` ago."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at <= ?",
+                (*FINISHED, time.time() - ttl_seconds),
+            )
+        return max(cursor.rowcount, 0)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class JobQueue:
+    """Drains the job store with a fixed number of concurrent runners.
+
+    Jobs run highest ``priority`` first. A failed attempt is retried after
+    ``retry_backoff`` seconds, doubling each time, until ``max_attempts``. Every
+    job carries an ``idempotency_key`` (its own id unless the client sent one),
+    so a retry never posts to Reddit twice.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        run: RunFn,
+        concurrency: int = 2,
+        max_attempts: int = 3,
+        retry_backoff: float = 30.0,
+        lease_seconds: float = 900.0,
+        poll_interval: float = 1.0,
+        max_queued: int | None = None,
+        result_ttl: float | None = None,
+    ) -> None:
+        """Run queued jobs with ``run``, retrying failures up to ``max_attempts`` times."""
+        if concurrency < 1:
+            error_msg = f"Job queue concurrency must be at least 1, got {concurrency}"
+            raise ValueError(error_msg)
+
+        self.store = store
+        self.run = run
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.max_queued = max_queued
+        self.result_ttl = result_ttl
+        self.stats = JobStats()
+        self._runners: list[asyncio.Task[None]] = []
+        self._wakeup = asyncio.Event()
+
+    @classmethod
+    def from_config(cls, run: RunFn, config: dict) -> "JobQueue | None":
+        """Build a queue from the ``jobs`` section of agent_config.json, or None if disabled."""
+        jobs_config = config.get("jobs", {})
+        if not jobs_config.get("enabled", True):
+            return None
+        return cls(
+            JobStore(jobs_config.get("path") or config.get("cache", {}).get("path", DEFAULT_CACHE_PATH)),
+            run,
+            concurrency=jobs_config.get("concurrency", 2),
+            max_attempts=jobs_config.get("max_attempts", 3),
+            retry_backoff=jobs_config.get("retry_backoff_seconds", 30.0),
+            lease_seconds=jobs_config.get("lease_seconds", 900.0),
+            poll_interval=jobs_config.get("poll_interval_seconds", 1.0),
+            max_queued=jobs_config.get("max_queued"),
+            result_ttl=jobs_config.get("result_ttl_seconds"),
+        )
+
+    def start(self) -> None:
+        """Start runners on the running event loop until ``concurrency`` of them are alive."""
+        alive = [runner for runner in self._runners if not runner.done()]
+        if len(alive) == self.concurrency:
+            return
+        for runner in self._runners:
+            if runner.done() and not runner.cancelled() and runner.exception() is not None:
+                print(f"⚠️  Job runner stopped: {type(runner.exception()).__name__}: {runner.exception()}")
+        if not alive:
+            # Runners started in another loop (e.g. by warm-up) died with it
+            self._wakeup = asyncio.Event()
+        self._runners = alive + [asyncio.create_task(self._drain()) for _ in range(self.concurrency - len(alive))]
+
+    async def stop(self) -> None:
+        """Cancel the runners; jobs they were running go back to the queue."""
+        for runner in self._runners:
+            runner.cancel()
+        await asyncio.gather(*self._runners, return_exceptions=True)
+        self._runners = []
+
+    def submit(self, messages: list[dict[str, str]], request: dict[str, Any]) -> Job:
+        """Queue the request in ``messages`` (its payload is ``request``) and return the new job."""
+        priority = request.get("priority", 0)
+        if not isinstance(priority, int) or isinstance(priority, bool):
+            error_msg = f"priority must be an integer, got {priority!r}"
+            raise TypeError(error_msg)
+        if self.max_queued is not None and self.store.counts()[QUEUED] >= self.max_queued:
+            error_msg = f"{self.max_queued} jobs are already queued; try again later"
+            raise JobQueueFullError(error_msg)
+        if self.result_ttl is not None:
+            self.store.prune(self.result_ttl)
+
+        job_id = uuid.uuid4().hex
+        payload = {k: v for k, v in request.items() if k not in QUEUE_FIELDS}
+        payload.setdefault("idempotency_key", f"job:{job_id}")
+        job = self.store.add(job_id, replace_payload(messages, payload), priority, self.max_attempts)
+        self.stats.submitted += 1
+        self._wakeup.set()
+        return job
+
+    def status(self, job_id: str) -> dict[str, Any]:
+        """Return the poll reply for a job."""
+        job = self.store.get(job_id)
+        if job is None:
+            error_msg = f"Unknown job {job_id!r}"
+            raise ValueError(error_msg)
+        return job.report()
+
+    async def watch(self, job_id: str) -> AsyncIterator[str]:
+        """Yield the job's status as a JSON line each time it changes, until it finishes."""
+        last = None
+        while True:
+            report = self.status(job_id)
+            current = (report["status"], report["attempts"], report.get("position"))
+            if current != last:
+                yield json.dumps(report, default=str) + "\n"
+                last = current
+            if report["status"] in FINISHED:
+                return
+            await asyncio.sleep(self.poll_interval)
+
+    async def _drain(self) -> None:
+        while True:
+            try:
+                job = self.store.claim(self.lease_seconds)
+            except sqlite3.Error as e:
+                # e.g. "database is locked" while other workers hold the queue; try again shortly
+                print(f"⚠️  Claiming a job failed ({type(e).__name__}: {e}); retrying in {self.poll_interval:g}s")
+                await asyncio.sleep(self.poll_interval)
+                continue
+            if job is None:
+                self._wakeup.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                continue
+            await self._execute(job)
+
+    async def _execute(self, job: Job) -> None:
+        try:
+            result = await self.run(job.messages)
+            if hasattr(result, "__aiter__"):
+                # Batches stream one line per post; the job keeps them all
+                result = [chunk async for chunk in result]
+        except asyncio.CancelledError:
+            self.store.release(job.id)
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if job.attempts < job.max_attempts:
+                delay = self.retry_backoff * 2 ** (job.attempts - 1)
+                print(f"⚠️  Job {job.id} attempt {job.attempts} failed ({error}); retrying in {delay:g}s")
+                self.store.retry(job.id, error, delay)
+                self.stats.retried += 1
+            else:
+                print(f"❌ Job {job.id} failed after {job.attempts} attempts: {error}")
+                self.store.fail(job.id, error)
+                self.stats.failed += 1
+            return
+
+        self.store.complete(job.id, job_result(result))
+        self.stats.succeeded += 1
+
+    def close(self) -> None:
+        """Close the job store."""
+        self.store.close()
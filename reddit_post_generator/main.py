@@ -11,30 +11,133 @@
 
 import argparse
 import asyncio
+import contextlib
 import json
 import os
 import sys
+import threading
+import time
 import traceback
+from collections.abc import AsyncIterator, Awaitable, Callable
+from functools import partial
 from pathlib import Path
 from textwrap import dedent
-from typing import Any
-
-from agno.agent import Agent
-from agno.models.openai import OpenAIChat
-from agno.models.openrouter import OpenRouter
-from agno.tools.duckduckgo import DuckDuckGoTools
-from agno.tools.reddit import RedditTools
-from bindu.penguin.bindufy import bindufy
+from typing import TYPE_CHECKING, Any
+
 from dotenv import load_dotenv
 
+from reddit_post_generator.backends import configure_backends
+from reddit_post_generator.batch import (
+    parse_async_request,
+    parse_batch_jobs,
+    parse_dry_run,
+    parse_job,
+    parse_job_query,
+    parse_timeout,
+    result_text,
+    run_batch,
+)
+from reddit_post_generator.cache import DEFAULT_CACHE_PATH, SUBREDDIT_FIELD_TTLS, Cache, create_cache
+from reddit_post_generator.coalesce import PostLedger, RequestCoalescer, request_key, request_scope
+from reddit_post_generator.compaction import ToolOutputCompactor
+from reddit_post_generator.deadlines import (
+    Deadline,
+    DeadlineExceededError,
+    async_deadline_tool_hook,
+    current_deadline,
+    deadline_scope,
+    enforce,
+    summarize_findings,
+)
+from reddit_post_generator.history import HistoryManager
+from reddit_post_generator.jobs import JobQueue
+from reddit_post_generator.metrics import (
+    async_tool_metrics_hook,
+    configure_tracing,
+    registry,
+    start_metrics_server,
+    timed,
+)
+from reddit_post_generator.pool import AgentPool
+from reddit_post_generator.prefetch import TrendPrefetcher
+from reddit_post_generator.results import ResultProjector
+from reddit_post_generator.routing import ModelRouter
+
+# agno, bindu, the model clients and the toolkits are imported where they're first
+# needed, so importing this module (for --help, __version__ or tests) stays fast
+if TYPE_CHECKING:
+    import socket
+
+    from agno.agent import Agent
+    from agno.models.base import Model
+    from agno.tools import Toolkit
+
+    from reddit_post_generator.pages import PageStore
+    from reddit_post_generator.pipeline import PostPipeline
+    from reddit_post_generator.reddit_client import AsyncRedditClient
+    from reddit_post_generator.retention import RetentionStats
+    from reddit_post_generator.tools import CachedDuckDuckGoTools
+
 # Load environment variables from .env file
 load_dotenv()
 
-# Global agent team instance
-agent: Agent | None = None
+# Global pool of agent instances
+agent_pool: AgentPool | None = None
 _initialized = False
 _init_lock = asyncio.Lock()
 
+# Staged research → draft → post pipeline, built when pipeline.enabled is set
+pipeline: "PostPipeline | None" = None
+
+# Sends simple requests to a fast model and complex ones to the large one, built when routing.enabled is set
+router: ModelRouter | None = None
+
+# Lean agents without posting tools, for draft-only (dry-run) requests
+draft_pool: AgentPool | None = None
+
+# Search-only agents for the research a batch shares across jobs on one topic
+research_pool: AgentPool | None = None
+
+# Async Reddit client shared by every agent, built when reddit.client is "async"
+reddit_client: "AsyncRedditClient | None" = None
+
+# Compacts earlier turns before each run, built when history.enabled is set
+history: HistoryManager | None = None
+
+# Identical requests in flight share one run, built when coalescing.enabled is set
+coalescer: RequestCoalescer | None = None
+
+# Posts made per request key, so a retried request never posts twice; built when cache.posts is enabled
+post_ledger: PostLedger | None = None
+
+# Fits every tool result into a token budget before the model sees it, built when compaction.enabled is set
+tool_compactor: ToolOutputCompactor | None = None
+
+# Durable queue for requests submitted with "async": true, built when jobs.enabled is set
+job_queue: JobQueue | None = None
+
+# Run results are cut down to the reply bindu stores with each task
+result_projector: ResultProjector | None = None
+
+# Finished tasks held and evicted by the bounded memory storage, when the server uses it
+task_retention: "RetentionStats | None" = None
+
+# Shared caches, built once and used by every pooled agent
+research_cache: Cache | None = None
+subreddit_cache: Cache | None = None
+llm_cache: Cache | None = None
+pipeline_cache: Cache | None = None
+post_cache: Cache | None = None
+page_store: "PageStore | None" = None
+_caches_created = False
+_caches_lock = threading.Lock()
+
+# Keeps the caches warm for the posting schedule from a background thread
+prefetcher: TrendPrefetcher | None = None
+
+# Active configuration, set when the server starts
+_config: dict | None = None
+
 
 def load_config() -> dict:
     """Load agent configuration from project root."""
@@ -70,6 +173,110 @@ def load_config() -> dict:
             "proxy_urls": ["127.0.0.1"],
             "cors_origins": ["*"],
         },
+        "storage": {
+            "type": "memory",
+            "postgres_url": None,
+            "pool_min": 2,
+            "pool_max": 10,
+            "timeout_seconds": 60,
+            "command_timeout_seconds": 30,
+        },
+        "scheduler": {"type": "memory", "redis_url": None},
+        "history": {"enabled": True, "max_turns": 5, "max_tokens": 3000, "summary_chars": 300},
+        "compaction": {"enabled": True, "tool_tokens": 1000, "tool_token_overrides": {"read_page": 1200}},
+        "results": {"projection": "content", "max_result_chars": 20000, "max_tasks": 1000, "max_age_seconds": 3600},
+        "prefetch": {
+            "enabled": False,
+            "subreddits": [],
+            "topics": [],
+            "interval_seconds": 300,
+            "max_requests_per_cycle": 20,
+            "requests_per_minute": 10,
+            "min_ratelimit_remaining": 30,
+        },
+        "research": {"max_sources": 10, "max_queries": 5, "snippet_chars": 300, "page_chars": 4000},
+        "reddit": {
+            "client": "async",
+            "requests_per_minute": 100,
+            "max_connections": 10,
+            "timeout_seconds": 30,
+            "max_retries": 3,
+        },
+        "routing": {
+            "enabled": False,
+            "fast_max_score": 1,
+            "complexity": {
+                "post_type": {"question": 0, "discussion": 0, "news": 1, "informative": 1, "tutorial": 2},
+                "research_depth": {"quick": 0, "standard": 1, "comprehensive": 2, "deep": 2},
+                "post_length": {"short": 0, "medium": 1, "long": 2},
+            },
+            "routes": {
+                "fast": {
+                    "model": {"openai": "gpt-4o-mini", "openrouter": "openai/gpt-4o-mini"},
+                    "pool_size": 2,
+                    "input_cost_per_mtok": 0.15,
+                    "output_cost_per_mtok": 0.6,
+                },
+                "large": {"model": None, "input_cost_per_mtok": 2.5, "output_cost_per_mtok": 10.0},
+            },
+        },
+        "dry_run": {"default": False, "pool_size": 2},
+        "coalescing": {"enabled": True},
+        "jobs": {
+            "enabled": True,
+            "concurrency": 2,
+            "max_attempts": 3,
+            "retry_backoff_seconds": 30,
+            "lease_seconds": 900,
+            "poll_interval_seconds": 1.0,
+            "max_queued": 1000,
+            "result_ttl_seconds": 604800,
+        },
+        "deadlines": {
+            "enabled": True,
+            "request_seconds": 180,
+            "max_request_seconds": 600,
+            "tool_seconds": 30,
+            "model_seconds": 90,
+            "research_share": 0.5,
+        },
+        "workers": 1,
+        "warm_up": False,
+        "streaming": False,
+        "metrics": {
+            "enabled": True,
+            "host": "127.0.0.1",
+            "port": 9464,
+            "tracing": {"enabled": False, "endpoint": None},
+        },
+        "agent_pool": {"size": 3, "acquire_timeout_seconds": 60, "max_waiting": 32, "max_failures": 3},
+        "batch": {"max_concurrency": 3, "max_jobs": 50, "research_pool_size": 2},
+        "pipeline": {
+            "enabled": False,
+            "research_model": {"openai": "gpt-4o-mini", "openrouter": "openai/gpt-4o-mini"},
+            "draft_model": None,
+            "concurrency": {"research": 3, "draft": 3, "post": 2},
+        },
+        "cache": {
+            "path": DEFAULT_CACHE_PATH,
+            "research": {"enabled": True, "ttl_seconds": 21600, "max_entries": 5000},
+            "subreddit": {
+                "enabled": True,
+                "max_entries": 2000,
+                "refresh_ratio": 0.8,
+                "field_ttl_seconds": SUBREDDIT_FIELD_TTLS,
+            },
+            "llm": {"enabled": True, "backend": "sqlite", "ttl_seconds": 3600, "max_entries": 1000},
+            "pipeline": {"enabled": True, "ttl_seconds": 21600, "max_entries": 2000},
+            "posts": {"enabled": True, "ttl_seconds": 86400, "max_entries": 5000},
+            "pages": {
+                "enabled": True,
+                "fresh_seconds": 3600,
+                "max_entries": 2000,
+                "max_bytes": 2000000,
+                "timeout_seconds": 10,
+            },
+        },
         "environment_variables": [
             {"key": "OPENAI_API_KEY", "description": "OpenAI API key for LLM calls", "required": False},
             {"key": "OPENROUTER_API_KEY", "description": "OpenRouter API key for LLM calls", "required": False},
@@ -78,48 +285,119 @@ def load_config() -> dict:
             {"key": "REDDIT_USERNAME", "description": "Reddit account username", "required": True},
             {"key": "REDDIT_PASSWORD", "description": "Reddit account password", "required": True},
             {"key": "REDDIT_USER_AGENT", "description": "Reddit API user agent string", "required": True},
+            {
+                "key": "DATABASE_URL",
+                "description": "Postgres URL for shared task storage (storage.type postgres)",
+                "required": False,
+            },
+            {
+                "key": "REDIS_URL",
+                "description": "Redis URL for the shared task queue (scheduler.type redis)",
+                "required": False,
+            },
         ],
     }
 
 
-async def initialize_agent() -> None:
-    """Initialize the Reddit post generator team with proper model and tools."""
-    global agent
+def get_config() -> dict:
+    """Return the active configuration, loading it on first use."""
+    global _config
+    if _config is None:
+        _config = load_config()
+    return _config
+
+
+def create_model(model_id: str | dict[str, str] | None = None) -> "Model":
+    """Create a chat model for whichever provider has an API key configured.
+
+    ``model_id`` may be a plain id, or a dict mapping ``"openai"``/``"openrouter"``
+    to an id so one config entry works with either provider.
+    """
+    from reddit_post_generator.models import CachedOpenAIChat, CachedOpenRouter
 
     # Get API keys from environment
     openai_api_key = os.getenv("OPENAI_API_KEY")
     openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
     model_name = os.getenv("MODEL_NAME", "openai/gpt-4o")
 
-    # Get Reddit API credentials
-    reddit_client_id = os.getenv("REDDIT_CLIENT_ID")
-    reddit_client_secret = os.getenv("REDDIT_CLIENT_SECRET")
-    reddit_username = os.getenv("REDDIT_USERNAME")
-    reddit_password = os.getenv("REDDIT_PASSWORD")
-    reddit_user_agent = os.getenv("REDDIT_USER_AGENT", "RedditPostGenerator/1.0 by ParasChamoli")
-
     # Model selection logic (supports both OpenAI and OpenRouter)
     if openai_api_key:
-        model = OpenAIChat(id="gpt-4o", api_key=openai_api_key)
-        print("✅ Using OpenAI GPT-4o")
-    elif openrouter_api_key:
-        model = OpenRouter(
-            id=model_name,
+        if isinstance(model_id, dict):
+            model_id = model_id.get("openai")
+        return CachedOpenAIChat(
+            id=model_id or "gpt-4o",
+            api_key=openai_api_key,
+            cache_response=llm_cache is not None,
+            response_cache=llm_cache,
+        )
+    if openrouter_api_key:
+        if isinstance(model_id, dict):
+            model_id = model_id.get("openrouter")
+        return CachedOpenRouter(
+            id=model_id or model_name,
             api_key=openrouter_api_key,
-            cache_response=True,
+            cache_response=llm_cache is not None,
+            response_cache=llm_cache,
             supports_native_structured_outputs=True,
         )
-        print(f"✅ Using OpenRouter model: {model_name}")
-    else:
-        error_msg = (
-            "No API key provided. Set OPENAI_API_KEY or OPENROUTER_API_KEY environment variable.\n"
-            "For OpenRouter: https://openrouter.ai/keys\n"
-            "For OpenAI: https://platform.openai.com/api-keys"
-        )
-        raise ValueError(error_msg)
+
+    error_msg = (
+        "No API key provided. Set OPENAI_API_KEY or OPENROUTER_API_KEY environment variable.\n"
+        "For OpenRouter: https://openrouter.ai/keys\n"
+        "For OpenAI: https://platform.openai.com/api-keys"
+    )
+    raise ValueError(error_msg)
+
+
+def get_reddit_credentials() -> dict[str, str | None]:
+    """Reddit API credentials from the environment."""
+    return {
+        "client_id": os.getenv("REDDIT_CLIENT_ID"),
+        "client_secret": os.getenv("REDDIT_CLIENT_SECRET"),
+        "username": os.getenv("REDDIT_USERNAME"),
+        "password": os.getenv("REDDIT_PASSWORD"),
+        "user_agent": os.getenv("REDDIT_USER_AGENT", "RedditPostGenerator/1.0 by ParasChamoli"),
+    }
+
+
+def create_caches() -> None:
+    """Create the shared caches once; the agents and the prefetcher use the same instances."""
+    global research_cache, subreddit_cache, llm_cache, page_store, _caches_created
+
+    from reddit_post_generator.pages import PageStore
+
+    with _caches_lock:
+        if _caches_created:
+            return
+        # One response cache for either provider, so retried requests don't re-bill the model
+        llm_cache = create_cache(get_config(), "llm")
+        # Persistent search cache shared by all agents so repeated topics skip DuckDuckGo
+        research_cache = create_cache(get_config(), "research")
+        # Subreddit info, rules and flairs change rarely, so repeat posts skip those Reddit calls
+        subreddit_cache = create_cache(get_config(), "subreddit")
+        # Pages the agent reads are stored with their extracted text and revalidated, not re-downloaded
+        page_store = PageStore.from_config(get_config())
+        _caches_created = True
+
+
+async def initialize_agent() -> None:
+    """Initialize the pool of Reddit post generator agents with proper model and tools."""
+    global agent_pool, pipeline, history, reddit_client, pipeline_cache
+    global router, draft_pool, research_pool, coalescer, post_cache, post_ledger, tool_compactor
+    global result_projector
+
+    from reddit_post_generator.pipeline import create_research_agent
+    from reddit_post_generator.reddit_client import AsyncRedditClient
+
+    # The prefetcher may already have created them
+    create_caches()
+
+    model = create_model()
+    print(f"✅ Using {model.provider} model: {model.id}")
 
     # Check Reddit API credentials
-    if not all([reddit_client_id, reddit_client_secret, reddit_username, reddit_password]):
+    reddit_credentials = get_reddit_credentials()
+    if not all(reddit_credentials[key] for key in ("client_id", "client_secret", "username", "password")):
         error_msg = (
             "Reddit API credentials missing. Set all required environment variables:\n"
             "REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, REDDIT_USERNAME, REDDIT_PASSWORD\n"
@@ -127,59 +405,187 @@ async def initialize_agent() -> None:
         )
         raise ValueError(error_msg)
 
-    # Create the main agent with both tools
-    agent = Agent(
+    # One connection pool, OAuth token and rate limiter for every concurrent run
+    if get_config().get("reddit", {}).get("client", "async") == "async":
+        reddit_client = AsyncRedditClient.from_config(get_config(), **reddit_credentials)
+
+    # Tool results stay in the context for the rest of a run, so they are trimmed before the model sees them
+    tool_compactor = ToolOutputCompactor.from_config(get_config())
+
+    # Identical requests in flight share one run, and every post is recorded under its request's key
+    coalescer = RequestCoalescer.from_config(get_config())
+    post_cache = create_cache(get_config(), "posts")
+    post_ledger = PostLedger(post_cache) if post_cache is not None else None
+
+    # bindu keeps every reply with its task, so only the final post or report is returned
+    result_projector = ResultProjector.from_config(get_config())
+
+    def agent_factory(agent_model: "Model", dry_run: bool = False) -> Callable[[], "Agent"]:
+        shared = {
+            "research_cache": research_cache,
+            "subreddit_cache": subreddit_cache,
+            "reddit_client": reddit_client,
+            "page_store": page_store,
+            "compactor": tool_compactor,
+        }
+        if dry_run:
+            return partial(create_dry_run_agent, agent_model, reddit_credentials, **shared)
+        return partial(create_agent, agent_model, reddit_credentials, post_ledger=post_ledger, **shared)
+
+    # Pre-build a bounded pool so concurrent requests never share one agent's run state
+    pool = AgentPool.from_config(agent_factory(model), get_config())
+    pool.start()
+    agent_pool = pool
+
+    if get_config().get("routing", {}).get("enabled", False):
+        router = create_router(pool, agent_factory)
+
+    # Draft-only requests skip the posting phase entirely, so they get their own smaller agents
+    draft_pool = AgentPool.from_config(
+        agent_factory(model, dry_run=True), get_config(), size=get_config().get("dry_run", {}).get("pool_size")
+    )
+    draft_pool.start()
+
+    # Batch research has no Reddit tools and no output schema, so jobs get its notes as plain text
+    research_pool = AgentPool.from_config(
+        partial(
+            create_research_agent,
+            model,
+            research_cache=research_cache,
+            config=get_config(),
+            page_store=page_store,
+            compactor=tool_compactor,
+        ),
+        get_config(),
+        size=get_config().get("batch", {}).get("research_pool_size"),
+    )
+    research_pool.start()
+
+    # Earlier turns are summarized instead of replaying full transcripts on every run
+    history = HistoryManager.from_config(get_config())
+    print(f"✅ Reddit Post Generator initialized with {pool.size} pooled agents")
+
+    if get_config().get("pipeline", {}).get("enabled", False):
+        pipeline = create_pipeline(model, reddit_credentials)
+        print(
+            "✅ Staged pipeline enabled: "
+            + ", ".join(f"{stage} x{stats['size']}" for stage, stats in pipeline.stats().items())
+        )
+
+
+def create_router(default_pool: AgentPool, agent_factory: Callable[["Model"], Callable[[], "Agent"]]) -> ModelRouter:
+    """Build one agent pool per route; routes without their own model share the default pool."""
+    routing_config = get_config().get("routing", {})
+    pools: dict[str, AgentPool] = {}
+    prices: dict[str, tuple[float, float]] = {}
+    for route, section in routing_config.get("routes", {}).items():
+        if section.get("model"):
+            route_model = create_model(section["model"])
+            pools[route] = AgentPool.from_config(
+                agent_factory(route_model), get_config(), size=section.get("pool_size")
+            )
+            pools[route].start()
+            print(f"✅ Route {route}: {route_model.id} x{pools[route].size}")
+        else:
+            pools[route] = default_pool
+            print(f"✅ Route {route}: default model x{default_pool.size}")
+        prices[route] = (section.get("input_cost_per_mtok", 0.0), section.get("output_cost_per_mtok", 0.0))
+
+    return ModelRouter(
+        pools,
+        complexity=routing_config.get("complexity"),
+        fast_max_score=routing_config.get("fast_max_score", 1),
+        prices=prices,
+    )
+
+
+def select_pool(messages: list[dict[str, str]], dry_run: bool = False) -> tuple[str, AgentPool]:
+    """Return the route and agent pool that should handle a request."""
+    if dry_run:
+        return "dry_run", draft_pool  # type: ignore[return-value]
+    if router is None:
+        return "default", agent_pool  # type: ignore[return-value]
+    route = router.classify(messages)
+    return route, router.pools[route]
+
+
+def create_pipeline(model: "Model", reddit_credentials: dict[str, str]) -> "PostPipeline":
+    """Build the staged pipeline, giving research and drafting their own models."""
+    global pipeline_cache
+
+    from reddit_post_generator.pipeline import PostPipeline, create_draft_agent, create_research_agent
+    from reddit_post_generator.tools import create_reddit_tools
+
+    pipeline_config = get_config().get("pipeline", {})
+    # Research is search-and-summarise work, so a smaller model is usually enough
+    research_model = create_model(pipeline_config.get("research_model"))
+    draft_model = create_model(pipeline_config["draft_model"]) if pipeline_config.get("draft_model") else model
+    print(f"✅ Pipeline models: research={research_model.id}, draft={draft_model.id}")
+
+    # Research notes and drafts are reused across jobs and restarts
+    pipeline_cache = create_cache(get_config(), "pipeline")
+
+    staged = PostPipeline.from_config(
+        partial(
+            create_research_agent,
+            research_model,
+            research_cache=research_cache,
+            config=get_config(),
+            page_store=page_store,
+            compactor=tool_compactor,
+        ),
+        partial(
+            create_draft_agent,
+            draft_model,
+            reddit_credentials,
+            subreddit_cache=subreddit_cache,
+            config=get_config(),
+            reddit_client=reddit_client,
+            compactor=tool_compactor,
+        ),
+        # Submission needs no LLM, only an authenticated Reddit client
+        partial(create_reddit_tools, subreddit_cache, get_config(), reddit_credentials, reddit_client),
+        get_config(),
+        cache=pipeline_cache,
+        ledger=post_ledger,
+    )
+    staged.start()
+    return staged
+
+
+def create_agent(
+    model: "Model",
+    reddit_credentials: dict[str, str],
+    research_cache: Cache | None = None,
+    subreddit_cache: Cache | None = None,
+    reddit_client: "AsyncRedditClient | None" = None,
+    page_store: "PageStore | None" = None,
+    post_ledger: PostLedger | None = None,
+    compactor: ToolOutputCompactor | None = None,
+) -> "Agent":
+    """Create one Reddit post generator agent with its own tool instances."""
+    from agno.agent import Agent
+
+    from reddit_post_generator.tools import CachedDuckDuckGoTools, create_reddit_tools
+
+    # The model client, caches and async Reddit client are shared; toolkits are per agent
+    return Agent(
         name="Reddit Post Generator",
         model=model,
         tools=[
-            DuckDuckGoTools(),
-            RedditTools(
-                client_id=reddit_client_id,
-                client_secret=reddit_client_secret,
-                username=reddit_username,
-                password=reddit_password,
-                user_agent=reddit_user_agent,
-            ),
+            CachedDuckDuckGoTools.from_config(research_cache, get_config(), pages=page_store),
+            create_reddit_tools(subreddit_cache, get_config(), reddit_credentials, reddit_client),
         ],
-        description=dedent("""\
-            A specialized agent that researches topics on the web and creates
-            high-quality Reddit posts. Combines web research capabilities with
-            Reddit posting expertise to deliver informative and engaging content
-            tailored to specific subreddits.\
-        """),
+        # Sent on every model turn of a run, so kept to what changes the agent's behaviour
+        description="Researches topics on the web and writes engaging, accurate Reddit posts for specific subreddits.",
         instructions=dedent("""\
-            You are a Reddit Post Generator with access to web search tools and
-            Reddit posting capabilities. Follow this workflow:
-
-            1. RESEARCH PHASE (Use DuckDuckGoTools):
-               - Perform focused web searches using relevant keywords
-               - Filter results for credibility and recency
-               - Extract key information and main points
-               - Verify facts from multiple sources when possible
-               - Focus on authoritative and reliable sources
-
-            2. CONTENT CREATION PHASE:
-               - Organize researched information in a logical structure
-               - Create attention-grabbing yet accurate titles
-               - Format posts using proper Reddit markdown
-               - Structure content for maximum readability
-               - Add appropriate tags and flairs if required
-
-            3. REDDIT POSTING PHASE (Use RedditTools):
-               - Get information regarding the target subreddit
-               - Follow subreddit-specific rules and guidelines
-               - Ensure posts comply with Reddit's content policy
-               - Avoid including links in the main post (use comments if needed)
-               - Submit the post to the specified subreddit
-
-            4. QUALITY ASSURANCE:
-               - Verify all information is accurate and up-to-date
-               - Ensure posts are informative, engaging, and add value to the community
-               - Follow Reddit guidelines and community standards
-               - Format the post for maximum readability and engagement
-
-            Always coordinate between research and posting phases to ensure
-            high-quality, community-focused content that follows all platform rules.\
+            1. Research: call research_topic once with the topic and any keywords; use
+               web_search only for follow-up questions and read_page only when snippets
+               aren't enough. Prefer authoritative, recent sources and cross-check key facts.
+            2. Write: an attention-grabbing yet accurate title and a well-structured body
+               in Reddit markdown. Avoid links in the body.
+            3. Post: check the subreddit's rules and flairs, follow them and Reddit's
+               content policy, pick a flair only from the available ones, then submit.\
         """),
         expected_output=dedent("""\
             # Reddit Post Generated Successfully
@@ -197,52 +603,612 @@ async def initialize_agent() -> None:
             - **Key Topics Covered:** {key_topics}
             - **Post Length:** {post_length} characters
 
-            ## Next Steps
-            1. Post has been submitted to r/{subreddit_name}
-            2. Monitor post engagement and comments
-            3. Be prepared to respond to community feedback
-
             ---
             Generated by Reddit Post Generator
             Post Created: {current_date}\
         """),
         add_datetime_to_context=True,
         markdown=True,
+        # Compaction comes first so it trims what every other hook returns; posting is idempotent per request.
+        # Agents only run with arun, and agno awaits only async hooks there
+        tool_hooks=[
+            *([compactor.async_tool_hook] if compactor else []),
+            async_tool_metrics_hook,
+            async_deadline_tool_hook,
+            *([post_ledger.async_tool_hook] if post_ledger else []),
+        ],
     )
-    print("✅ Reddit Post Generator initialized")
 
 
-async def run_agent(messages: list[dict[str, str]]) -> Any:
-    """Run the agent with the given messages."""
-    global agent
-    if not agent:
+def create_dry_run_agent(
+    model: "Model",
+    reddit_credentials: dict[str, str],
+    research_cache: Cache | None = None,
+    subreddit_cache: Cache | None = None,
+    reddit_client: "AsyncRedditClient | None" = None,
+    page_store: "PageStore | None" = None,
+    compactor: ToolOutputCompactor | None = None,
+) -> "Agent":
+    """Create a draft-only agent: web research and read-only Reddit tools, structured output, no posting."""
+    from agno.agent import Agent
+
+    from reddit_post_generator.drafts import DraftReport
+    from reddit_post_generator.pipeline import DRAFT_REDDIT_TOOLS
+    from reddit_post_generator.tools import CachedDuckDuckGoTools, create_reddit_tools
+
+    return Agent(
+        name="Reddit Post Drafter",
+        model=model,
+        tools=[
+            CachedDuckDuckGoTools.from_config(research_cache, get_config(), pages=page_store),
+            # Without create_post the agent can't write to Reddit, even by mistake
+            create_reddit_tools(
+                subreddit_cache, get_config(), reddit_credentials, reddit_client, include_tools=DRAFT_REDDIT_TOOLS
+            ),
+        ],
+        instructions=dedent("""\
+            You draft Reddit posts for human review. You never submit them.
+            - Start with research_topic, passing the topic and any keywords
+            - Use read_page only when snippets aren't enough
+            - Check the target subreddit's rules and available flairs
+            - Follow the requested post type, tone and length
+            - Write an accurate, attention-grabbing title and a body in Reddit markdown
+            - Only pick a flair from the subreddit's available flairs
+            - List the key findings and source URLs you used
+            - Note any subreddit rules the draft might break in rule_warnings\
+        """),
+        output_schema=DraftReport,
+        add_datetime_to_context=True,
+        tool_hooks=[
+            *([compactor.async_tool_hook] if compactor else []),
+            async_tool_metrics_hook,
+            async_deadline_tool_hook,
+        ],
+    )
+
+
+async def run_agent(messages: list[dict[str, str]], dry_run: bool = False) -> Any:
+    """Run the agent with the given messages, within the current request's deadline.
+
+    With ``dry_run`` the run uses a draft-only agent that has no posting tools.
+    """
+    if not agent_pool:
         error_msg = "Agent not initialized"
         raise RuntimeError(error_msg)
 
-    # Run the agent and get response
-    return await agent.arun(messages)  # type: ignore[invalid-await]
+    # Route on the request itself, then check out a dedicated agent for this run
+    route, pool = select_pool(messages, dry_run)
+    if history is not None:
+        messages = history.compact(messages)
+
+    deadline = current_deadline()
+    try:
+        async with enforce(deadline, "Request"), pool.checkout() as agent:
+            with timed("run", "agent"), timed("route", route):
+                result = await agent.arun(messages)  # type: ignore[invalid-await]
+    except DeadlineExceededError:
+        # Hand back whatever research finished rather than nothing
+        findings = summarize_findings(deadline.findings) if deadline is not None else ""
+        if not findings:
+            raise
+        print(f"⏱️  Run stopped at its {deadline.seconds:g}s deadline; returning partial research")
+        return f"The request ran out of time ({deadline.seconds:g}s) before the post was finished.\n\n{findings}"
 
+    if router is not None and route in router.stats:
+        router.record(route, result)
+    return result
 
-async def handler(messages: list[dict[str, str]]) -> Any:
-    """Handle incoming agent messages with lazy initialization."""
+
+async def run_research(messages: list[dict[str, str]]) -> str:
+    """Run a research-only agent within the current request's deadline and return its notes."""
+    if not research_pool:
+        error_msg = "Agent not initialized"
+        raise RuntimeError(error_msg)
+
+    async with enforce(current_deadline(), "Research"), research_pool.checkout() as agent:
+        with timed("run", "research"):
+            result = await agent.arun(messages)  # type: ignore[invalid-await]
+    return result_text(result)
+
+
+async def run_dry_run(messages: list[dict[str, str]]) -> str:
+    """Draft a post without submitting it and return a JSON report shaped like skill.yaml's output_format."""
+    from reddit_post_generator.drafts import draft_report
+
+    start = time.perf_counter()
+    result = await run_agent(messages, dry_run=True)
+    return json.dumps(draft_report(result, request_query(messages), elapsed_ms(start)), default=str)
+
+
+def request_query(messages: list[dict[str, str]]) -> str:
+    """Return the content of the last user message."""
+    user_messages = [m for m in messages if m.get("role") == "user"]
+    return str(user_messages[-1].get("content", "")) if user_messages else ""
+
+
+def elapsed_ms(start: float) -> int:
+    """Milliseconds since ``start``, a ``time.perf_counter()`` reading."""
+    return int((time.perf_counter() - start) * 1000)
+
+
+def is_dry_run(messages: list[dict[str, str]]) -> bool:
+    """Whether a request only wants a draft: its own ``dry_run``/``submit`` flag, else the configured default."""
+    requested = parse_dry_run(messages)
+    if requested is not None:
+        return requested
+    return bool(get_config().get("dry_run", {}).get("default", False))
+
+
+async def ensure_initialized() -> None:
+    """Initialize the agent exactly once, skipping the lock after the first call."""
     global _initialized
 
-    # Lazy initialization on first call
+    # Fast path: once the agent exists, requests never touch the lock
+    if _initialized:
+        return
+
     async with _init_lock:
+        # Re-check under the lock in case a concurrent request already initialized
         if not _initialized:
             print("🔧 Initializing Reddit Post Generator...")
-            await initialize_agent()
+            with timed("init", "initialize_agent"):
+                await initialize_agent()
             _initialized = True
 
+
+def request_deadline(messages: list[dict[str, str]]) -> Deadline | None:
+    """Deadline for one request: the payload's ``timeout_seconds`` or the configured default."""
+    return Deadline.from_config(get_config(), parse_timeout(messages))
+
+
+async def handler(messages: list[dict[str, str]]) -> Any:
+    """Handle incoming agent messages with lazy initialization."""
+    # Lazy initialization on first call
+    await ensure_initialized()
+
+    # Queued jobs: submitting returns a job id at once, and clients poll or wait for the result
+    start_job_queue()
+    reply = handle_job_request(messages)
+    if reply is not None:
+        return reply
+
+    return await respond(messages)
+
+
+async def respond(messages: list[dict[str, str]]) -> Any:
+    """Run a request now and project its result down to the reply that is stored with the task."""
+    start = time.perf_counter()
+    result = await dispatch(messages)
+    if result_projector is None:
+        return result
+    return result_projector.project(result, request_query(messages), elapsed_ms(start))
+
+
+def start_job_queue() -> None:
+    """Build the job queue on first use and keep its runners draining it on the running event loop.
+
+    The server calls this at startup, so jobs persisted before a restart resume
+    without waiting for a new request.
+    """
+    global job_queue
+    if job_queue is None:
+        # Submitted jobs are persisted and drained in the background, in priority order
+        job_queue = JobQueue.from_config(run_queued_job, get_config())
+    if job_queue is not None:
+        job_queue.start()
+
+
+async def run_queued_job(messages: list[dict[str, str]]) -> Any:
+    """Run a queued job like a live request, initializing the agent if no request has yet."""
+    await ensure_initialized()
+    return await respond(messages)
+
+
+def handle_job_request(messages: list[dict[str, str]]) -> Any | None:
+    """Submit an ``"async": true`` request or report on a ``job_id``; None for any other request."""
+    query = parse_job_query(messages)
+    request = parse_async_request(messages) if query is None else None
+    if query is None and request is None:
+        return None
+    if job_queue is None:
+        error_msg = "The job queue is disabled; set jobs.enabled in agent_config.json"
+        raise ValueError(error_msg)
+
+    if request is not None:
+        job = job_queue.submit(messages, request)
+        print(f"📥 Queued job {job.id} (priority {job.priority})")
+        return json.dumps(job.report())
+    if query["wait"]:
+        return job_queue.watch(query["job_id"])
+    return json.dumps(job_queue.status(query["job_id"]), default=str)
+
+
+async def dispatch(messages: list[dict[str, str]]) -> Any:
+    """Run a request now: a batch, a pipeline job, a draft-only run or the agent."""
+    # Every tool and model call below is bounded by this request's deadline
+    deadline = request_deadline(messages)
+    dry_run = is_dry_run(messages)
+    key = request_key(messages)
+
+    # Batch requests stream one result per job as each finishes
+    jobs = parse_batch_jobs(messages)
+    if jobs is not None:
+        batch_config = get_config().get("batch", {})
+        max_jobs = batch_config.get("max_jobs", 50)
+        if len(jobs) > max_jobs:
+            error_msg = f"Batch has {len(jobs)} jobs; the limit is {max_jobs}"
+            raise ValueError(error_msg)
+        if pipeline is not None:
+            return pipeline.run_many(
+                [{**job, "submit": False} for job in jobs] if dry_run else jobs, deadline=deadline, request_key=key
+            )
+        return run_batch(
+            jobs,
+            partial(run_batch_job, key, dry_run=dry_run),
+            max_concurrency=batch_config.get("max_concurrency", 3),
+            deadline=deadline,
+            research_run=partial(run_batch_research, key),
+        )
+
+    with deadline_scope(deadline):
+        # Retries and duplicate submissions attach to the run already in flight
+        return await coalesced(key, partial(handle_request, messages, dry_run))
+
+
+async def handle_request(messages: list[dict[str, str]], dry_run: bool = False) -> Any:
+    """Run one non-batch request: a pipeline job, a draft-only run or the agent."""
+    # Structured single-job requests go through the staged pipeline when it is enabled
+    if pipeline is not None:
+        job = parse_job(messages)
+        if job is not None:
+            return json.dumps(await pipeline.run({**job, "submit": False} if dry_run else job), default=str)
+
+    # Draft-only requests never load posting tools or write to Reddit
+    if dry_run:
+        return await run_dry_run(messages)
+
     # Run the async agent
-    result = await run_agent(messages)
-    return result
+    return await run_agent(messages)
+
+
+async def coalesced(key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Run ``factory()`` as request ``key``: shared with identical requests in flight, posting at most once."""
+    if coalescer is not None:
+        return await coalescer.run(key, factory)
+    with request_scope(key):
+        return await factory()
+
+
+async def run_batch_job(key: str, messages: list[dict[str, str]], dry_run: bool = False) -> Any:
+    """Run one agent job of a batch as its own request, keyed by the batch and the job's prompt.
+
+    Draft-only jobs return the same JSON report as a single dry-run request.
+    """
+    run = partial(run_dry_run, messages) if dry_run else partial(run_agent, messages)
+    return await coalesced(f"{key}:{request_key(messages)}", run)
+
+
+async def run_batch_research(key: str, messages: list[dict[str, str]]) -> str:
+    """Run a batch topic's shared research as its own request, on an agent that can only search."""
+    return await coalesced(f"{key}:{request_key(messages)}", partial(run_research, messages))
+
+
+async def stream_agent(messages: list[dict[str, str]], deadline: Deadline | None = None) -> AsyncIterator[str]:
+    """Run the agent and yield tokens and phase events as they are produced."""
+    from reddit_post_generator.streaming import stream_run
+
+    if not agent_pool:
+        error_msg = "Agent not initialized"
+        raise RuntimeError(error_msg)
+
+    route, pool = select_pool(messages)
+    if history is not None:
+        messages = history.compact(messages)
+
+    # Finished streams count toward their route's spend, as non-streamed runs do
+    on_completed = partial(router.record, route) if router is not None and route in router.stats else None
+
+    # Hold the checked-out agent until the stream finishes, times out or the client disconnects
+    with deadline_scope(deadline):
+        async with pool.checkout() as agent:
+            with timed("run", "agent_stream"), timed("route", route):
+                run_events = agent.arun(messages, stream=True, stream_events=True)
+                async for chunk in stream_run(run_events, deadline, on_completed):
+                    yield chunk
+
+
+async def stream_handler(messages: list[dict[str, str]]) -> AsyncIterator[str]:
+    """Handle incoming agent messages, streaming JSON-line events instead of one final reply."""
+    await ensure_initialized()
+
+    # Batches, pipeline jobs and draft-only requests already produce their own structured results
+    if (
+        parse_batch_jobs(messages) is not None
+        or parse_async_request(messages) is not None
+        or parse_job_query(messages) is not None
+        or (pipeline is not None and parse_job(messages) is not None)
+        or is_dry_run(messages)
+    ):
+        result = await handler(messages)
+        if hasattr(result, "__aiter__"):
+            async for chunk in result:
+                yield chunk
+        else:
+            yield result
+        return
+
+    async for chunk in stream_agent(messages, request_deadline(messages)):
+        yield chunk
+
+
+def warm_up() -> None:
+    """Eagerly initialize the agent so the first request skips client construction."""
+    print("🔥 Warming up Reddit Post Generator before accepting traffic...")
+    asyncio.run(ensure_initialized())
+
+
+def caches() -> dict[str, "Cache | PageStore"]:
+    """Return the enabled shared caches by name."""
+    named = {
+        "research": research_cache,
+        "subreddit": subreddit_cache,
+        "llm": llm_cache,
+        "pipeline": pipeline_cache,
+        "posts": post_cache,
+        "pages": page_store,
+    }
+    return {name: cache for name, cache in named.items() if cache is not None}
+
+
+def pool_stats() -> dict[str, dict[str, int]]:
+    """Utilisation of every agent pool by name."""
+    pools = {"agent": agent_pool.stats()} if agent_pool is not None else {}
+    if draft_pool is not None:
+        pools["dry_run"] = draft_pool.stats()
+    if research_pool is not None:
+        pools["batch_research"] = research_pool.stats()
+    if router is not None:
+        pools.update({route: pool.stats() for route, pool in router.pools.items() if pool is not agent_pool})
+    if pipeline is not None:
+        pools.update(pipeline.stats())
+    return pools
+
+
+def is_idle() -> bool:
+    """Whether no request is running or waiting for an agent."""
+    return not any(stats["in_use"] or stats["waiting"] for stats in pool_stats().values())
+
+
+def create_prefetch_tools() -> tuple["CachedDuckDuckGoTools", "Toolkit | None"]:
+    """Toolkits for the prefetcher over the shared caches, built on the prefetch thread's event loop.
+
+    The prefetcher gets its own Reddit client, paced by ``prefetch.requests_per_minute``
+    instead of drawing on the live requests' rate limiter.
+    """
+    from reddit_post_generator.reddit_client import AsyncRedditClient
+    from reddit_post_generator.tools import CachedDuckDuckGoTools, create_reddit_tools
+
+    create_caches()
+    config = get_config()
+    research_tools = CachedDuckDuckGoTools.from_config(research_cache, config)
+
+    credentials = get_reddit_credentials()
+    if not all(credentials[key] for key in ("client_id", "client_secret")):
+        print("⚠️  Reddit API credentials missing; prefetching research only")
+        return research_tools, None
+
+    client = None
+    if config.get("reddit", {}).get("client", "async") == "async":
+        requests_per_minute = config.get("prefetch", {}).get("requests_per_minute", 10)
+        reddit_config = {**config.get("reddit", {}), "requests_per_minute": requests_per_minute}
+        # One worker's own bucket: joining the shared one would lower every worker's rate to the prefetch rate
+        client = AsyncRedditClient.from_config({**config, "reddit": reddit_config, "workers": 1}, **credentials)
+    return research_tools, create_reddit_tools(subreddit_cache, config, credentials, client)
+
+
+def start_prefetcher(config: dict) -> None:
+    """Start warming the caches for the subreddits and topics in the ``prefetch`` section, if enabled."""
+    global prefetcher
+    prefetcher = TrendPrefetcher.from_config(config, idle=is_idle)
+    if prefetcher is None:
+        return
+    prefetcher.start(create_prefetch_tools)
+    print(
+        f"🔭 Prefetching {len(prefetcher.subreddits)} subreddits and {len(prefetcher.topics)} topics "
+        f"every {prefetcher.interval:g}s"
+    )
+
+
+# HELP text of every metric family collect_runtime_metrics reports
+RUNTIME_METRICS = {
+    "reddit_post_generator_cache_hits_total": "Cache lookups served from the cache",
+    "reddit_post_generator_cache_misses_total": "Cache lookups that missed",
+    "reddit_post_generator_cache_hit_ratio": "Fraction of cache lookups served from the cache",
+    "reddit_post_generator_pool_in_use": "Agents checked out of the pool",
+    "reddit_post_generator_pool_waiting": "Requests waiting for a pooled agent",
+    "reddit_post_generator_reddit_requests_total": "Requests sent to the Reddit API",
+    "reddit_post_generator_reddit_throttled_total": "Reddit API requests rejected with 429 and retried",
+    "reddit_post_generator_reddit_token_refreshes_total": "Reddit OAuth token refreshes",
+    "reddit_post_generator_reddit_ratelimit_remaining": "Requests left in Reddit's current rate limit window",
+    "reddit_post_generator_route_requests_total": "Runs per model route",
+    "reddit_post_generator_route_tokens_total": "Model tokens used per route",
+    "reddit_post_generator_route_cost_usd_total": "Estimated model spend per route in USD",
+    "reddit_post_generator_coalesced_requests_total": "Requests that started a run or joined one in flight",
+    "reddit_post_generator_duplicate_posts_prevented_total": "Posts answered from the ledger instead of posting again",
+    "reddit_post_generator_jobs": "Queued jobs per status",
+    "reddit_post_generator_job_retries_total": "Failed job attempts put back in the queue",
+    "reddit_post_generator_tool_output_tokens_total": "Tool output tokens before and after compaction",
+    "reddit_post_generator_tool_outputs_truncated_total": "Tool outputs cut to their token budget",
+    "reddit_post_generator_result_chars_total": "Reply characters before and after projection",
+    "reddit_post_generator_results_truncated_total": "Replies cut to results.max_chars",
+    "reddit_post_generator_stored_tasks": "Tasks held by the bounded memory storage",
+    "reddit_post_generator_evicted_tasks_total": "Finished tasks evicted from the memory storage",
+    "reddit_post_generator_prefetch_total": "Cache entries refreshed ahead of demand, by result",
+    "reddit_post_generator_prefetch_deferred_total": "Prefetch cycles cut short by live requests",
+    "reddit_post_generator_history_tokens_total": "Conversation history tokens before and after compaction",
+    "reddit_post_generator_history_tokens_saved_total": "History tokens saved by compaction",
+}
+
+
+def route_metrics() -> list[tuple[str, dict[str, str], float]]:
+    """Return runs, tokens and estimated spend per model route."""
+    samples: list[tuple[str, dict[str, str], float]] = []
+    for route, stats in router.stats.items() if router is not None else ():
+        samples += [
+            ("reddit_post_generator_route_requests_total", {"route": route}, stats.requests),
+            ("reddit_post_generator_route_tokens_total", {"route": route, "kind": "input"}, stats.input_tokens),
+            ("reddit_post_generator_route_tokens_total", {"route": route, "kind": "output"}, stats.output_tokens),
+            ("reddit_post_generator_route_cost_usd_total", {"route": route}, round(stats.cost_usd, 6)),
+        ]
+    return samples
+
+
+def coalescing_metrics() -> list[tuple[str, dict[str, str], float]]:
+    """Return runs started, requests that joined one in flight, and duplicate posts prevented."""
+    samples: list[tuple[str, dict[str, str], float]] = []
+    if coalescer is not None:
+        samples += [
+            ("reddit_post_generator_coalesced_requests_total", {"kind": "run"}, coalescer.stats.runs),
+            ("reddit_post_generator_coalesced_requests_total", {"kind": "joined"}, coalescer.stats.joined),
+        ]
+    if post_ledger is not None:
+        samples.append(("reddit_post_generator_duplicate_posts_prevented_total", {}, post_ledger.duplicates))
+    return samples
+
+
+def compaction_metrics() -> list[tuple[str, dict[str, str], float]]:
+    """Tool output tokens before and after compaction, and results that had to be cut."""
+    if tool_compactor is None:
+        return []
+    stats = tool_compactor.stats
+    return [
+        ("reddit_post_generator_tool_output_tokens_total", {"kind": "original"}, stats.original_tokens),
+        ("reddit_post_generator_tool_output_tokens_total", {"kind": "sent"}, stats.sent_tokens),
+        ("reddit_post_generator_tool_outputs_truncated_total", {}, stats.truncated),
+    ]
+
+
+def result_metrics() -> list[tuple[str, dict[str, str], float]]:
+    """Reply sizes before and after projection, and tasks held and evicted by the memory storage."""
+    samples: list[tuple[str, dict[str, str], float]] = []
+    if result_projector is not None:
+        stats = result_projector.stats
+        samples += [
+            ("reddit_post_generator_result_chars_total", {"kind": "original"}, stats.original_chars),
+            ("reddit_post_generator_result_chars_total", {"kind": "returned"}, stats.returned_chars),
+            ("reddit_post_generator_results_truncated_total", {}, stats.truncated),
+        ]
+    if task_retention is not None:
+        samples += [
+            ("reddit_post_generator_stored_tasks", {}, task_retention.stored),
+            ("reddit_post_generator_evicted_tasks_total", {}, task_retention.evicted),
+        ]
+    return samples
+
+
+def prefetch_metrics() -> list[tuple[str, dict[str, str], float]]:
+    """Cache entries refreshed ahead of demand, failed refreshes and cycles cut short by live traffic."""
+    if prefetcher is None:
+        return []
+    stats = prefetcher.stats
+    return [
+        ("reddit_post_generator_prefetch_total", {"result": "refreshed"}, stats.refreshed),
+        ("reddit_post_generator_prefetch_total", {"result": "failed"}, stats.failed),
+        ("reddit_post_generator_prefetch_deferred_total", {}, stats.deferred),
+    ]
+
+
+def job_metrics() -> list[tuple[str, dict[str, str], float]]:
+    """Jobs per status in the shared queue, and this process's retries."""
+    if job_queue is None:
+        return []
+    samples = [
+        ("reddit_post_generator_jobs", {"status": status}, count) for status, count in job_queue.store.counts().items()
+    ]
+    samples.append(("reddit_post_generator_job_retries_total", {}, job_queue.stats.retried))
+    return samples
+
+
+def collect_runtime_metrics() -> list[tuple[str, dict[str, str], float]]:
+    """Cache hit rates, pool utilisation, route spend and history savings, sampled when /metrics is scraped."""
+    samples: list[tuple[str, dict[str, str], float]] = []
+    for name, cache in caches().items():
+        samples += [
+            ("reddit_post_generator_cache_hits_total", {"cache": name}, cache.stats.hits),
+            ("reddit_post_generator_cache_misses_total", {"cache": name}, cache.stats.misses),
+            ("reddit_post_generator_cache_hit_ratio", {"cache": name}, round(cache.stats.hit_rate, 4)),
+        ]
+
+    for pool_name, stats in pool_stats().items():
+        for field in ("in_use", "waiting"):
+            samples.append((f"reddit_post_generator_pool_{field}", {"pool": pool_name}, stats[field]))
+
+    if reddit_client is not None:
+        samples += [
+            ("reddit_post_generator_reddit_requests_total", {}, reddit_client.stats.requests),
+            ("reddit_post_generator_reddit_throttled_total", {}, reddit_client.stats.throttled),
+            ("reddit_post_generator_reddit_token_refreshes_total", {}, reddit_client.stats.token_refreshes),
+        ]
+        if reddit_client.stats.ratelimit_remaining is not None:
+            samples.append((
+                "reddit_post_generator_reddit_ratelimit_remaining",
+                {},
+                reddit_client.stats.ratelimit_remaining,
+            ))
+
+    samples += route_metrics()
+    samples += coalescing_metrics()
+    samples += job_metrics()
+    samples += compaction_metrics()
+    samples += result_metrics()
+    samples += prefetch_metrics()
+
+    if history is not None:
+        samples += [
+            ("reddit_post_generator_history_tokens_total", {"kind": "original"}, history.stats.original_tokens),
+            ("reddit_post_generator_history_tokens_total", {"kind": "sent"}, history.stats.sent_tokens),
+            ("reddit_post_generator_history_tokens_saved_total", {}, history.stats.tokens_saved),
+        ]
+    return samples
 
 
 async def cleanup() -> None:
     """Clean up any resources."""
     print("🧹 Cleaning up Reddit Post Generator resources...")
 
+    # Stopped first so it is done with the caches before they close
+    if prefetcher is not None:
+        prefetcher.stop()
+        print(f"📊 prefetch: {prefetcher.stats.refreshed} entries refreshed in {prefetcher.stats.cycles} cycles")
+
+    for name, cache in caches().items():
+        print(f"📊 {name} cache: {cache.stats.hits} hits, {cache.stats.misses} misses")
+        cache.close()
+
+    if job_queue is not None:
+        stats = job_queue.stats
+        print(f"📊 jobs: {stats.submitted} submitted, {stats.succeeded} succeeded, {stats.failed} failed")
+        job_queue.close()
+
+    if reddit_client is not None:
+        # The server's event loop is gone by now; the pooled sockets close with the process
+        with contextlib.suppress(Exception):
+            await reddit_client.aclose()
+
+    if router is not None:
+        for route, stats in router.stats.items():
+            print(f"📊 route {route}: {stats.requests} runs, ${stats.cost_usd:.4f} estimated")
+
+    if tool_compactor is not None and tool_compactor.stats.calls:
+        stats = tool_compactor.stats
+        print(f"📊 compaction: {stats.tokens_saved} tool output tokens saved over {stats.calls} tool calls")
+
+    if task_retention is not None and task_retention.evicted:
+        print(f"📊 results: {task_retention.evicted} finished tasks evicted from memory storage")
+
+    if history is not None and history.stats.requests:
+        print(f"📊 history: {history.stats.tokens_saved} prompt tokens saved over {history.stats.requests} runs")
+
 
 def create_argument_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser."""
@@ -301,6 +1267,26 @@ def create_argument_parser() -> argparse.ArgumentParser:
         type=str,
         help="Path to agent_config.json (optional)",
     )
+    parser.add_argument(
+        "--warm-up",
+        action="store_true",
+        help="Initialize the agent before the server starts accepting requests",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream tokens and phase events to clients as the agent runs",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only draft posts for review by default; never submit them to Reddit",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of server processes sharing the port (default: workers in agent_config.json, or 1)",
+    )
 
     return parser
 
@@ -323,13 +1309,103 @@ def set_environment_variables(args) -> None:
             os.environ[key] = value
 
 
+def bindufy(config: dict, agent_handler: Callable) -> None:
+    """Serve ``agent_handler`` with bindu, which is only imported once the server starts."""
+    from bindu.penguin.bindufy import bindufy as bindu_bindufy
+
+    bindu_bindufy(config, agent_handler)
+
+
+def serve(config: dict, worker: int = 0, sock: "socket.socket | None" = None) -> None:
+    """Start metrics, warm up and serve requests in this process.
+
+    Worker ``n`` of a multi-worker server serves its metrics on ``metrics.port + n``
+    and accepts requests on the socket the parent bound.
+    """
+    global _config, task_retention
+    _config = config
+
+    # Latency, token and cache metrics served next to the agent server
+    metrics_config = config.get("metrics", {})
+    if metrics_config.get("enabled", True):
+        host, port = metrics_config.get("host", "127.0.0.1"), metrics_config.get("port", 9464) + worker
+        try:
+            start_metrics_server(host, port)
+        except OSError as e:
+            # Metrics are a side endpoint; the agent still serves without them
+            print(f"⚠️  Metrics server not started on {host}:{port}: {e}")
+        else:
+            registry.add_collector(collect_runtime_metrics, RUNTIME_METRICS)
+    if metrics_config.get("tracing", {}).get("enabled", False):
+        configure_tracing(metrics_config["tracing"].get("endpoint"))
+
+    # Optional eager initialization so the first request doesn't pay startup latency
+    if config.get("warm_up", False):
+        warm_up()
+
+    # bindufy streams async generator handlers chunk by chunk
+    agent_handler = stream_handler if config.get("streaming", False) else handler
+    with contextlib.ExitStack() as stack:
+        # Finished tasks are evicted from memory storage instead of being kept for the life of the process
+        results_config = config.get("results", {})
+        max_tasks, max_age = results_config.get("max_tasks", 1000), results_config.get("max_age_seconds", 3600)
+        if config.get("storage", {}).get("type", "memory") == "memory" and (
+            max_tasks is not None or max_age is not None
+        ):
+            from reddit_post_generator.retention import retaining_tasks
+
+            task_retention = stack.enter_context(retaining_tasks(max_tasks, max_age))
+
+        from reddit_post_generator.workers import running_at_startup, serving_on
+
+        if sock is not None:
+            stack.enter_context(serving_on(sock))
+        # Jobs left in the queue by a previous run start draining as soon as the server is up
+        stack.enter_context(running_at_startup(start_job_queue))
+        bindufy(config, agent_handler)
+
+
+def run_worker(config: dict, sock: "socket.socket", worker: int) -> None:
+    """Body of one forked worker process."""
+    print(f"👷 Worker {worker} started (pid {os.getpid()})")
+    try:
+        # One worker prefetches for all of them; SQLite caches are shared between workers
+        if worker == 0:
+            start_prefetcher(config)
+        serve(config, worker, sock)
+    finally:
+        asyncio.run(cleanup())
+
+
 def run_agent_server(config: dict) -> None:
     """Run the agent server with the given configuration."""
+    global _config
+    _config = config
+
     try:
         # Bindufy and start the agent server
         print("🚀 Starting Bindu Reddit Post Generator server...")
-        print(f"🌐 Server will run on: {config.get('deployment', {}).get('url', 'http://127.0.0.1:3776')}")
-        bindufy(config, handler)
+        url = config.get("deployment", {}).get("url", "http://127.0.0.1:3776")
+        print(f"🌐 Server will run on: {url}")
+
+        # Shared Postgres storage and Redis scheduler let several replicas split the work
+        config = configure_backends(config)
+        _config = config
+
+        from reddit_post_generator.workers import bind_socket, prepare_workers, run_workers, worker_count
+
+        workers = worker_count(config)
+        if workers == 1:
+            start_prefetcher(config)
+            serve(config)
+            return
+
+        # Forked before any agent, cache connection or event loop exists, so each worker builds its own
+        config = prepare_workers(config, workers)
+        _config = config
+        sock = bind_socket(url)
+        print(f"👷 Starting {workers} workers")
+        run_workers(workers, partial(run_worker, config, sock))
     except KeyboardInterrupt:
         print("\n🛑 Reddit Post Generator stopped")
     except Exception as e:
@@ -355,6 +1431,16 @@ def main():
     # Load configuration
     config = load_config()
 
+    # CLI flags enable warm-up, streaming and dry runs even if the config file doesn't
+    if args.warm_up:
+        config["warm_up"] = True
+    if args.stream:
+        config["streaming"] = True
+    if args.dry_run:
+        config["dry_run"] = {**config.get("dry_run", {}), "default": True}
+    if args.workers is not None:
+        config["workers"] = args.workers
+
     # Run the agent server
     run_agent_server(config)
 
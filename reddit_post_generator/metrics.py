@@ -0,0 +1,330 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Per-phase latency, token and cache metrics with a Prometheus text endpoint."""
+
+import inspect
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Label values are (phase, name), e.g. ("tool", "web_search") or ("model", "gpt-4o")
+LabelKey = tuple[str, str]
+
+# A collector returns extra samples at scrape time: (metric, labels, value)
+Collector = Callable[[], list[tuple[str, dict[str, str], float]]]
+
+# Collector metrics named *_total are counters; every other one is a gauge
+_COUNTER_SUFFIX = "_total"
+
+
+class MetricsRegistry:
+    """Thread-safe latency summaries and counters for the agent's hot paths.
+
+    Latencies keep the last ``window`` samples per phase and name, so p50/p95/p99
+    reflect recent traffic rather than the whole process lifetime.
+    """
+
+    def __init__(self, window: int = 1024) -> None:
+        """Keep the last ``window`` latency samples for each phase and name."""
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples: dict[LabelKey, deque[float]] = {}
+        self._sums: dict[LabelKey, float] = defaultdict(float)
+        self._counts: dict[LabelKey, int] = defaultdict(int)
+        self._errors: dict[LabelKey, int] = defaultdict(int)
+        self._tokens: dict[tuple[str, str], int] = defaultdict(int)
+        # Input tokens of each model call, i.e. the prompt size of every agent turn
+        self._prompts: dict[str, deque[int]] = {}
+        self._prompt_sums: dict[str, int] = defaultdict(int)
+        self._prompt_counts: dict[str, int] = defaultdict(int)
+        self._collectors: list[Collector] = []
+        self._help: dict[str, str] = {}
+
+    def observe(self, phase: str, name: str, seconds: float, error: bool = False) -> None:
+        """Record one timed call."""
+        key = (phase, name)
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+            self._sums[key] += seconds
+            self._counts[key] += 1
+            if error:
+                self._errors[key] += 1
+
+    def record_tokens(self, model: str, input_tokens: int, output_tokens: int) -> None:
+        """Add one model call's token usage."""
+        with self._lock:
+            self._tokens[(model, "input")] += input_tokens
+            self._tokens[(model, "output")] += output_tokens
+
+    def record_prompt(self, model: str, input_tokens: int) -> None:
+        """Record the prompt size of one model call (one agent turn)."""
+        with self._lock:
+            prompts = self._prompts.get(model)
+            if prompts is None:
+                prompts = self._prompts[model] = deque(maxlen=self.window)
+            prompts.append(input_tokens)
+            self._prompt_sums[model] += input_tokens
+            self._prompt_counts[model] += 1
+
+    def prompt_quantiles(self, model: str) -> dict[float, int]:
+        """Return p50/p95/p99 prompt tokens per turn over the recent window."""
+        with self._lock:
+            samples = sorted(self._prompts.get(model, ()))
+        if not samples:
+            return {}
+        return {q: samples[min(len(samples) - 1, int(q * len(samples)))] for q in QUANTILES}
+
+    def add_collector(self, collector: Collector, descriptions: dict[str, str] | None = None) -> None:
+        """Register a callable that contributes samples at scrape time, with HELP text per metric."""
+        self._collectors.append(collector)
+        self._help.update(descriptions or {})
+
+    def quantiles(self, phase: str, name: str) -> dict[float, float]:
+        """Return p50/p95/p99 latency in seconds over the recent window."""
+        with self._lock:
+            samples = sorted(self._samples.get((phase, name), ()))
+        if not samples:
+            return {}
+        return {q: samples[min(len(samples) - 1, int(q * len(samples)))] for q in QUANTILES}
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return every latency summary and token counter as plain data."""
+        with self._lock:
+            keys = list(self._samples)
+            counts = dict(self._counts)
+            errors = dict(self._errors)
+            tokens = dict(self._tokens)
+            prompt_models = list(self._prompts)
+            prompt_counts = dict(self._prompt_counts)
+
+        return {
+            "latency": {
+                f"{phase}:{name}": {
+                    "count": counts[(phase, name)],
+                    "errors": errors.get((phase, name), 0),
+                    **{f"p{int(q * 100)}": value for q, value in self.quantiles(phase, name).items()},
+                }
+                for phase, name in keys
+            },
+            "tokens": {f"{model}:{kind}": count for (model, kind), count in tokens.items()},
+            "prompt_tokens": {
+                model: {
+                    "turns": prompt_counts[model],
+                    **{f"p{int(q * 100)}": value for q, value in self.prompt_quantiles(model).items()},
+                }
+                for model in prompt_models
+            },
+        }
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP reddit_post_generator_latency_seconds Latency of agent phases, tools and model calls",
+            "# TYPE reddit_post_generator_latency_seconds summary",
+        ]
+        with self._lock:
+            keys = list(self._samples)
+            sums = dict(self._sums)
+            counts = dict(self._counts)
+            errors = dict(self._errors)
+            tokens = dict(self._tokens)
+            prompt_sums = dict(self._prompt_sums)
+            prompt_counts = dict(self._prompt_counts)
+
+        for phase, name in keys:
+            labels = f'phase="{_escape(phase)}",name="{_escape(name)}"'
+            for q, value in self.quantiles(phase, name).items():
+                lines.append(f'reddit_post_generator_latency_seconds{{{labels},quantile="{q}"}} {value:.6f}')
+            lines.append(f"reddit_post_generator_latency_seconds_sum{{{labels}}} {sums[(phase, name)]:.6f}")
+            lines.append(f"reddit_post_generator_latency_seconds_count{{{labels}}} {counts[(phase, name)]}")
+
+        lines += [
+            "# HELP reddit_post_generator_errors_total Failed calls by phase and name",
+            "# TYPE reddit_post_generator_errors_total counter",
+        ]
+        for (phase, name), count in errors.items():
+            lines.append(
+                f'reddit_post_generator_errors_total{{phase="{_escape(phase)}",name="{_escape(name)}"}} {count}'
+            )
+
+        lines += [
+            "# HELP reddit_post_generator_tokens_total Model tokens used",
+            "# TYPE reddit_post_generator_tokens_total counter",
+        ]
+        for (model, kind), count in tokens.items():
+            lines.append(f'reddit_post_generator_tokens_total{{model="{_escape(model)}",kind="{kind}"}} {count}')
+
+        lines += [
+            "# HELP reddit_post_generator_prompt_tokens Input tokens per model call (agent turn)",
+            "# TYPE reddit_post_generator_prompt_tokens summary",
+        ]
+        for model, count in prompt_counts.items():
+            label = f'model="{_escape(model)}"'
+            for q, value in self.prompt_quantiles(model).items():
+                lines.append(f'reddit_post_generator_prompt_tokens{{{label},quantile="{q}"}} {value}')
+            lines.append(f"reddit_post_generator_prompt_tokens_sum{{{label}}} {prompt_sums[model]}")
+            lines.append(f"reddit_post_generator_prompt_tokens_count{{{label}}} {count}")
+
+        lines += self._render_collected()
+        return "\n".join(lines) + "\n"
+
+    def _render_collected(self) -> list[str]:
+        # Each family's samples must be contiguous, after its one HELP and TYPE line
+        families: dict[str, list[str]] = {}
+        for collector in self._collectors:
+            for metric, labels, value in collector():
+                rendered = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+                families.setdefault(metric, []).append(
+                    f"{metric}{{{rendered}}} {value}" if rendered else f"{metric} {value}"
+                )
+
+        lines: list[str] = []
+        for metric, samples in families.items():
+            if metric in self._help:
+                lines.append(f"# HELP {metric} {self._help[metric]}")
+            lines.append(f"# TYPE {metric} {'counter' if metric.endswith(_COUNTER_SUFFIX) else 'gauge'}")
+            lines += samples
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Process-wide registry used by main.py, the tool hook and the model mixin
+registry = MetricsRegistry()
+
+# OpenTelemetry tracer, set by configure_tracing when tracing is enabled
+_tracer: Any = None
+
+
+@contextmanager
+def timed(phase: str, name: str) -> Iterator[None]:
+    """Time a block, recording it as an error if it raises, and trace it when enabled."""
+    span = _tracer.start_as_current_span(f"{phase}.{name}") if _tracer is not None else nullcontext()
+    start = time.perf_counter()
+    error = False
+    try:
+        with span:
+            yield
+    except Exception:
+        error = True
+        raise
+    finally:
+        registry.observe(phase, name, time.perf_counter() - start, error=error)
+
+
+def tool_metrics_hook(function_name: str, function_call: Callable, arguments: dict[str, Any]) -> Any:
+    """Time every tool call an agent makes (an agno tool hook)."""
+    start = time.perf_counter()
+    span = _tracer.start_as_current_span(f"tool.{function_name}") if _tracer is not None else nullcontext()
+    try:
+        with span:
+            result = function_call(**arguments)
+    except Exception:
+        registry.observe("tool", function_name, time.perf_counter() - start, error=True)
+        raise
+
+    if inspect.isawaitable(result):
+        # In async runs agno hands hooks a coroutine; time it until it actually finishes
+        return _time_awaitable(function_name, result, start)
+    registry.observe("tool", function_name, time.perf_counter() - start, error=_tool_failed(result))
+    return result
+
+
+def _tool_failed(result: Any) -> bool:
+    # Toolkits report failures as "Error ..." strings rather than raising
+    return isinstance(result, str) and result.startswith("Error")
+
+
+async def async_tool_metrics_hook(function_name: str, function_call: Callable, arguments: dict[str, Any]) -> Any:
+    """Time every tool call an agent makes in async runs (an async agno tool hook)."""
+    result = tool_metrics_hook(function_name, function_call, arguments)
+    return await result if inspect.isawaitable(result) else result
+
+
+async def _time_awaitable(function_name: str, awaitable: Awaitable, start: float) -> Any:
+    error = True
+    try:
+        result = await awaitable
+        error = _tool_failed(result)
+        return result
+    finally:
+        registry.observe("tool", function_name, time.perf_counter() - start, error=error)
+
+
+def configure_tracing(endpoint: str | None = None) -> bool:
+    """Send spans for every timed block to an OTLP/HTTP collector such as Phoenix.
+
+    Returns False (and leaves tracing off) if OpenTelemetry isn't installed or no
+    endpoint is configured.
+    """
+    global _tracer
+
+    endpoint = endpoint or os.getenv("PHOENIX_COLLECTOR_ENDPOINT")
+    if not endpoint:
+        print("⚠️  Tracing enabled but no endpoint set (PHOENIX_COLLECTOR_ENDPOINT)")
+        return False
+
+    try:
+        from opentelemetry import trace
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError:
+        print("⚠️  OpenTelemetry is not installed; spans will not be exported")
+        return False
+
+    provider = trace.get_tracer_provider()
+    if not isinstance(provider, TracerProvider):
+        # Nobody else (e.g. bindu's own telemetry) has installed an SDK provider yet
+        provider = TracerProvider(resource=Resource.create({"service.name": "reddit-post-generator"}))
+        trace.set_tracer_provider(provider)
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint)))
+
+    _tracer = trace.get_tracer("reddit_post_generator")
+    print(f"🔭 Exporting spans to {endpoint}")
+    return True
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = registry.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        # Scrapes every few seconds would drown the server log
+        return
+
+
+def start_metrics_server(host: str = "127.0.0.1", port: int = 9464) -> ThreadingHTTPServer:
+    """Serve ``/metrics`` on a background thread next to the bindu server."""
+    server = ThreadingHTTPServer((host, port), _MetricsRequestHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    print(f"📈 Metrics available at http://{host}:{server.server_port}/metrics")
+    return server
@@ -0,0 +1,211 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Chat models with a shared, pluggable response cache, call metrics and deadlines."""
+
+import asyncio
+import contextlib
+import json
+import re
+import time
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from hashlib import sha256
+from typing import Any
+
+from agno.models.openai import OpenAIChat
+from agno.models.openrouter import OpenRouter
+from agno.models.response import ModelResponse
+
+from reddit_post_generator.cache import Cache
+from reddit_post_generator.deadlines import DeadlineExceededError, current_deadline
+from reddit_post_generator.metrics import registry, timed
+
+# Timestamps such as agno's "The current time is 2026-01-13 14:30:00.123456." are
+# truncated to the day, otherwise add_datetime_to_context makes every key unique
+_TIMESTAMP_RE = re.compile(r"(\d{4}-\d{2}-\d{2})[ T]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:[+-]\d{2}:?\d{2}|Z)?")
+
+
+def canonicalize_content(content: Any) -> Any:
+    """Normalize message content so equivalent prompts produce the same key."""
+    if isinstance(content, str):
+        return _TIMESTAMP_RE.sub(r"\1", content.strip())
+    if isinstance(content, list):
+        return [canonicalize_content(part) for part in content]
+    if isinstance(content, dict):
+        return {key: canonicalize_content(value) for key, value in content.items()}
+    return content
+
+
+class ResponseCacheMixin:
+    """Route agno's model response cache through a MemoryCache or SQLiteCache.
+
+    Keys cover the model id, the canonicalized messages (role, content, tool calls)
+    and the full tool schema, so a cached answer is only reused when the model
+    would have seen exactly the same request.
+    """
+
+    id: str
+    response_cache: Cache | None
+
+    def _get_model_cache_key(self, messages: list, stream: bool, **kwargs: Any) -> str:
+        tools = kwargs.get("tools")
+        response_format = kwargs.get("response_format")
+        if isinstance(response_format, type) and hasattr(response_format, "model_json_schema"):
+            response_format = response_format.model_json_schema()
+
+        key_data = {
+            "model_id": self.id,
+            "messages": [
+                {
+                    "role": message.role,
+                    "content": canonicalize_content(message.content),
+                    "name": message.name,
+                    "tool_calls": message.tool_calls,
+                    "tool_call_id": message.tool_call_id,
+                }
+                for message in messages
+            ],
+            "tools": self._format_tools(tools) if tools else [],  # type: ignore[attr-defined]
+            "response_format": response_format,
+            "stream": stream,
+        }
+        return sha256(json.dumps(key_data, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _get_cached_model_response(self, cache_key: str) -> dict[str, Any] | None:
+        if self.response_cache is None:
+            return None
+        return self.response_cache.get(cache_key)
+
+    def _save_model_response_to_cache(self, cache_key: str, result: ModelResponse, is_streaming: bool = False) -> None:
+        if self.response_cache is None:
+            return
+        # Responses with non-JSON payloads (e.g. raw media) simply aren't cached
+        with contextlib.suppress(TypeError, ValueError):
+            self.response_cache.set(
+                cache_key,
+                {"timestamp": int(time.time()), "is_streaming": is_streaming, "result": result.to_dict()},
+            )
+
+    def _save_streaming_responses_to_cache(self, cache_key: str, responses: list[ModelResponse]) -> None:
+        if self.response_cache is None:
+            return
+        with contextlib.suppress(TypeError, ValueError):
+            self.response_cache.set(
+                cache_key,
+                {
+                    "timestamp": int(time.time()),
+                    "is_streaming": True,
+                    "streaming_responses": [response.to_dict() for response in responses],
+                },
+            )
+
+
+class MetricsMixin:
+    """Time every provider call and count its tokens; cache hits never reach these methods."""
+
+    id: str
+
+    def _record_usage(self, response: ModelResponse) -> None:
+        usage = response.response_usage
+        if usage is not None:
+            registry.record_tokens(self.id, usage.input_tokens or 0, usage.output_tokens or 0)
+            if usage.input_tokens:
+                registry.record_prompt(self.id, usage.input_tokens)
+
+    def invoke(self, *args: Any, **kwargs: Any) -> ModelResponse:
+        """Call the provider, timing the call and counting its tokens."""
+        with timed("model", self.id):
+            response = super().invoke(*args, **kwargs)  # type: ignore[misc]
+        self._record_usage(response)
+        return response
+
+    async def ainvoke(self, *args: Any, **kwargs: Any) -> ModelResponse:
+        """Call the provider asynchronously, timing the call and counting its tokens."""
+        with timed("model", self.id):
+            response = await super().ainvoke(*args, **kwargs)  # type: ignore[misc]
+        self._record_usage(response)
+        return response
+
+    def invoke_stream(self, *args: Any, **kwargs: Any) -> Iterator[ModelResponse]:
+        """Stream from the provider, timing the whole stream and counting each chunk's tokens."""
+        with timed("model", self.id):
+            for response in super().invoke_stream(*args, **kwargs):  # type: ignore[misc]
+                self._record_usage(response)
+                yield response
+
+    async def ainvoke_stream(self, *args: Any, **kwargs: Any) -> AsyncIterator[ModelResponse]:
+        """Stream from the provider asynchronously, timing the whole stream and counting each chunk's tokens."""
+        with timed("model", self.id):
+            async for response in super().ainvoke_stream(*args, **kwargs):  # type: ignore[misc]
+                self._record_usage(response)
+                yield response
+
+
+class DeadlineMixin:
+    """Bound every async provider call by the current request's model budget."""
+
+    id: str
+
+    def _model_budget(self) -> float | None:
+        deadline = current_deadline()
+        if deadline is None:
+            return None
+        budget = deadline.budget(deadline.model_seconds)
+        if budget <= 0:
+            error_msg = f"No time left for a {self.id} call"
+            raise DeadlineExceededError(error_msg)
+        return budget
+
+    async def ainvoke(self, *args: Any, **kwargs: Any) -> ModelResponse:
+        """Call the provider, failing with DeadlineExceededError once the model budget runs out."""
+        budget = self._model_budget()
+        try:
+            return await asyncio.wait_for(super().ainvoke(*args, **kwargs), timeout=budget)  # type: ignore[misc]
+        except TimeoutError:
+            error_msg = f"{self.id} call exceeded its {budget:.0f}s budget"
+            raise DeadlineExceededError(error_msg) from None
+
+    async def ainvoke_stream(self, *args: Any, **kwargs: Any) -> AsyncIterator[ModelResponse]:
+        """Stream from the provider, failing with DeadlineExceededError once the model budget runs out."""
+        budget = self._model_budget()
+        stream = super().ainvoke_stream(*args, **kwargs)  # type: ignore[misc]
+        if budget is None:
+            async for response in stream:
+                yield response
+            return
+
+        # Time out each chunk against the call's deadline; a timeout spanning yields would cancel the caller
+        expires = time.monotonic() + budget
+        try:
+            while True:
+                try:
+                    response = await asyncio.wait_for(anext(stream), timeout=max(0.0, expires - time.monotonic()))
+                except StopAsyncIteration:
+                    return
+                except TimeoutError:
+                    error_msg = f"{self.id} stream exceeded its {budget:.0f}s budget"
+                    raise DeadlineExceededError(error_msg) from None
+                yield response
+        finally:
+            await stream.aclose()
+
+
+@dataclass
+class CachedOpenAIChat(MetricsMixin, DeadlineMixin, ResponseCacheMixin, OpenAIChat):
+    """OpenAIChat backed by the shared response cache, with call metrics."""
+
+    response_cache: Cache | None = None
+
+
+@dataclass
+class CachedOpenRouter(MetricsMixin, DeadlineMixin, ResponseCacheMixin, OpenRouter):
+    """OpenRouter backed by the shared response cache, with call metrics."""
+
+    response_cache: Cache | None = None
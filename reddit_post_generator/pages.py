@@ -0,0 +1,333 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Persistent store of fetched web pages and their extracted main text."""
+
+import hashlib
+import ipaddress
+import re
+import socket
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from pathlib import Path
+
+import httpx
+
+from reddit_post_generator.cache import DEFAULT_CACHE_PATH, CacheStats
+
+# Elements whose text is never part of an article's main content
+SKIPPED_TAGS = {"script", "style", "noscript", "svg", "nav", "header", "footer", "aside", "form", "iframe", "button"}
+# Elements that end a line of text
+BLOCK_TAGS = {"p", "div", "li", "br", "tr", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "pre", "section"}
+# Containers that usually hold the main content; preferred over the whole body when present
+MAIN_TAGS = {"article", "main"}
+
+# Only web pages are fetched; the URLs come from the model, so everything else is refused
+ALLOWED_SCHEMES = {"http", "https"}
+TEXT_CONTENT_TYPES = ("text/", "application/xhtml+xml", "application/xml")
+MAX_REDIRECTS = 5
+
+_BLANK_LINES_RE = re.compile(r"\n\s*\n+")
+_SPACES_RE = re.compile(r"[ \t\r\f\v]+")
+
+# Resolves a host and port to the IP addresses a connection could reach
+Resolver = Callable[[str, int], list[str]]
+
+
+class UnsafeURLError(ValueError):
+    """Raised for a URL that isn't http(s) or whose host resolves to a private, loopback or link-local address."""
+
+
+class UnsupportedContentError(ValueError):
+    """Raised when a page isn't text, before its body is downloaded."""
+
+
+def resolve_host(host: str, port: int) -> list[str]:
+    """Return every IP address ``host`` resolves to."""
+    return [info[4][0] for info in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)]
+
+
+def check_url(url: httpx.URL, resolve: Resolver = resolve_host) -> None:
+    """Refuse URLs the server shouldn't fetch for the model: other schemes and internal addresses."""
+    if url.scheme not in ALLOWED_SCHEMES or not url.host:
+        error_msg = f"Only http(s) URLs can be read, got {str(url)!r}"
+        raise UnsafeURLError(error_msg)
+
+    try:
+        addresses = resolve(url.host, url.port or (443 if url.scheme == "https" else 80))
+    except OSError as e:
+        error_msg = f"Could not resolve {url.host!r}: {e}"
+        raise UnsafeURLError(error_msg) from e
+    for address in addresses:
+        ip = ipaddress.ip_address(address.split("%", 1)[0])
+        if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+            ip = ip.ipv4_mapped
+        # Covers loopback, RFC 1918, link-local (cloud metadata endpoints) and other reserved ranges
+        if not ip.is_global or ip.is_multicast:
+            error_msg = f"{url.host!r} resolves to the non-public address {ip}"
+            raise UnsafeURLError(error_msg)
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self._in_title = False
+        self._skip_depth = 0
+        self._main_depth = 0
+        self._all: list[str] = []
+        self._main: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in MAIN_TAGS:
+            self._main_depth += 1
+        elif tag == "title":
+            self._in_title = True
+        if tag in BLOCK_TAGS:
+            self._append("\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag in MAIN_TAGS and self._main_depth:
+            self._main_depth -= 1
+        elif tag == "title":
+            self._in_title = False
+        if tag in BLOCK_TAGS:
+            self._append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self.title += data
+        elif not self._skip_depth:
+            self._append(data)
+
+    def _append(self, text: str) -> None:
+        self._all.append(text)
+        if self._main_depth:
+            self._main.append(text)
+
+    def text(self) -> str:
+        main = _clean("".join(self._main))
+        # A tiny <main> (e.g. just a heading) is worse than the whole page
+        return main if len(main) >= 200 else _clean("".join(self._all))
+
+
+def _clean(text: str) -> str:
+    lines = (_SPACES_RE.sub(" ", line).strip() for line in text.splitlines())
+    return _BLANK_LINES_RE.sub("\n\n", "\n".join(line for line in lines if line)).strip()
+
+
+def extract_text(html: str) -> tuple[str, str]:
+    """Return the page title and its main text, without navigation, scripts or styling."""
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    return " ".join(parser.title.split()), parser.text()
+
+
+@dataclass
+class Page:
+    """A stored page: its extracted text plus what's needed to revalidate it."""
+
+    url: str
+    title: str
+    text: str
+    etag: str | None
+    last_modified: str | None
+    content_hash: str
+    fetched_at: float
+
+
+class PageStore:
+    """Fetched pages stored compressed in SQLite, keyed by URL.
+
+    Pages fetched within ``fresh_seconds`` are served without any network call.
+    Older pages are revalidated with ``If-None-Match``/``If-Modified-Since``, so
+    unchanged pages cost one small 304 response. Main text is extracted once
+    per distinct page body and stored next to it, so the model only ever sees
+    pre-extracted, truncated text.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        fresh_seconds: float = 3600,
+        max_entries: int | None = 2000,
+        max_bytes: int = 2_000_000,
+        timeout: float = 10.0,
+        client: httpx.Client | None = None,
+        resolve: Resolver = resolve_host,
+    ) -> None:
+        """Open the store at ``path``; page downloads are cut off after ``max_bytes``."""
+        self.path = Path(path)
+        self.fresh_seconds = fresh_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self.not_modified = 0
+        self._resolve = resolve
+        # Redirects are followed by _open, which checks every hop's target first
+        self._client = client or httpx.Client(
+            timeout=timeout,
+            headers={"User-Agent": "Mozilla/5.0 (compatible; RedditPostGenerator/1.0)"},
+        )
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                text BLOB NOT NULL,
+                body BLOB NOT NULL,
+                content_hash TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_lru ON pages (last_access)")
+
+    @classmethod
+    def from_config(cls, config: dict) -> "PageStore | None":
+        """Build a store from the ``cache.pages`` section of agent_config.json, or None if disabled."""
+        cache_config = config.get("cache", {})
+        section = cache_config.get("pages", {})
+        if not section.get("enabled", True):
+            return None
+        return cls(
+            path=cache_config.get("path", DEFAULT_CACHE_PATH),
+            fresh_seconds=section.get("fresh_seconds", 3600),
+            max_entries=section.get("max_entries", 2000),
+            max_bytes=section.get("max_bytes", 2_000_000),
+            timeout=section.get("timeout_seconds", 10.0),
+        )
+
+    def _load(self, url: str) -> Page | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT title, text, content_hash, etag, last_modified, fetched_at FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+            if row is not None:
+                self._conn.execute("UPDATE pages SET last_access = ? WHERE url = ?", (time.time(), url))
+        if row is None:
+            return None
+        title, text, content_hash, etag, last_modified, fetched_at = row
+        return Page(url, title, zlib.decompress(text).decode(), etag, last_modified, content_hash, fetched_at)
+
+    def _save(self, page: Page, body: bytes | None) -> None:
+        now = time.time()
+        with self._lock:
+            if body is None:
+                # 304: the stored body and text are still current
+                self._conn.execute(
+                    "UPDATE pages SET etag = ?, last_modified = ?, fetched_at = ?, last_access = ? WHERE url = ?",
+                    (page.etag, page.last_modified, page.fetched_at, now, page.url),
+                )
+            else:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO pages (url, title, text, body, content_hash, etag, last_modified, "
+                    "fetched_at, last_access) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        page.url,
+                        page.title,
+                        zlib.compress(page.text.encode()),
+                        zlib.compress(body),
+                        page.content_hash,
+                        page.etag,
+                        page.last_modified,
+                        page.fetched_at,
+                        now,
+                    ),
+                )
+            if self.max_entries is not None:
+                cursor = self._conn.execute(
+                    "DELETE FROM pages WHERE url IN (SELECT url FROM pages ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+                self.stats.evictions += max(cursor.rowcount, 0)
+
+    @contextmanager
+    def _open(self, url: str, headers: dict[str, str]) -> Iterator[httpx.Response]:
+        """Stream the response for ``url``, following redirects only to URLs that pass check_url."""
+        target = httpx.URL(url)
+        for _ in range(MAX_REDIRECTS + 1):
+            check_url(target, self._resolve)
+            with self._client.stream("GET", target, headers=headers, follow_redirects=False) as response:
+                if not response.has_redirect_location:
+                    yield response
+                    return
+                target = target.join(response.headers["Location"])
+        error_msg = f"{url} redirected more than {MAX_REDIRECTS} times"
+        raise httpx.TooManyRedirects(error_msg)
+
+    def get(self, url: str) -> Page:
+        """Return the page at url, fetching or revalidating it only when needed."""
+        stored = self._load(url)
+        if stored is not None and time.time() - stored.fetched_at < self.fresh_seconds:
+            self.stats.hits += 1
+            return stored
+
+        headers = {}
+        if stored is not None and stored.etag:
+            headers["If-None-Match"] = stored.etag
+        if stored is not None and stored.last_modified:
+            headers["If-Modified-Since"] = stored.last_modified
+
+        with self._open(url, headers) as response:
+            if response.status_code == 304 and stored is not None:
+                stored.fetched_at = time.time()
+                self._save(stored, None)
+                self.stats.hits += 1
+                self.not_modified += 1
+                return stored
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type", "text/html").split(";", 1)[0].strip().lower()
+            if not content_type.startswith(TEXT_CONTENT_TYPES):
+                error_msg = f"{url} is {content_type}, not a text page"
+                raise UnsupportedContentError(error_msg)
+            chunks = bytearray()
+            for chunk in response.iter_bytes():
+                chunks += chunk
+                if len(chunks) >= self.max_bytes:
+                    break
+            body = bytes(chunks[: self.max_bytes])
+            encoding = response.encoding or "utf-8"
+            etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+        self.stats.misses += 1
+        content_hash = hashlib.sha256(body).hexdigest()
+        if stored is not None and stored.content_hash == content_hash:
+            # Same body without validators: keep the text extracted last time
+            title, text = stored.title, stored.text
+        else:
+            title, text = extract_text(body.decode(encoding, errors="replace"))
+        page = Page(url, title, text, etag, last_modified, content_hash, time.time())
+        self._save(page, body)
+        return page
+
+    def close(self) -> None:
+        """Close the HTTP client and the database connection."""
+        self._client.close()
+        with self._lock:
+            self._conn.close()
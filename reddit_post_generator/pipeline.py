@@ -0,0 +1,390 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Staged research → draft → post pipeline with one specialised agent per stage."""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import time
+from collections.abc import AsyncIterator, Callable
+from textwrap import dedent
+from typing import Any
+
+from agno.agent import Agent
+from agno.models.base import Model
+from pydantic import BaseModel, Field
+
+from reddit_post_generator.batch import result_text
+from reddit_post_generator.cache import Cache
+from reddit_post_generator.coalesce import PostLedger, request_scope
+from reddit_post_generator.compaction import ToolOutputCompactor
+from reddit_post_generator.deadlines import (
+    PARTIAL_RESEARCH_HEADER,
+    Deadline,
+    DeadlineExceededError,
+    async_deadline_tool_hook,
+    current_deadline,
+    deadline_scope,
+    enforce,
+    summarize_findings,
+)
+from reddit_post_generator.metrics import async_tool_metrics_hook, timed
+from reddit_post_generator.pages import PageStore
+from reddit_post_generator.pool import AgentPool
+from reddit_post_generator.reddit_client import AsyncRedditClient
+from reddit_post_generator.research import normalize_query
+from reddit_post_generator.streaming import count_sources
+from reddit_post_generator.tools import CachedDuckDuckGoTools, create_reddit_tools
+
+# Read-only Reddit tools the draft stage may call; only the post stage writes to Reddit
+DRAFT_REDDIT_TOOLS = ["get_subreddit_info", "get_subreddit_rules"]
+
+
+class PostDraft(BaseModel):
+    """Structured output of the draft stage."""
+
+    title: str = Field(..., description="Post title, at most 300 characters")
+    content: str = Field(..., description="Post body in Reddit markdown")
+    flair: str | None = Field(None, description="One of the subreddit's available flairs, if any apply")
+
+
+def create_research_agent(
+    model: Model,
+    research_cache: Cache | None = None,
+    config: dict | None = None,
+    page_store: PageStore | None = None,
+    compactor: ToolOutputCompactor | None = None,
+) -> Agent:
+    """Create the research stage agent: web search and page reading only, no Reddit access."""
+    return Agent(
+        name="Reddit Post Researcher",
+        model=model,
+        tools=[CachedDuckDuckGoTools.from_config(research_cache, config or {}, pages=page_store)],
+        instructions=dedent("""\
+            You research topics for Reddit posts. You never write the post itself.
+            - Call research_topic once with the topic and any extra keywords
+            - Only run follow-up web searches if the ranked sources leave gaps
+            - Use read_page on the most relevant sources when snippets aren't enough
+            - Prefer authoritative, recent sources and cross-check key facts
+            - research_depth "quick" means 1-2 searches, "standard" 3-4, "deep" up to 10 sources
+            - Return a concise bullet list of key findings, each with its source URL\
+        """),
+        add_datetime_to_context=True,
+        tool_hooks=[
+            *([compactor.async_tool_hook] if compactor else []),
+            async_tool_metrics_hook,
+            async_deadline_tool_hook,
+        ],
+    )
+
+
+def create_draft_agent(
+    model: Model,
+    reddit_credentials: dict[str, str],
+    subreddit_cache: Cache | None = None,
+    config: dict | None = None,
+    reddit_client: AsyncRedditClient | None = None,
+    compactor: ToolOutputCompactor | None = None,
+) -> Agent:
+    """Create the draft stage agent: reads subreddit rules, writes a structured draft."""
+    return Agent(
+        name="Reddit Post Writer",
+        model=model,
+        tools=[
+            create_reddit_tools(
+                subreddit_cache,
+                config or {},
+                reddit_credentials,
+                reddit_client,
+                include_tools=DRAFT_REDDIT_TOOLS,
+            )
+        ],
+        instructions=dedent("""\
+            You write Reddit posts from research that has already been gathered.
+            - Check the target subreddit's rules and available flairs first
+            - Follow the requested tone, post type and post length
+            - Create an attention-grabbing yet accurate title
+            - Format the body with proper Reddit markdown for readability
+            - Avoid links in the body unless include_sources is true
+            - Only pick a flair from the subreddit's available flairs\
+        """),
+        output_schema=PostDraft,
+        tool_hooks=[
+            *([compactor.async_tool_hook] if compactor else []),
+            async_tool_metrics_hook,
+            async_deadline_tool_hook,
+        ],
+    )
+
+
+def research_key(job: dict[str, Any]) -> str:
+    """Cache key for a job's research: jobs on the same topic and depth share it."""
+    keywords = sorted({normalize_query(k) for k in job.get("keywords", [])})
+    return "research:" + json.dumps([normalize_query(job["topic"]), keywords, job.get("research_depth", "standard")])
+
+
+def draft_key(job: dict[str, Any], research: str) -> str:
+    """Cache key for a draft: the job's writing inputs plus the research it was based on."""
+    inputs = {**{k: v for k, v in job.items() if k != "submit"}, "topic": normalize_query(job["topic"])}
+    digest = hashlib.sha256(json.dumps([inputs, research], sort_keys=True).encode()).hexdigest()
+    return f"draft:{digest}"
+
+
+class PostPipeline:
+    """Runs jobs through research, draft and post stages, each with its own pool.
+
+    Stage pools are independent, so one job can be drafting while another is still
+    researching. Research and drafts are cached, and concurrent jobs on the same
+    research key share a single in-flight research run. Submission calls Reddit
+    directly without an LLM turn.
+
+    Under a request deadline, research gets ``research_share`` of the remaining
+    time; if it runs out, drafting continues from the findings gathered so far.
+    """
+
+    def __init__(
+        self,
+        research_pool: AgentPool,
+        draft_pool: AgentPool,
+        post_pool: AgentPool,
+        cache: Cache | None = None,
+        ledger: PostLedger | None = None,
+    ) -> None:
+        """Run stages on the given pools; ``cache`` keeps research and drafts, ``ledger`` past posts."""
+        self.research_pool = research_pool
+        self.draft_pool = draft_pool
+        self.post_pool = post_pool
+        self.cache = cache
+        self.ledger = ledger
+        self._in_flight: dict[str, asyncio.Task[str]] = {}
+        self._waiters: dict[str, int] = {}
+
+    @classmethod
+    def from_config(
+        cls,
+        research_factory: Callable[[], Any],
+        draft_factory: Callable[[], Any],
+        post_factory: Callable[[], Any],
+        config: dict,
+        cache: Cache | None = None,
+        ledger: PostLedger | None = None,
+    ) -> "PostPipeline":
+        """Build the stage pools from the ``pipeline`` and ``agent_pool`` sections of agent_config.json."""
+        pool_config = config.get("agent_pool", {})
+        concurrency = config.get("pipeline", {}).get("concurrency", {})
+
+        def stage_pool(factory: Callable[[], Any], stage: str) -> AgentPool:
+            return AgentPool(
+                factory,
+                size=concurrency.get(stage, 3),
+                acquire_timeout=pool_config.get("acquire_timeout_seconds", 60.0),
+                max_waiting=pool_config.get("max_waiting"),
+                max_failures=pool_config.get("max_failures", 3),
+            )
+
+        return cls(
+            stage_pool(research_factory, "research"),
+            stage_pool(draft_factory, "draft"),
+            stage_pool(post_factory, "post"),
+            cache=cache,
+            ledger=ledger,
+        )
+
+    def start(self) -> None:
+        """Pre-build every stage's agents."""
+        for pool in (self.research_pool, self.draft_pool, self.post_pool):
+            pool.start()
+
+    async def _run_research(self, job: dict[str, Any], deadline: Deadline | None) -> str:
+        content = f"Research this topic: {job['topic']}\nResearch depth: {job.get('research_depth', 'standard')}"
+        if job.get("keywords"):
+            content += f"\nAdditional search terms: {', '.join(job['keywords'])}"
+
+        with deadline_scope(deadline):
+            try:
+                async with enforce(deadline, "Research"), self.research_pool.checkout() as agent:
+                    result = await agent.arun([{"role": "user", "content": content}])
+            except DeadlineExceededError:
+                notes = summarize_findings(deadline.findings) if deadline is not None else ""
+                if not notes:
+                    raise
+                print(f"⏱️  Research on {job['topic']!r} ran out of time; drafting from partial findings")
+                return notes
+        return result_text(result)
+
+    async def research(self, job: dict[str, Any]) -> str:
+        """Return research notes for a job, from the cache or a shared in-flight run."""
+        key = research_key(job)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        task = self._in_flight.get(key)
+        if task is None:
+            deadline = current_deadline()
+            research_deadline = deadline.child(deadline.research_share) if deadline is not None else None
+            task = asyncio.ensure_future(self._run_research(job, research_deadline))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # Shield so one cancelled job doesn't cancel the research other jobs wait on
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            notes = await asyncio.shield(task)
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+                # Nobody is waiting any more (every client went away), so stop the run
+                if not task.done():
+                    task.cancel()
+
+        # Partial notes are only good for this request
+        if self.cache is not None and not notes.startswith(PARTIAL_RESEARCH_HEADER):
+            self.cache.set(key, notes)
+        return notes
+
+    async def draft(self, job: dict[str, Any], research: str) -> dict[str, Any]:
+        """Return a draft ``{"title", "content", "flair"}`` for a job, from the cache when possible."""
+        key = draft_key(job, research)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        inputs = {k: v for k, v in job.items() if k != "submit"}
+        content = f"Write a Reddit post for this request:\n{json.dumps(inputs, indent=2)}\n\nResearch:\n{research}"
+        async with self.draft_pool.checkout() as agent:
+            result = await agent.arun([{"role": "user", "content": content}])
+
+        draft = result.content
+        if isinstance(draft, PostDraft):
+            draft = draft.model_dump()
+        if not isinstance(draft, dict):
+            error_msg = f"Draft stage returned {type(draft).__name__}, expected a structured draft"
+            raise TypeError(error_msg)
+
+        if self.cache is not None:
+            self.cache.set(key, draft)
+        return draft
+
+    async def submit(self, job: dict[str, Any], draft: dict[str, Any]) -> dict[str, Any]:
+        """Submit a draft to Reddit and return the created post's details."""
+        post = {
+            "subreddit": job["subreddit"],
+            "title": draft["title"],
+            "content": draft["content"],
+            "flair": job.get("flair") or draft.get("flair"),
+        }
+        # A retried request gets the post its first attempt made; jobs of one batch are told apart by their inputs
+        inputs = {k: v for k, v in job.items() if k != "submit"}
+        scope = "submit:" + hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+        response = self.ledger.get(scope) if self.ledger is not None else None
+        if response is None:
+            async with self.post_pool.checkout() as reddit_tools:
+                if inspect.iscoroutinefunction(reddit_tools.create_post):
+                    response = await reddit_tools.create_post(**post)
+                else:
+                    # PRAW is synchronous, so keep it off the event loop
+                    response = await asyncio.to_thread(reddit_tools.create_post, **post)
+            if self.ledger is not None:
+                self.ledger.record(scope, response)
+
+        # RedditTools reports failures as plain strings rather than raising
+        try:
+            return json.loads(response)
+        except json.JSONDecodeError:
+            raise RuntimeError(response) from None
+
+    async def run(self, job: dict[str, Any]) -> dict[str, Any]:
+        """Run one job through every stage and return a report shaped like skill.yaml's output_format."""
+        timings: dict[str, int] = {}
+        report: dict[str, Any] = {"success": False, "post_details": {"subreddit": job.get("subreddit")}}
+
+        if not job.get("subreddit"):
+            report["error"] = {"stage": "validation", "message": "Job is missing a subreddit"}
+            report["metadata"] = {"post_status": "failed", "stage_timings_ms": timings}
+            return report
+
+        stage = "research"
+        partial = False
+        try:
+            async with enforce(current_deadline(), "Job"):
+                start = time.perf_counter()
+                with timed("stage", "research"):
+                    notes = await self.research(job)
+                timings["research_ms"] = int((time.perf_counter() - start) * 1000)
+                partial = notes.startswith(PARTIAL_RESEARCH_HEADER)
+                report["research_summary"] = {
+                    "sources_used": count_sources(notes),
+                    "key_findings": [
+                        line.lstrip("-*• ").strip()
+                        for line in notes.splitlines()
+                        if line.lstrip().startswith(("-", "*", "•"))
+                    ][:5],
+                    "research_time_ms": timings["research_ms"],
+                }
+
+                stage = "draft"
+                start = time.perf_counter()
+                with timed("stage", "draft"):
+                    draft = await self.draft(job, notes)
+                timings["draft_ms"] = int((time.perf_counter() - start) * 1000)
+                report["post_details"].update({**draft, "post_length": len(draft["content"])})
+
+                status = "draft"
+                if job.get("submit", True):
+                    stage = "post"
+                    start = time.perf_counter()
+                    with timed("stage", "post"):
+                        report["post_details"]["submission"] = await self.submit(job, draft)
+                    timings["post_ms"] = int((time.perf_counter() - start) * 1000)
+                    status = "submitted"
+        except Exception as e:
+            report["error"] = {"stage": stage, "message": f"{type(e).__name__}: {e}"}
+            status = "pending_review" if stage == "post" else "failed"
+        else:
+            report["success"] = True
+
+        report["metadata"] = {"post_status": status, "stage_timings_ms": timings}
+        if partial:
+            report["metadata"]["research_partial"] = True
+        return report
+
+    async def run_many(
+        self, jobs: list[dict[str, Any]], deadline: Deadline | None = None, request_key: str | None = None
+    ) -> AsyncIterator[str]:
+        """Run every job concurrently and yield one JSON line per job as it finishes.
+
+        Every job shares the batch's ``deadline``, and posts under the batch's ``request_key``.
+        """
+
+        async def run_job(index: int, job: dict[str, Any]) -> dict[str, Any]:
+            with deadline_scope(deadline.child() if deadline else None), request_scope(request_key):
+                return {"job_index": index, "topic": job.get("topic"), **await self.run(job)}
+
+        tasks = [asyncio.create_task(run_job(index, job)) for index, job in enumerate(jobs)]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield json.dumps(await finished, default=str) + "\n"
+        finally:
+            # Stop outstanding work if the client goes away mid-stream
+            for task in tasks:
+                task.cancel()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return each stage pool's utilisation."""
+        return {
+            "research": self.research_pool.stats(),
+            "draft": self.draft_pool.stats(),
+            "post": self.post_pool.stats(),
+        }
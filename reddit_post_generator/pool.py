@@ -0,0 +1,164 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Bounded pool of pre-built agents for concurrent runs."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+
+class AgentPoolExhaustedError(RuntimeError):
+    """Raised when no agent can be checked out within the configured limits."""
+
+
+@dataclass
+class PooledAgent:
+    """An agent instance plus its health bookkeeping."""
+
+    agent: Any
+    index: int
+    runs: int = 0
+    consecutive_failures: int = 0
+
+    def is_healthy(self, max_failures: int) -> bool:
+        """Return True while the agent has fewer consecutive failures than allowed."""
+        return self.consecutive_failures < max_failures
+
+
+class AgentPool:
+    """Fixed-size pool of agents with async checkout, back-pressure and health checks.
+
+    Each concurrent request checks out its own agent, so runs never share mutable
+    agent state. When every agent is busy, callers wait up to ``acquire_timeout``
+    seconds; at most ``max_waiting`` callers may wait at once before new requests
+    are rejected. Agents that fail ``max_failures`` runs in a row are rebuilt.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: int = 3,
+        acquire_timeout: float | None = 60.0,
+        max_waiting: int | None = None,
+        max_failures: int = 3,
+    ) -> None:
+        """Configure a pool of ``size`` agents made by ``factory``; call :meth:`start` to build them."""
+        if size < 1:
+            error_msg = f"Agent pool size must be at least 1, got {size}"
+            raise ValueError(error_msg)
+
+        self._factory = factory
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        self.max_waiting = max_waiting
+        self.max_failures = max_failures
+
+        self._queue: asyncio.Queue[PooledAgent] = asyncio.Queue()
+        self._members: list[PooledAgent] = []
+        self._waiting = 0
+        self.replacements = 0
+
+    @classmethod
+    def from_config(cls, factory: Callable[[], Any], config: dict, size: int | None = None) -> "AgentPool":
+        """Build a pool from the ``agent_pool`` section of agent_config.json, optionally with another size."""
+        pool_config = config.get("agent_pool", {})
+        return cls(
+            factory,
+            size=size or pool_config.get("size", 3),
+            acquire_timeout=pool_config.get("acquire_timeout_seconds", 60.0),
+            max_waiting=pool_config.get("max_waiting"),
+            max_failures=pool_config.get("max_failures", 3),
+        )
+
+    def start(self) -> None:
+        """Pre-build every agent in the pool."""
+        for index in range(self.size):
+            member = PooledAgent(agent=self._factory(), index=index)
+            self._members.append(member)
+            self._queue.put_nowait(member)
+
+    @property
+    def available(self) -> int:
+        """Number of idle agents ready for checkout."""
+        return self._queue.qsize()
+
+    @property
+    def in_use(self) -> int:
+        """Number of agents currently checked out."""
+        return len(self._members) - self._queue.qsize()
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers currently waiting for an agent."""
+        return self._waiting
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of pool utilisation and health."""
+        return {
+            "size": self.size,
+            "available": self.available,
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "unhealthy": sum(not m.is_healthy(self.max_failures) for m in self._members),
+            "replacements": self.replacements,
+        }
+
+    async def _acquire(self) -> PooledAgent:
+        """Wait for an idle agent, applying the waiting and timeout limits."""
+        # Fast path: an idle agent is available
+        if not self._queue.empty():
+            return self._queue.get_nowait()
+
+        # Back-pressure: refuse to queue unbounded numbers of callers
+        if self.max_waiting is not None and self._waiting >= self.max_waiting:
+            error_msg = f"Agent pool exhausted: {self._waiting} requests already waiting"
+            raise AgentPoolExhaustedError(error_msg)
+
+        self._waiting += 1
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=self.acquire_timeout)
+        except TimeoutError:
+            error_msg = f"No agent became available within {self.acquire_timeout}s"
+            raise AgentPoolExhaustedError(error_msg) from None
+        finally:
+            self._waiting -= 1
+
+    def _release(self, member: PooledAgent) -> None:
+        """Return an agent to the pool, rebuilding it first if it is unhealthy."""
+        if not member.is_healthy(self.max_failures):
+            print(f"♻️  Rebuilding unhealthy agent #{member.index} after {member.consecutive_failures} failures")
+            try:
+                replacement = PooledAgent(agent=self._factory(), index=member.index)
+            except Exception as e:
+                # Keep the old instance rather than shrinking the pool
+                print(f"⚠️  Could not rebuild agent #{member.index}: {type(e).__name__}")
+            else:
+                self._members[member.index] = replacement
+                member = replacement
+                self.replacements += 1
+
+        self._queue.put_nowait(member)
+
+    @asynccontextmanager
+    async def checkout(self) -> AsyncIterator[Any]:
+        """Check out an agent for the duration of one run."""
+        member = await self._acquire()
+        try:
+            yield member.agent
+        except Exception:
+            member.consecutive_failures += 1
+            raise
+        else:
+            member.consecutive_failures = 0
+        finally:
+            member.runs += 1
+            self._release(member)
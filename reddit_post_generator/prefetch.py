@@ -0,0 +1,208 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Background prefetch that keeps the caches warm for scheduled subreddits and topics."""
+
+import asyncio
+import inspect
+import math
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from reddit_post_generator.cache import SUBREDDIT_FIELD_TTLS
+from reddit_post_generator.research import derive_queries, normalize_query
+
+# Subreddit fields an agent reads before it posts; stats are not needed to write a post
+PREFETCH_FIELDS = ("info", "rules", "flairs", "requirements", "top_posts")
+
+# Builds (research toolkit, Reddit toolkit or None) on the prefetch thread's own event loop
+ToolsFactory = Callable[[], tuple[Any, Any]]
+
+
+@dataclass
+class PrefetchStats:
+    """Refresh counters, reported on /metrics."""
+
+    cycles: int = 0
+    refreshed: int = 0
+    failed: int = 0
+    deferred: int = 0
+
+
+class TrendPrefetcher:
+    """Refreshes cached subreddit data and research for the posting schedule while the server is idle.
+
+    Every ``interval`` seconds it refreshes the entries that are due, least
+    recently refreshed first: subreddit fields shortly before their cache entries
+    would go stale, and topic research likewise, searching again rather than
+    reading the cached results it is renewing.
+    Each cycle spends at most ``max_requests`` upstream requests, and stops as
+    soon as a live request is running or Reddit's remaining quota runs low.
+    """
+
+    def __init__(
+        self,
+        subreddits: list[str],
+        topics: list[str | dict[str, Any]] | None = None,
+        interval: float = 300.0,
+        max_requests: int = 20,
+        requests_per_minute: float = 10,
+        min_ratelimit_remaining: float = 30,
+        field_ttls: dict[str, float] | None = None,
+        refresh_ratio: float = 0.8,
+        topic_refresh: float = 21600,
+        max_queries: int = 5,
+        idle: Callable[[], bool] | None = None,
+    ) -> None:
+        """Prefetch ``subreddits`` and ``topics`` every ``interval`` seconds while ``idle()`` holds."""
+        self.subreddits = subreddits
+        self.topics = [{"topic": topic} if isinstance(topic, str) else topic for topic in topics or []]
+        self.interval = interval
+        self.max_requests = max_requests
+        self.requests_per_minute = requests_per_minute
+        self.min_ratelimit_remaining = min_ratelimit_remaining
+        self.field_ttls = {**SUBREDDIT_FIELD_TTLS, **(field_ttls or {})}
+        self.refresh_ratio = refresh_ratio
+        self.topic_refresh = topic_refresh
+        self.max_queries = max_queries
+        self.idle = idle or (lambda: True)
+        self.stats = PrefetchStats()
+
+        self._refreshed: dict[str, float] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_config(cls, config: dict, idle: Callable[[], bool] | None = None) -> "TrendPrefetcher | None":
+        """Build a prefetcher from the ``prefetch`` section of agent_config.json, or None if disabled."""
+        section = config.get("prefetch", {})
+        if not section.get("enabled", False) or not (section.get("subreddits") or section.get("topics")):
+            return None
+        cache_config = config.get("cache", {})
+        return cls(
+            subreddits=section.get("subreddits", []),
+            topics=section.get("topics", []),
+            interval=section.get("interval_seconds", 300.0),
+            max_requests=section.get("max_requests_per_cycle", 20),
+            requests_per_minute=section.get("requests_per_minute", 10),
+            min_ratelimit_remaining=section.get("min_ratelimit_remaining", 30),
+            field_ttls=cache_config.get("subreddit", {}).get("field_ttl_seconds"),
+            refresh_ratio=cache_config.get("subreddit", {}).get("refresh_ratio", 0.8),
+            topic_refresh=cache_config.get("research", {}).get("ttl_seconds") or 21600,
+            max_queries=config.get("research", {}).get("max_queries", 5),
+            idle=idle,
+        )
+
+    def due(self, now: float | None = None) -> list[tuple[str, dict[str, Any]]]:
+        """Entries due for a refresh as (key, target) pairs, least recently refreshed first."""
+        now = time.monotonic() if now is None else now
+        entries = [
+            (
+                f"{field}:{subreddit.lower()}",
+                self.field_ttls[field] * self.refresh_ratio,
+                {"subreddit": subreddit, "field": field},
+            )
+            for subreddit in self.subreddits
+            for field in PREFETCH_FIELDS
+        ]
+        topic_period = self.topic_refresh * self.refresh_ratio
+        entries += [(f"topic:{normalize_query(topic['topic'])}", topic_period, topic) for topic in self.topics]
+
+        due = [
+            (self._refreshed.get(key, -math.inf), key, target)
+            for key, period, target in entries
+            if now - self._refreshed.get(key, -math.inf) >= period
+        ]
+        return [(key, target) for _, key, target in sorted(due, key=lambda entry: entry[0])]
+
+    def cost(self, target: dict[str, Any]) -> int:
+        """Upstream requests one refresh can make: one per subreddit field, every search for a topic."""
+        if "field" in target:
+            return 1
+        return len(derive_queries(target["topic"], target.get("keywords"), self.max_queries)) + 1
+
+    def _quota_low(self, reddit_tools: Any) -> bool:
+        client = getattr(reddit_tools, "client", None)
+        remaining = getattr(getattr(client, "stats", None), "ratelimit_remaining", None)
+        return remaining is not None and remaining < self.min_ratelimit_remaining
+
+    @staticmethod
+    async def _call(function: Callable[..., Any], *args: Any) -> Any:
+        if inspect.iscoroutinefunction(function):
+            return await function(*args)
+        return await asyncio.to_thread(function, *args)
+
+    async def _refresh(self, target: dict[str, Any], research_tools: Any, reddit_tools: Any) -> None:
+        if "field" in target:
+            await self._call(reddit_tools._refresh, target["field"], target["subreddit"])
+            return
+        # A cached search would hand back the entry being refreshed, so every search runs again
+        result = await asyncio.to_thread(research_tools.refresh_topic, target["topic"], target.get("keywords"))
+        if result.startswith("Error"):
+            raise RuntimeError(result)
+
+    async def run_cycle(self, research_tools: Any, reddit_tools: Any) -> int:
+        """Refresh due entries while the server is idle and within budget; return the requests spent."""
+        spent = 0
+        for key, target in self.due():
+            if not self.idle():
+                self.stats.deferred += 1
+                break
+            cost = self.cost(target)
+            if spent + cost > self.max_requests:
+                continue
+            if "field" in target and (reddit_tools is None or self._quota_low(reddit_tools)):
+                continue
+
+            spent += cost
+            try:
+                await self._refresh(target, research_tools, reddit_tools)
+            except Exception as e:
+                self.stats.failed += 1
+                print(f"⚠️  Prefetch of {key} failed: {type(e).__name__}: {e}")
+            else:
+                self.stats.refreshed += 1
+                self._refreshed[key] = time.monotonic()
+        self.stats.cycles += 1
+        return spent
+
+    async def run(self, create_tools: ToolsFactory) -> None:
+        """Run cycles every ``interval`` seconds until stopped."""
+        research_tools, reddit_tools = create_tools()
+        try:
+            while not self._stop.is_set():
+                await self.run_cycle(research_tools, reddit_tools)
+                await asyncio.to_thread(self._stop.wait, self.interval)
+        finally:
+            client = getattr(reddit_tools, "client", None)
+            if client is not None and hasattr(client, "aclose"):
+                await client.aclose()
+
+    def _main(self, create_tools: ToolsFactory) -> None:
+        try:
+            asyncio.run(self.run(create_tools))
+        except Exception as e:
+            print(f"⚠️  Prefetcher stopped: {type(e).__name__}: {e}")
+
+    def start(self, create_tools: ToolsFactory) -> None:
+        """Start prefetching on a daemon thread with its own event loop, unless it is already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._main, args=(create_tools,), name="prefetch", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop after the refresh in progress, waiting up to ``timeout`` seconds."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
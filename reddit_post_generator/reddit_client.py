@@ -0,0 +1,379 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Async Reddit API client with a shared OAuth token, connection pool and rate limiter."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from reddit_post_generator.cache import DEFAULT_CACHE_PATH
+
+REDDIT_AUTH_URL = "https://www.reddit.com/api/v1/access_token"
+REDDIT_API_URL = "https://oauth.reddit.com"
+
+# Refresh the OAuth token this long before Reddit says it expires
+TOKEN_REFRESH_MARGIN = 60
+
+
+class TokenBucket:
+    """Async token bucket that paces every Reddit call in the process.
+
+    Tokens refill at ``rate`` per second up to ``capacity``. Reddit's
+    ``X-Ratelimit-*`` headers lower the refill rate to what is left of the
+    current window, and an exhausted window pauses callers until it resets.
+    """
+
+    _clock = staticmethod(time.monotonic)
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Start full, with ``capacity`` tokens refilling at ``rate`` per second."""
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = self._clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _take(self) -> float:
+        """Take a token if one is available; otherwise return how long to wait for one."""
+        now = self._clock()
+        if self._paused_until > now:
+            return self._paused_until - now
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    async def acquire(self) -> None:
+        """Wait until a call may be made; waiters are served in arrival order."""
+        async with self._lock:
+            while (wait := await self.apply(self._take)) > 0:
+                await asyncio.sleep(wait)
+
+    async def apply(self, method: Callable[..., Any], *args: Any) -> Any:
+        """Call one of the bucket's methods from async code."""
+        return method(*args)
+
+    def _pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+        self.tokens = 0
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the next ``seconds``."""
+        self._pause(seconds)
+
+    def update(self, remaining: float, reset_seconds: float) -> None:
+        """Spread the calls Reddit still allows evenly over the rest of its window."""
+        if remaining < 1:
+            self._pause(reset_seconds)
+            return
+        self._refill()
+        self.tokens = min(self.tokens, remaining)
+        self.rate = min(self.max_rate, remaining / max(reset_seconds, 1))
+
+
+class SharedTokenBucket(TokenBucket):
+    """Token bucket kept in SQLite so every worker process draws from one Reddit budget.
+
+    Each take, pause and update loads the bucket, applies the usual logic and
+    writes it back in one ``BEGIN IMMEDIATE`` transaction. Wall-clock time is
+    used because monotonic clocks aren't comparable across processes.
+    """
+
+    _clock = staticmethod(time.time)
+
+    def __init__(
+        self, rate: float, capacity: float, path: str | Path = DEFAULT_CACHE_PATH, name: str = "reddit"
+    ) -> None:
+        """Open, or join, the bucket ``name`` stored in the SQLite file at ``path``."""
+        super().__init__(rate, capacity)
+        self.path = Path(path)
+        self.name = name
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                name TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                rate REAL NOT NULL,
+                updated REAL NOT NULL,
+                paused_until REAL NOT NULL
+            )
+            """
+        )
+        # Workers starting later join the existing bucket instead of refilling it
+        self._conn.execute(
+            "INSERT INTO rate_limits (name, tokens, rate, updated, paused_until) VALUES (?, ?, ?, ?, 0) "
+            "ON CONFLICT (name) DO UPDATE SET tokens = MIN(tokens, excluded.tokens), rate = MIN(rate, excluded.rate)",
+            (name, capacity, rate, self._updated),
+        )
+
+    @contextmanager
+    def _shared(self) -> Iterator[None]:
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.tokens, self.rate, self._updated, self._paused_until = self._conn.execute(
+                    "SELECT tokens, rate, updated, paused_until FROM rate_limits WHERE name = ?", (self.name,)
+                ).fetchone()
+                yield
+                self._conn.execute(
+                    "UPDATE rate_limits SET tokens = ?, rate = ?, updated = ?, paused_until = ? WHERE name = ?",
+                    (self.tokens, self.rate, self._updated, self._paused_until, self.name),
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    async def apply(self, method: Callable[..., Any], *args: Any) -> Any:
+        """Call one of the bucket's methods in a thread, since its transaction may wait on other workers."""
+        return await asyncio.to_thread(method, *args)
+
+    def _take(self) -> float:
+        with self._shared():
+            return super()._take()
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens to every worker for the next ``seconds``."""
+        with self._shared():
+            super().pause(seconds)
+
+    def update(self, remaining: float, reset_seconds: float) -> None:
+        """Spread the calls Reddit still allows evenly over the rest of its window, for all workers."""
+        with self._shared():
+            super().update(remaining, reset_seconds)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._db_lock:
+            self._conn.close()
+
+
+@dataclass
+class RedditClientStats:
+    """Counters reported on /metrics."""
+
+    requests: int = 0
+    token_refreshes: int = 0
+    throttled: int = 0
+    ratelimit_remaining: float | None = None
+
+
+class AsyncRedditClient:
+    """Reddit OAuth API client shared by every agent and pipeline stage.
+
+    One pooled ``httpx.AsyncClient`` and one OAuth token serve all concurrent
+    runs, and every request passes through a shared :class:`TokenBucket`, so
+    load from many runs is paced instead of stalling on 429 responses.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        username: str | None = None,
+        password: str | None = None,
+        user_agent: str = "RedditPostGenerator/1.0",
+        requests_per_minute: float = 100,
+        max_connections: int = 10,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        auth_url: str = REDDIT_AUTH_URL,
+        api_url: str = REDDIT_API_URL,
+        bucket: TokenBucket | None = None,
+    ) -> None:
+        """Set up the client; pass ``bucket`` to share a rate limiter, e.g. across workers."""
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.username = username
+        self.password = password
+        self.user_agent = user_agent
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.auth_url = auth_url
+        self.api_url = api_url.rstrip("/")
+        # A small burst keeps single runs snappy without exceeding the per-minute quota
+        self.bucket = bucket or TokenBucket(requests_per_minute / 60, capacity=max(1.0, requests_per_minute / 10))
+        self.stats = RedditClientStats()
+
+        self._http: httpx.AsyncClient | None = None
+        self._token: str | None = None
+        self._token_expires = 0.0
+        self._token_lock = asyncio.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict, **credentials: str) -> "AsyncRedditClient":
+        """Build a client from the ``reddit`` section of agent_config.json.
+
+        With several workers the rate limiter lives in the shared cache database,
+        so all of them together stay within ``requests_per_minute``.
+        """
+        section = config.get("reddit", {})
+        bucket = None
+        if config.get("workers", 1) > 1:
+            requests_per_minute = section.get("requests_per_minute", 100)
+            bucket = SharedTokenBucket(
+                requests_per_minute / 60,
+                capacity=max(1.0, requests_per_minute / 10),
+                path=config.get("cache", {}).get("path", DEFAULT_CACHE_PATH),
+            )
+        return cls(
+            **credentials,
+            requests_per_minute=section.get("requests_per_minute", 100),
+            max_connections=section.get("max_connections", 10),
+            timeout=section.get("timeout_seconds", 30.0),
+            max_retries=section.get("max_retries", 3),
+            auth_url=section.get("auth_url", REDDIT_AUTH_URL),
+            api_url=section.get("api_url", REDDIT_API_URL),
+            bucket=bucket,
+        )
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """The pooled HTTP client, created on first use inside the server's event loop."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                headers={"User-Agent": self.user_agent},
+                limits=httpx.Limits(max_connections=self.max_connections),
+                timeout=self.timeout,
+            )
+        return self._http
+
+    async def authenticate(self) -> str:
+        """Return a valid OAuth token, fetching a new one only when it is about to expire."""
+        async with self._token_lock:
+            if self._token is not None and time.monotonic() < self._token_expires - TOKEN_REFRESH_MARGIN:
+                return self._token
+
+            if self.username and self.password:
+                data = {"grant_type": "password", "username": self.username, "password": self.password}
+            else:
+                data = {"grant_type": "client_credentials"}
+            response = await self.http.post(self.auth_url, data=data, auth=(self.client_id, self.client_secret))
+            response.raise_for_status()
+            payload = response.json()
+            if "access_token" not in payload:
+                error_msg = f"Reddit authentication failed: {payload.get('error', payload)}"
+                raise RuntimeError(error_msg)
+
+            self._token = payload["access_token"]
+            self._token_expires = time.monotonic() + payload.get("expires_in", 3600)
+            self.stats.token_refreshes += 1
+            return self._token
+
+    async def _read_rate_limit(self, headers: httpx.Headers) -> None:
+        remaining = headers.get("X-Ratelimit-Remaining")
+        reset = headers.get("X-Ratelimit-Reset")
+        if remaining is None or reset is None:
+            return
+        self.stats.ratelimit_remaining = float(remaining)
+        await self.bucket.apply(self.bucket.update, float(remaining), float(reset))
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Call the OAuth API, retrying after 401s (stale token) and 429s (rate limited)."""
+        for attempt in range(self.max_retries + 1):
+            await self.bucket.acquire()
+            token = await self.authenticate()
+            response = await self.http.request(
+                method, f"{self.api_url}{path}", headers={"Authorization": f"bearer {token}"}, **kwargs
+            )
+            self.stats.requests += 1
+            await self._read_rate_limit(response.headers)
+
+            retry = attempt < self.max_retries
+            if response.status_code == 401 and retry:
+                self._token = None
+                continue
+            if response.status_code == 429 and retry:
+                self.stats.throttled += 1
+                pause = float(response.headers.get("Retry-After") or self._reset_seconds(response))
+                await self.bucket.apply(self.bucket.pause, pause)
+                continue
+            response.raise_for_status()
+            return response.json()
+
+        error_msg = f"Reddit request {method} {path} failed after {self.max_retries} retries"
+        raise RuntimeError(error_msg)
+
+    @staticmethod
+    def _reset_seconds(response: httpx.Response) -> float:
+        return float(response.headers.get("X-Ratelimit-Reset") or 1)
+
+    async def about(self, subreddit: str) -> dict[str, Any]:
+        """Subreddit metadata (``/r/{name}/about``)."""
+        return (await self.request("GET", f"/r/{subreddit}/about"))["data"]
+
+    async def rules(self, subreddit: str) -> list[dict[str, Any]]:
+        """Get a subreddit's posting rules from ``/r/{name}/about/rules``."""
+        return (await self.request("GET", f"/r/{subreddit}/about/rules"))["rules"]
+
+    async def link_flairs(self, subreddit: str) -> list[dict[str, Any]]:
+        """Link flair templates users may pick when posting."""
+        return await self.request("GET", f"/r/{subreddit}/api/link_flair_v2")
+
+    async def top_posts(self, subreddit: str, time_filter: str = "week", limit: int = 10) -> list[dict[str, Any]]:
+        """Top posts of a period (``/r/{name}/top``)."""
+        listing = await self.request("GET", f"/r/{subreddit}/top", params={"t": time_filter, "limit": limit})
+        return [child["data"] for child in listing["data"]["children"]]
+
+    async def post_requirements(self, subreddit: str) -> dict[str, Any]:
+        """Title and body requirements for new posts."""
+        return await self.request("GET", f"/api/v1/{subreddit}/post_requirements")
+
+    async def submit(
+        self,
+        subreddit: str,
+        title: str,
+        content: str,
+        is_self: bool = True,
+        flair_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Create a post and return its id, url and permalink."""
+        data = {"sr": subreddit, "title": title, "api_type": "json", "kind": "self" if is_self else "link"}
+        data["text" if is_self else "url"] = content
+        if flair_id:
+            data["flair_id"] = flair_id
+
+        result = (await self.request("POST", "/api/submit", data=data))["json"]
+        if result.get("errors"):
+            error_msg = "; ".join(" ".join(str(part) for part in error) for error in result["errors"])
+            raise RuntimeError(error_msg)
+        post = result["data"]
+        return {"id": post.get("id"), "url": post.get("url"), "permalink": urlsplit(post.get("url", "")).path}
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        if isinstance(self.bucket, SharedTokenBucket):
+            self.bucket.close()
@@ -0,0 +1,162 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Query expansion, deduplication and ranking for multi-query web research."""
+
+import re
+from datetime import UTC, datetime
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src", "source", "igshid"}
+
+# Rough authority weights for well-known sources; unknown domains score 0.3
+AUTHORITY_DOMAINS = {
+    "wikipedia.org": 0.9,
+    "arxiv.org": 0.9,
+    "nature.com": 0.9,
+    "science.org": 0.9,
+    "github.com": 0.8,
+    "reuters.com": 0.8,
+    "apnews.com": 0.8,
+    "bbc.co.uk": 0.8,
+    "bbc.com": 0.8,
+    "nytimes.com": 0.7,
+    "theverge.com": 0.6,
+    "arstechnica.com": 0.6,
+    "techcrunch.com": 0.6,
+    "stackoverflow.com": 0.6,
+    "medium.com": 0.3,
+    "quora.com": 0.1,
+    "pinterest.com": 0.0,
+}
+AUTHORITY_SUFFIXES = {".gov": 1.0, ".edu": 0.9, ".int": 0.8}
+
+# Snippets sharing this fraction of their words are treated as the same story
+NEAR_DUPLICATE_SIMILARITY = 0.8
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query so trivially different spellings share a cache entry."""
+    return " ".join(query.lower().split())
+
+
+def derive_queries(topic: str, keywords: list[str] | None = None, max_queries: int = 5) -> list[str]:
+    """Build the search queries for a topic: the topic itself, then topic plus each keyword."""
+    queries = [" ".join(topic.split())]
+    for keyword in keywords or []:
+        query = f"{queries[0]} {' '.join(keyword.split())}".strip()
+        if keyword.strip() and query.lower() not in {q.lower() for q in queries}:
+            queries.append(query)
+    return queries[:max_queries]
+
+
+def domain(url: str) -> str:
+    """Return the host of a URL without a leading ``www.``."""
+    host = urlsplit(url).netloc.lower().split("@")[-1].split(":")[0]
+    return host.removeprefix("www.").removeprefix("m.")
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL so the same page found by different queries compares equal."""
+    parts = urlsplit(url.strip())
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ]
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("https", domain(url), path, urlencode(sorted(query)), ""))
+
+
+def _words(text: str) -> set[str]:
+    return set(_WORD_RE.findall(text.lower()))
+
+
+def is_near_duplicate(snippet: str, seen: list[set[str]]) -> bool:
+    """Return True if the snippet's words mostly overlap with an already kept snippet."""
+    words = _words(snippet)
+    if len(words) < 5:
+        return False
+    return any(len(words & other) / len(words | other) >= NEAR_DUPLICATE_SIMILARITY for other in seen)
+
+
+def authority(url: str) -> float:
+    """Score a source's authority between 0 and 1 from its domain."""
+    host = domain(url)
+    for suffix, score in AUTHORITY_SUFFIXES.items():
+        if host.endswith(suffix):
+            return score
+    for known, score in AUTHORITY_DOMAINS.items():
+        if host == known or host.endswith(f".{known}"):
+            return score
+    return 0.3
+
+
+def recency(date: str | None, now: datetime | None = None) -> float:
+    """Score between 0 and 1 that halves roughly every month; undated results score 0.3."""
+    if not date:
+        return 0.3
+    try:
+        published = datetime.fromisoformat(date.replace("Z", "+00:00"))
+    except ValueError:
+        return 0.3
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=UTC)
+    age_days = max(0.0, ((now or datetime.now(UTC)) - published).total_seconds() / 86400)
+    return 1 / (1 + age_days / 30)
+
+
+def rank_results(
+    results: list[dict[str, Any]], max_sources: int = 10, snippet_chars: int = 300
+) -> list[dict[str, Any]]:
+    """Dedupe results by canonical URL and snippet, then return the top sources.
+
+    Results use the DDGS fields (``title``, ``href`` or ``url``, ``body``, optional
+    ``date`` and ``source``). Sources found by several queries rank higher, then
+    by authority and recency.
+    """
+    merged: dict[str, dict[str, Any]] = {}
+    for result in results:
+        url = result.get("href") or result.get("url")
+        if not url:
+            continue
+        key = canonical_url(url)
+        if key in merged:
+            merged[key]["hits"] += 1
+            merged[key]["date"] = merged[key]["date"] or result.get("date")
+            continue
+        merged[key] = {
+            "title": result.get("title", ""),
+            "url": url,
+            "snippet": " ".join(str(result.get("body") or "").split()),
+            "date": result.get("date"),
+            "source": result.get("source") or domain(url),
+            "hits": 1,
+        }
+
+    def score(item: dict[str, Any]) -> float:
+        return 0.2 * min(item["hits"], 3) + authority(item["url"]) + recency(item["date"])
+
+    ranked: list[dict[str, Any]] = []
+    seen: list[set[str]] = []
+    for item in sorted(merged.values(), key=score, reverse=True):
+        if is_near_duplicate(item["snippet"], seen):
+            continue
+        seen.append(_words(item["snippet"]))
+        snippet = item["snippet"]
+        if len(snippet) > snippet_chars:
+            snippet = snippet[:snippet_chars].rstrip() + "…"
+        ranked.append({**item, "snippet": snippet, "score": round(score(item), 3)})
+        if len(ranked) >= max_sources:
+            break
+    return ranked
@@ -0,0 +1,151 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Project run results down to the reply bindu stores with each task."""
+
+import contextlib
+import json
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from reddit_post_generator.batch import result_text
+from reddit_post_generator.compaction import fit_json
+
+# content: the final reply only; output_format: skill.yaml's report as JSON; raw: the run output untouched
+PROJECTIONS = ("content", "output_format", "raw")
+
+# Fields of the agent's markdown report (see expected_output in main.create_agent)
+_REPORT_FIELD_RE = re.compile(r"\*\*(Subreddit|Title|Sources Researched|Key Topics Covered|Post Length):\*\*\s*(.+)")
+_DIGITS_RE = re.compile(r"\d+")
+
+
+def _json_object(text: str) -> dict[str, Any] | None:
+    stripped = text.strip()
+    if stripped.startswith("{"):
+        with contextlib.suppress(json.JSONDecodeError):
+            payload = json.loads(stripped)
+            return payload if isinstance(payload, dict) else None
+    return None
+
+
+def _number(value: str | None) -> int:
+    match = _DIGITS_RE.search((value or "").replace(",", ""))
+    return int(match.group(0)) if match else 0
+
+
+def _posted(result: Any) -> tuple[dict[str, Any], dict[str, Any]] | None:
+    """Arguments and response of the run's last successful create_post call."""
+    for tool in reversed(getattr(result, "tools", None) or []):
+        if getattr(tool, "tool_name", None) != "create_post":
+            continue
+        payload = _json_object(str(getattr(tool, "result", None) or ""))
+        if payload is not None and not payload.get("error"):
+            return getattr(tool, "tool_args", None) or {}, payload.get("post", payload)
+    return None
+
+
+def post_report(result: Any, query: str, processing_time_ms: int) -> dict[str, Any]:
+    """Shape an agent run's result like skill.yaml's ``output_format``.
+
+    Pipeline, draft-only and job replies are already shaped and pass through.
+    """
+    text = result_text(result)
+    shaped = _json_object(text)
+    if shaped is not None and "success" in shaped:
+        return shaped
+
+    metadata = {"query": query, "processing_time_ms": processing_time_ms}
+    fields = {name: value.strip() for name, value in _REPORT_FIELD_RE.findall(text)}
+    posted = _posted(result)
+    if posted is None and not fields:
+        # e.g. a run cut short by its deadline returns plain text
+        return {"success": False, "error": {"stage": "post", "message": text}, "metadata": metadata}
+
+    arguments, post = posted or ({}, {})
+    content = str(arguments.get("content", ""))
+    topics = [topic.strip() for topic in fields.get("Key Topics Covered", "").split(",") if topic.strip()]
+    return {
+        "success": posted is not None,
+        "post_details": {
+            "subreddit": arguments.get("subreddit") or fields.get("Subreddit", "").removeprefix("r/"),
+            "title": arguments.get("title") or fields.get("Title"),
+            "content": content,
+            "flair": arguments.get("flair"),
+            "post_length": len(content) or _number(fields.get("Post Length")),
+            "url": post.get("url") or post.get("permalink"),
+        },
+        "research_summary": {
+            "sources_used": _number(fields.get("Sources Researched")),
+            "key_findings": topics[:5],
+        },
+        "metadata": {**metadata, "post_status": "submitted" if posted is not None else "draft"},
+    }
+
+
+def cap_text(text: str, max_chars: int) -> str:
+    """Cut text to max_chars; JSON replies are shrunk with :func:`fit_json` so they stay valid."""
+    if len(text) <= max_chars:
+        return text
+    stripped = text.strip()
+    if stripped.startswith(("{", "[")):
+        with contextlib.suppress(json.JSONDecodeError):
+            return fit_json(json.loads(stripped), max_chars)
+    return text[:max_chars].rstrip() + "…"
+
+
+@dataclass
+class ResultStats:
+    """Reply size accounting, reported on /metrics."""
+
+    results: int = 0
+    original_chars: int = 0
+    returned_chars: int = 0
+    truncated: int = 0
+
+
+class ResultProjector:
+    """Turns a run's output into the reply bindu keeps with the task.
+
+    bindu stores every reply twice, as the task's last message and as its
+    artifact, for as long as the task is kept, so replies are cut to
+    ``max_chars``. Streamed replies (batches, job watches) pass through as is.
+    """
+
+    def __init__(self, projection: str = "content", max_chars: int | None = 20000) -> None:
+        """Keep the ``projection`` of each reply, cut to ``max_chars`` (None keeps it whole)."""
+        if projection not in PROJECTIONS:
+            error_msg = f"Unknown result projection '{projection}'; use one of {', '.join(PROJECTIONS)}"
+            raise ValueError(error_msg)
+        self.projection = projection
+        self.max_chars = max_chars
+        self.stats = ResultStats()
+
+    @classmethod
+    def from_config(cls, config: dict) -> "ResultProjector":
+        """Build a projector from the ``results`` section of agent_config.json."""
+        section = config.get("results", {})
+        return cls(section.get("projection", "content"), section.get("max_result_chars", 20000))
+
+    def project(self, result: Any, query: str = "", processing_time_ms: int = 0) -> Any:
+        """Return the reply to store for one run's result."""
+        if self.projection == "raw" or hasattr(result, "__aiter__"):
+            return result
+
+        if self.projection == "output_format":
+            text = json.dumps(post_report(result, query, processing_time_ms), default=str)
+        else:
+            text = result_text(result)
+        reply = cap_text(text, self.max_chars) if self.max_chars else text
+
+        self.stats.results += 1
+        self.stats.original_chars += len(text)
+        self.stats.returned_chars += len(reply)
+        self.stats.truncated += len(reply) < len(text)
+        return reply
@@ -0,0 +1,124 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Bounded in-memory task storage: finished tasks are evicted by age and count."""
+
+import contextlib
+import importlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from bindu.server.storage.memory_storage import InMemoryStorage
+from bindu.settings import app_settings
+
+
+@dataclass
+class RetentionStats:
+    """Tasks held and evicted, reported on /metrics."""
+
+    stored: int = 0
+    evicted: int = 0
+
+
+class BoundedMemoryStorage(InMemoryStorage):
+    """bindu's in-memory storage without its unbounded growth.
+
+    Upstream keeps every task, with its history and artifacts, for the life of
+    the process. Here finished tasks older than ``max_age_seconds`` are dropped,
+    and past ``max_tasks`` the oldest finished tasks go first. Tasks that are
+    still running or waiting for input are never evicted.
+    """
+
+    def __init__(
+        self,
+        max_tasks: int | None = 1000,
+        max_age_seconds: float | None = 3600,
+        stats: RetentionStats | None = None,
+    ) -> None:
+        """Keep at most ``max_tasks`` tasks, dropping finished ones after ``max_age_seconds``."""
+        super().__init__()
+        self.max_tasks = max_tasks
+        self.max_age_seconds = max_age_seconds
+        self.stats = stats or RetentionStats()
+
+    def evict(self, now: datetime | None = None) -> int:
+        """Drop stale finished tasks and return how many were dropped."""
+        finished = [
+            task_id
+            for task_id, task in self.tasks.items()
+            if task["status"]["state"] in app_settings.agent.terminal_states
+        ]
+        stale: list[UUID] = []
+        if self.max_age_seconds is not None:
+            # Status timestamps are UTC ISO strings, so they compare in time order
+            cutoff = ((now or datetime.now(UTC)) - timedelta(seconds=self.max_age_seconds)).isoformat()
+            stale = [task_id for task_id in finished if self.tasks[task_id]["status"]["timestamp"] < cutoff]
+        if self.max_tasks is not None:
+            # Tasks are kept in creation order, so the first finished ones are the oldest
+            excess = len(self.tasks) - len(stale) - self.max_tasks
+            if excess > 0:
+                evicting = set(stale)
+                stale += [task_id for task_id in finished if task_id not in evicting][:excess]
+
+        for task_id in stale:
+            self._forget(task_id)
+        self.stats.evicted += len(stale)
+        self.stats.stored = len(self.tasks)
+        return len(stale)
+
+    def _forget(self, task_id: UUID) -> None:
+        task = self.tasks.pop(task_id)
+        self.task_feedback.pop(task_id, None)
+        self._webhook_configs.pop(task_id, None)
+        context_id = task["context_id"]
+        context = self.contexts.get(context_id)
+        if context is not None:
+            with contextlib.suppress(ValueError):
+                context.remove(task_id)
+            if not context:
+                del self.contexts[context_id]
+
+    async def submit_task(self, context_id: UUID, message: Any) -> Any:
+        """Evict stale tasks, then create or continue a task as upstream does."""
+        self.evict()
+        task = await super().submit_task(context_id, message)
+        self.stats.stored = len(self.tasks)
+        return task
+
+    async def update_task(self, task_id: UUID, state: Any, *args: Any, **kwargs: Any) -> Any:
+        """Update a task as upstream does; a task that just finished may push an older one out."""
+        task = await super().update_task(task_id, state, *args, **kwargs)
+        if state in app_settings.agent.terminal_states:
+            self.evict()
+        return task
+
+
+@contextmanager
+def retaining_tasks(max_tasks: int | None, max_age_seconds: float | None) -> Iterator[RetentionStats]:
+    """Make bindu's memory storage backend a :class:`BoundedMemoryStorage` inside this block.
+
+    bindu's lifespan builds its storage with ``create_storage()``, which looks
+    up ``InMemoryStorage`` in its module, so that name is swapped here.
+    """
+    factory = importlib.import_module("bindu.server.storage.factory")
+    stats = RetentionStats()
+
+    def bounded_storage() -> BoundedMemoryStorage:
+        return BoundedMemoryStorage(max_tasks, max_age_seconds, stats)
+
+    original = factory.InMemoryStorage
+    factory.InMemoryStorage = bounded_storage
+    try:
+        yield stats
+    finally:
+        factory.InMemoryStorage = original
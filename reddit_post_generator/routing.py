@@ -0,0 +1,112 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Route each request to a fast or a large model by how complex the post is."""
+
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from reddit_post_generator.batch import parse_job
+from reddit_post_generator.pool import AgentPool
+
+# Complexity points per value of the documented input fields; unknown or missing values score 1
+DEFAULT_COMPLEXITY = {
+    "post_type": {"question": 0, "discussion": 0, "news": 1, "informative": 1, "tutorial": 2},
+    "research_depth": {"quick": 0, "standard": 1, "comprehensive": 2, "deep": 2},
+    "post_length": {"short": 0, "medium": 1, "long": 2},
+}
+
+FAST_ROUTE = "fast"
+LARGE_ROUTE = "large"
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+def request_fields(messages: list[dict[str, str]], complexity: dict[str, dict[str, int]]) -> dict[str, str]:
+    """Return post_type, research_depth and post_length for a request.
+
+    Structured requests state them; for plain text, a field takes the first of
+    its known values mentioned in the latest user message ("a short discussion
+    prompt" → post_length short, post_type discussion).
+    """
+    job = parse_job(messages)
+    if job is not None:
+        return {field: str(job[field]).lower() for field in complexity if job.get(field)}
+
+    user_messages = [m for m in messages if m.get("role") == "user"]
+    words = set(_WORD_RE.findall(str(user_messages[-1].get("content", "")).lower())) if user_messages else set()
+    fields = {}
+    for field, values in complexity.items():
+        mentioned = [value for value in values if value in words]
+        if mentioned:
+            fields[field] = mentioned[0]
+    return fields
+
+
+def complexity_score(fields: dict[str, str], complexity: dict[str, dict[str, int]]) -> int:
+    """Sum the complexity points of a request's fields."""
+    return sum(values.get(fields.get(field, ""), 1) for field, values in complexity.items())
+
+
+@dataclass
+class RouteStats:
+    """Requests, tokens and estimated spend for one route, reported on /metrics."""
+
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+
+
+class ModelRouter:
+    """Dispatches each request to the agent pool of its route.
+
+    Requests scoring at most ``fast_max_score`` go to the ``fast`` route (a small,
+    quick model); everything else goes to ``large``. Each route has its own pool,
+    so short prompts never queue behind long researched posts.
+    """
+
+    def __init__(
+        self,
+        pools: dict[str, AgentPool],
+        complexity: dict[str, dict[str, int]] | None = None,
+        fast_max_score: int = 1,
+        prices: dict[str, tuple[float, float]] | None = None,
+    ) -> None:
+        """Route requests to ``pools`` by complexity score, pricing tokens with ``prices``."""
+        if LARGE_ROUTE not in pools:
+            error_msg = f"Model routing needs a {LARGE_ROUTE!r} route, got {sorted(pools)}"
+            raise ValueError(error_msg)
+
+        self.pools = pools
+        self.complexity = complexity or DEFAULT_COMPLEXITY
+        self.fast_max_score = fast_max_score
+        # USD per million input and output tokens, by route
+        self.prices = prices or {}
+        self.stats = {route: RouteStats() for route in pools}
+
+    def classify(self, messages: list[dict[str, str]]) -> str:
+        """Return the route for a request."""
+        score = complexity_score(request_fields(messages, self.complexity), self.complexity)
+        if score <= self.fast_max_score and FAST_ROUTE in self.pools:
+            return FAST_ROUTE
+        return LARGE_ROUTE
+
+    def record(self, route: str, result: Any) -> None:
+        """Add one finished run's token usage to its route."""
+        stats = self.stats[route]
+        stats.requests += 1
+        metrics = getattr(result, "metrics", None)
+        input_tokens = getattr(metrics, "input_tokens", 0) or 0
+        output_tokens = getattr(metrics, "output_tokens", 0) or 0
+        stats.input_tokens += input_tokens
+        stats.output_tokens += output_tokens
+        input_price, output_price = self.prices.get(route, (0.0, 0.0))
+        stats.cost_usd += (input_tokens * input_price + output_tokens * output_price) / 1_000_000
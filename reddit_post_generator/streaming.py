@@ -0,0 +1,110 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Turn agno run events into a client-facing stream of tokens and phase events."""
+
+import json
+import re
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from agno.run.agent import RunEvent
+
+from reddit_post_generator.deadlines import Deadline, summarize_findings
+
+SEARCH_TOOLS = {"web_search", "search_news", "research_topic"}
+SUBREDDIT_TOOLS = {"get_subreddit_info", "get_subreddit_rules", "get_subreddit_stats"}
+SUBMIT_TOOLS = {"create_post"}
+
+_URL_RE = re.compile(r"https?://[^\s)\]>\"']+")
+
+
+def count_sources(text: str) -> int:
+    """Count the distinct URLs cited in a block of text."""
+    return len(set(_URL_RE.findall(text)))
+
+
+def stream_event(event: str, **data: Any) -> str:
+    """Encode one stream event as a JSON line."""
+    return json.dumps({"event": event, **data}, default=str) + "\n"
+
+
+def _tool_started(name: str | None, args: dict[str, Any]) -> list[str]:
+    if name in SEARCH_TOOLS:
+        return [stream_event("search_started", query=args.get("query") or args.get("topic"))]
+    if name in SUBREDDIT_TOOLS:
+        return [stream_event("subreddit_lookup", subreddit=args.get("subreddit_name") or args.get("subreddit"))]
+    if name in SUBMIT_TOOLS:
+        # The agent only calls create_post once the draft is final
+        return [stream_event("draft_ready", subreddit=args.get("subreddit"), title=args.get("title"))]
+    return []
+
+
+def _tool_completed(name: str | None, result: str) -> list[str]:
+    if name in SEARCH_TOOLS:
+        return [stream_event("sources_found", count=count_sources(result))]
+    if name in SUBMIT_TOOLS:
+        try:
+            post = json.loads(result)
+        except json.JSONDecodeError:
+            # RedditTools reports failures as plain strings
+            return [stream_event("submit_failed", error=result)]
+        # create_post wraps the submission details as {"post": {...}}
+        post = post.get("post", post) if isinstance(post, dict) else {}
+        return [stream_event("submitted", permalink=post.get("permalink"), url=post.get("url"))]
+    return []
+
+
+def translate(run_event: Any) -> list[str]:
+    """Map one agno run event to zero or more stream events."""
+    kind = getattr(run_event, "event", None)
+    tool = getattr(run_event, "tool", None)
+
+    if kind == RunEvent.run_content.value:
+        content = getattr(run_event, "content", None)
+        return [stream_event("token", content=content)] if isinstance(content, str) and content else []
+    if kind == RunEvent.tool_call_started.value:
+        return _tool_started(getattr(tool, "tool_name", None), getattr(tool, "tool_args", None) or {})
+    if kind == RunEvent.tool_call_completed.value:
+        result = str(getattr(tool, "result", None) or getattr(run_event, "content", "") or "")
+        return _tool_completed(getattr(tool, "tool_name", None), result)
+    if kind == RunEvent.run_error.value:
+        return [stream_event("error", error=getattr(run_event, "content", None))]
+    return []
+
+
+async def stream_run(
+    run_events: AsyncIterator[Any],
+    deadline: Deadline | None = None,
+    on_completed: Callable[[Any], None] | None = None,
+) -> AsyncIterator[str]:
+    """Yield stream events for an agent run, from the first model token to completion.
+
+    If ``deadline`` passes mid-run the stream ends with a ``timed_out`` event
+    carrying any research found so far. ``on_completed`` is called with the
+    run's completion event, which carries its metrics like a non-streamed result.
+    """
+    yield stream_event("started")
+    try:
+        async for run_event in run_events:
+            if on_completed is not None and getattr(run_event, "event", None) == RunEvent.run_completed.value:
+                on_completed(run_event)
+            for chunk in translate(run_event):
+                yield chunk
+            if deadline is not None and deadline.expired:
+                yield stream_event(
+                    "timed_out", seconds=deadline.seconds, partial_research=summarize_findings(deadline.findings)
+                )
+                return
+    finally:
+        # Stops the agent run when the client disconnects or the deadline passes
+        aclose = getattr(run_events, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    yield stream_event("completed")
@@ -0,0 +1,777 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Cached variants of the agno toolkits used by the agent."""
+
+import asyncio
+import functools
+import json
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from agno.tools import Toolkit
+from agno.tools.duckduckgo import DuckDuckGoTools
+from agno.tools.reddit import RedditTools
+
+from reddit_post_generator.cache import SUBREDDIT_FIELD_TTLS, Cache
+from reddit_post_generator.pages import PageStore
+from reddit_post_generator.reddit_client import AsyncRedditClient
+from reddit_post_generator.research import derive_queries, normalize_query, rank_results
+
+# Searches fanned out by research_topic, shared by every agent to bound load on DuckDuckGo
+SEARCH_WORKERS = 8
+_search_executor: ThreadPoolExecutor | None = None
+_search_lock = threading.Lock()
+
+# Top posts are cached for the arguments agents call get_top_posts with by default
+TOP_POSTS_DEFAULTS = ("week", 10)
+
+# Background refreshes are shared by every agent so one subreddit is refreshed once
+_refresh_executor: ThreadPoolExecutor | None = None
+_refreshing: set[str] = set()
+_refresh_lock = threading.Lock()
+
+
+def _in_thread(function: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    @functools.wraps(function)
+    async def run(*args, **kwargs) -> Any:
+        return await asyncio.to_thread(function, *args, **kwargs)
+
+    return run
+
+
+def register_async_variants(toolkit: Toolkit) -> None:
+    """Register an async variant of each of ``toolkit``'s sync tools that runs it on a worker thread.
+
+    agno picks these in async runs, so the agents' async tool hooks can wrap every
+    call without searches or PRAW requests blocking the event loop.
+    """
+    for name, function in list(toolkit.functions.items()):
+        if function.entrypoint is not None:
+            toolkit.register(_in_thread(function.entrypoint), name=name)
+
+
+class CachedDuckDuckGoTools(DuckDuckGoTools):
+    """DuckDuckGoTools that serves repeated searches from a persistent cache.
+
+    Results are keyed on the normalized query plus every setting that changes what
+    DuckDuckGo returns (region, time filter, backend, modifier and result count).
+    Adds ``research_topic``, which runs every query for a topic in one tool call,
+    and ``read_page`` when a PageStore is given.
+    """
+
+    def __init__(
+        self,
+        cache: Cache | None = None,
+        max_sources: int = 10,
+        max_queries: int = 5,
+        snippet_chars: int = 300,
+        pages: PageStore | None = None,
+        page_chars: int = 4000,
+        **kwargs,
+    ) -> None:
+        """Wrap the DuckDuckGo toolkit (``kwargs`` are its options) with a result cache and topic research."""
+        self.cache = cache
+        self.max_sources = max_sources
+        self.max_queries = max_queries
+        self.snippet_chars = snippet_chars
+        self.pages = pages
+        self.page_chars = page_chars
+        super().__init__(**kwargs)
+
+        extra_tools = [self.research_topic] + ([self.read_page] if pages is not None else [])
+        self.tools = [*self.tools, *extra_tools]
+        for tool in extra_tools:
+            self.register(tool)
+        register_async_variants(self)
+
+    @classmethod
+    def from_config(cls, cache: Cache | None, config: dict, **kwargs) -> "CachedDuckDuckGoTools":
+        """Build the toolkit using the ``research`` section of agent_config.json."""
+        section = config.get("research", {})
+        return cls(
+            cache=cache,
+            max_sources=section.get("max_sources", 10),
+            max_queries=section.get("max_queries", 5),
+            snippet_chars=section.get("snippet_chars", 300),
+            page_chars=section.get("page_chars", 4000),
+            **kwargs,
+        )
+
+    def _cache_key(self, kind: str, query: str, max_results: int) -> str:
+        """Build the cache key for one search call."""
+        return json.dumps([
+            kind,
+            normalize_query(query),
+            self.region,
+            self.timelimit,
+            self.backend,
+            self.modifier,
+            self.fixed_max_results or max_results,
+        ])
+
+    def _cached_search(
+        self, kind: str, search: Callable[[str, int], str], query: str, max_results: int, refresh: bool = False
+    ) -> str:
+        """Run ``search`` through the cache, leaving failed searches out so they are retried.
+
+        With ``refresh`` the cached result is skipped and replaced by a fresh one.
+        """
+        if self.cache is None:
+            return search(query, max_results)
+
+        key = self._cache_key(kind, query, max_results)
+        cached = None if refresh else self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        results = search(query, max_results)
+        # Search backends can report rate limits and network failures as "Error ..." strings
+        if not results.startswith("Error"):
+            self.cache.set(key, results)
+        return results
+
+    def web_search(self, query: str, max_results: int = 5) -> str:
+        """Use this function to search the web for a query.
+
+        Args:
+            query(str): The query to search for.
+            max_results (optional, default=5): The maximum number of results to return.
+
+        Returns:
+            The search results from the web.
+        """
+        return self._cached_search("text", super().web_search, query, max_results)
+
+    def search_news(self, query: str, max_results: int = 5) -> str:
+        """Use this function to get the latest news from the web.
+
+        Args:
+            query(str): The query to search for.
+            max_results (optional, default=5): The maximum number of results to return.
+
+        Returns:
+            The latest news from the web.
+        """
+        return self._cached_search("news", super().search_news, query, max_results)
+
+    def research_topic(self, topic: str, keywords: list[str] | None = None) -> str:
+        """Use this function to research a topic in a single call.
+
+        It searches the topic and each keyword in parallel, removes duplicate sources
+        and returns the best ones ranked by authority and recency.
+
+        Args:
+            topic (str): The topic to research.
+            keywords (optional): Extra search terms; each is searched together with the topic.
+
+        Returns:
+            JSON with the queries that were run and the ranked sources.
+        """
+        return self._research(topic, keywords)
+
+    def refresh_topic(self, topic: str, keywords: list[str] | None = None) -> str:
+        """Research ``topic`` like research_topic, but search again instead of reading the cache.
+
+        The fresh results replace the cached ones, so the prefetcher can renew them
+        before they expire. Not exposed to agents.
+        """
+        return self._research(topic, keywords, refresh=True)
+
+    def _research(self, topic: str, keywords: list[str] | None, refresh: bool = False) -> str:
+        global _search_executor
+
+        queries = derive_queries(topic, keywords, self.max_queries)
+        with _search_lock:
+            if _search_executor is None:
+                _search_executor = ThreadPoolExecutor(max_workers=SEARCH_WORKERS, thread_name_prefix="web-search")
+
+        # News for the topic itself gives the ranking dated, recent sources
+        searches = [("text", super().web_search, query) for query in queries]
+        searches.append(("news", super().search_news, queries[0]))
+        futures = [
+            _search_executor.submit(self._cached_search, kind, search, query, self.max_sources, refresh)
+            for kind, search, query in searches
+        ]
+
+        results: list[dict[str, Any]] = []
+        errors: list[str] = []
+        for future in futures:
+            try:
+                results += json.loads(future.result())
+            except Exception as e:
+                # One failed query shouldn't lose the others' results
+                errors.append(f"{type(e).__name__}: {e}")
+        if errors and not results:
+            return f"Error researching topic: {errors[0]}"
+
+        sources = rank_results(results, self.max_sources, self.snippet_chars)
+        return json.dumps({"topic": topic, "queries": queries, "sources": sources}, ensure_ascii=False)
+
+    def read_page(self, url: str) -> str:
+        """Use this function to read the main text of a web page, e.g. a promising search result.
+
+        Args:
+            url (str): The URL of the page to read.
+
+        Returns:
+            JSON with the page title and its main text, truncated to a fixed length.
+        """
+        if self.pages is None:
+            return "Error reading page: no page store configured"
+        try:
+            page = self.pages.get(url)
+        except Exception as e:
+            return f"Error reading page: {type(e).__name__}: {e}"
+
+        text = page.text[: self.page_chars]
+        return json.dumps(
+            {"url": url, "title": page.title, "text": text, "truncated": len(page.text) > len(text)},
+            ensure_ascii=False,
+        )
+
+
+class CachedRedditTools(RedditTools):
+    """RedditTools that caches subreddit metadata, rules, flairs and posting requirements.
+
+    Each field has its own TTL. Once an entry is older than ``refresh_ratio`` of its
+    TTL it is still served, but a background refresh is scheduled so the next run
+    gets fresh data without waiting on Reddit. Write calls (posts, replies) are
+    never cached.
+    """
+
+    def __init__(
+        self,
+        cache: Cache | None = None,
+        field_ttls: dict[str, float] | None = None,
+        refresh_ratio: float = 0.8,
+        **kwargs,
+    ) -> None:
+        """Wrap RedditTools (``kwargs`` are its credentials) with per-field TTLs over ``cache``."""
+        self.cache = cache
+        self.field_ttls = {**SUBREDDIT_FIELD_TTLS, **(field_ttls or {})}
+        self.refresh_ratio = refresh_ratio
+        self._fetchers: dict[str, Callable[[str], Any]] = {
+            "info": self._fetch_info,
+            "rules": self._fetch_rules,
+            "flairs": self._fetch_flairs,
+            "requirements": self._fetch_requirements,
+            "stats": self._fetch_stats,
+            "top_posts": self._fetch_top_posts,
+        }
+
+        # Upstream validates include_tools against its own tools, which lack get_subreddit_rules
+        include_tools = kwargs.pop("include_tools", None)
+        if include_tools is not None:
+            kwargs["include_tools"] = [name for name in include_tools if name != "get_subreddit_rules"]
+        super().__init__(**kwargs)
+
+        # Rules and posting requirements aren't part of the upstream toolkit
+        self.include_tools = include_tools
+        self.tools = [*self.tools, self.get_subreddit_rules]
+        self.register(self.get_subreddit_rules)
+        register_async_variants(self)
+
+    @classmethod
+    def from_config(cls, cache: Cache | None, config: dict, **kwargs) -> "CachedRedditTools":
+        """Build the toolkit using the ``cache.subreddit`` section of agent_config.json."""
+        section = config.get("cache", {}).get("subreddit", {})
+        return cls(
+            cache=cache,
+            field_ttls=section.get("field_ttl_seconds"),
+            refresh_ratio=section.get("refresh_ratio", 0.8),
+            **kwargs,
+        )
+
+    def _fetch_info(self, subreddit_name: str) -> dict[str, Any]:
+        subreddit = self.reddit.subreddit(subreddit_name)  # type: ignore[union-attr]
+        return {
+            "display_name": subreddit.display_name,
+            "title": subreddit.title,
+            "description": subreddit.description,
+            "subscribers": subreddit.subscribers,
+            "created_utc": subreddit.created_utc,
+            "over18": subreddit.over18,
+            "public_description": subreddit.public_description,
+            "url": subreddit.url,
+        }
+
+    def _fetch_rules(self, subreddit_name: str) -> list[dict[str, Any]]:
+        subreddit = self.reddit.subreddit(subreddit_name)  # type: ignore[union-attr]
+        return [
+            {
+                "short_name": rule.short_name,
+                "description": rule.description,
+                "kind": rule.kind,
+                "violation_reason": rule.violation_reason,
+            }
+            for rule in subreddit.rules
+        ]
+
+    def _fetch_flairs(self, subreddit_name: str) -> list[str]:
+        subreddit = self.reddit.subreddit(subreddit_name)  # type: ignore[union-attr]
+        return [flair["text"] for flair in subreddit.flair.link_templates]
+
+    def _fetch_requirements(self, subreddit_name: str) -> dict[str, Any]:
+        return self.reddit.subreddit(subreddit_name).post_requirements()  # type: ignore[union-attr]
+
+    def _fetch_stats(self, subreddit_name: str) -> dict[str, Any]:
+        sub = self.reddit.subreddit(subreddit_name)  # type: ignore[union-attr]
+        return {
+            "display_name": sub.display_name,
+            "subscribers": sub.subscribers,
+            "active_users": sub.active_user_count,
+            "description": sub.description,
+            "created_utc": sub.created_utc,
+            "over18": sub.over18,
+            "public_description": sub.public_description,
+        }
+
+    def _fetch_top_posts(
+        self, subreddit_name: str, time_filter: str = TOP_POSTS_DEFAULTS[0], limit: int = TOP_POSTS_DEFAULTS[1]
+    ) -> list[dict[str, Any]]:
+        posts = self.reddit.subreddit(subreddit_name).top(time_filter=time_filter, limit=limit)  # type: ignore[union-attr]
+        return [
+            {
+                "id": post.id,
+                "title": post.title,
+                "score": post.score,
+                "url": post.url,
+                "selftext": post.selftext,
+                "author": str(post.author),
+                "permalink": post.permalink,
+                "created_utc": post.created_utc,
+                "subreddit": str(post.subreddit),
+                "subreddit_name_prefixed": post.subreddit_name_prefixed,
+            }
+            for post in posts
+        ]
+
+    @staticmethod
+    def _cache_key(field: str, subreddit_name: str) -> str:
+        return f"{field}:{subreddit_name.lower()}"
+
+    def _refresh(self, field: str, subreddit_name: str) -> Any:
+        """Fetch one field from Reddit and store it in the cache."""
+        data = self._fetchers[field](subreddit_name)
+        if self.cache is not None:
+            self.cache.set(
+                self._cache_key(field, subreddit_name),
+                {"fetched_at": time.time(), "data": data},
+                ttl_seconds=self.field_ttls[field],
+            )
+        return data
+
+    def _schedule_refresh(self, field: str, subreddit_name: str) -> None:
+        """Refresh a field in the background unless a refresh is already running."""
+        global _refresh_executor
+        key = self._cache_key(field, subreddit_name)
+
+        with _refresh_lock:
+            if key in _refreshing:
+                return
+            _refreshing.add(key)
+            if _refresh_executor is None:
+                _refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="subreddit-refresh")
+
+        def run() -> None:
+            try:
+                self._refresh(field, subreddit_name)
+            except Exception as e:
+                # Keep serving the cached value; the entry expires normally if Reddit stays down
+                print(f"⚠️  Background refresh of {key} failed: {type(e).__name__}")
+            finally:
+                with _refresh_lock:
+                    _refreshing.discard(key)
+
+        _refresh_executor.submit(run)
+
+    def get_field(self, field: str, subreddit_name: str) -> Any:
+        """Return one subreddit field, from the cache when possible."""
+        if self.cache is None:
+            return self._fetchers[field](subreddit_name)
+
+        entry = self.cache.get(self._cache_key(field, subreddit_name))
+        if entry is None:
+            return self._refresh(field, subreddit_name)
+
+        # Serve the cached value, refreshing ahead of expiry once it gets old
+        if time.time() - entry["fetched_at"] >= self.field_ttls[field] * self.refresh_ratio:
+            self._schedule_refresh(field, subreddit_name)
+        return entry["data"]
+
+    def invalidate(self, subreddit_name: str, fields: list[str] | None = None) -> None:
+        """Drop cached fields for a subreddit so the next call refetches them."""
+        if self.cache is None:
+            return
+        for field in fields or list(self._fetchers):
+            self.cache.delete(self._cache_key(field, subreddit_name))
+
+    def get_subreddit_info(self, subreddit_name: str) -> str:
+        """Get information about a specific subreddit.
+
+        Args:
+            subreddit_name (str): Name of the subreddit.
+
+        Returns:
+            str: JSON string containing subreddit information.
+        """
+        if not self.reddit:
+            return "Please provide Reddit API credentials"
+
+        try:
+            info = self.get_field("info", subreddit_name)
+            flairs = self.get_field("flairs", subreddit_name)
+            return json.dumps({**info, "available_flairs": flairs})
+        except Exception as e:
+            return f"Error getting subreddit info: {e}"
+
+    def get_subreddit_rules(self, subreddit_name: str) -> str:
+        """Get the rules, posting requirements and available flairs of a subreddit.
+
+        Args:
+            subreddit_name (str): Name of the subreddit.
+
+        Returns:
+            str: JSON string containing the subreddit rules and posting requirements.
+        """
+        if not self.reddit:
+            return "Please provide Reddit API credentials"
+
+        try:
+            return json.dumps({
+                "rules": self.get_field("rules", subreddit_name),
+                "post_requirements": self.get_field("requirements", subreddit_name),
+                "available_flairs": self.get_field("flairs", subreddit_name),
+            })
+        except Exception as e:
+            return f"Error getting subreddit rules: {e}"
+
+    def get_subreddit_stats(self, subreddit: str) -> str:
+        """Get statistics about a subreddit.
+
+        Args:
+            subreddit (str): Name of the subreddit.
+
+        Returns:
+            str: JSON string containing subreddit statistics.
+        """
+        if not self.reddit:
+            return "Please provide Reddit API credentials"
+
+        try:
+            return json.dumps({"subreddit_stats": self.get_field("stats", subreddit)})
+        except Exception as e:
+            return f"Error getting subreddit stats: {e}"
+
+    def get_top_posts(self, subreddit: str, time_filter: str = "week", limit: int = 10) -> str:
+        """Get top posts from a subreddit for a specific time period.
+
+        Args:
+            subreddit (str): Name of the subreddit.
+            time_filter (str): Time period to filter posts.
+            limit (int): Number of posts to fetch.
+
+        Returns:
+            str: JSON string containing top posts.
+        """
+        if not self.reddit:
+            return "Please provide Reddit API credentials"
+
+        try:
+            if (time_filter, limit) == TOP_POSTS_DEFAULTS:
+                return json.dumps({"top_posts": self.get_field("top_posts", subreddit)})
+            return json.dumps({"top_posts": self._fetch_top_posts(subreddit, time_filter, limit)})
+        except Exception as e:
+            return f"Error getting top posts: {e}"
+
+
+class AsyncRedditTools(Toolkit):
+    """Async drop-in for CachedRedditTools backed by a shared AsyncRedditClient.
+
+    Exposes the same tools with the same JSON output, but calls never block the
+    event loop, and every agent shares the client's connection pool, OAuth token
+    and rate limiter. Subreddit fields use the same cache entries and TTLs as
+    CachedRedditTools, with ahead-of-expiry refreshes run as asyncio tasks.
+    """
+
+    def __init__(
+        self,
+        client: AsyncRedditClient,
+        cache: Cache | None = None,
+        field_ttls: dict[str, float] | None = None,
+        refresh_ratio: float = 0.8,
+        **kwargs,
+    ) -> None:
+        """Expose ``client``'s Reddit calls as tools, caching subreddit fields in ``cache``."""
+        self.client = client
+        self.cache = cache
+        self.field_ttls = {**SUBREDDIT_FIELD_TTLS, **(field_ttls or {})}
+        self.refresh_ratio = refresh_ratio
+        self._fetchers: dict[str, Callable[[str], Awaitable[Any]]] = {
+            "info": self._fetch_info,
+            "rules": self._fetch_rules,
+            "flairs": self._fetch_flairs,
+            "requirements": self.client.post_requirements,
+            "stats": self._fetch_stats,
+            "top_posts": self._fetch_top_posts,
+        }
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
+
+        tools = [
+            self.get_subreddit_info,
+            self.get_subreddit_rules,
+            self.get_subreddit_stats,
+            self.get_top_posts,
+            self.create_post,
+        ]
+        super().__init__(name="reddit", tools=tools, **kwargs)
+
+    @classmethod
+    def from_config(cls, client: AsyncRedditClient, cache: Cache | None, config: dict, **kwargs) -> "AsyncRedditTools":
+        """Build the toolkit using the ``cache.subreddit`` section of agent_config.json."""
+        section = config.get("cache", {}).get("subreddit", {})
+        return cls(
+            client,
+            cache=cache,
+            field_ttls=section.get("field_ttl_seconds"),
+            refresh_ratio=section.get("refresh_ratio", 0.8),
+            **kwargs,
+        )
+
+    async def _fetch_info(self, subreddit_name: str) -> dict[str, Any]:
+        about = await self.client.about(subreddit_name)
+        fields = (
+            "display_name",
+            "title",
+            "description",
+            "subscribers",
+            "created_utc",
+            "over18",
+            "public_description",
+            "url",
+        )
+        return {field: about.get(field) for field in fields}
+
+    async def _fetch_rules(self, subreddit_name: str) -> list[dict[str, Any]]:
+        return [
+            {
+                "short_name": rule.get("short_name"),
+                "description": rule.get("description"),
+                "kind": rule.get("kind"),
+                "violation_reason": rule.get("violation_reason"),
+            }
+            for rule in await self.client.rules(subreddit_name)
+        ]
+
+    async def _fetch_flairs(self, subreddit_name: str) -> list[str]:
+        return [flair["text"] for flair in await self.client.link_flairs(subreddit_name)]
+
+    async def _fetch_stats(self, subreddit_name: str) -> dict[str, Any]:
+        about = await self.client.about(subreddit_name)
+        return {
+            "display_name": about.get("display_name"),
+            "subscribers": about.get("subscribers"),
+            "active_users": about.get("active_user_count"),
+            "description": about.get("description"),
+            "created_utc": about.get("created_utc"),
+            "over18": about.get("over18"),
+            "public_description": about.get("public_description"),
+        }
+
+    async def _fetch_top_posts(
+        self, subreddit_name: str, time_filter: str = TOP_POSTS_DEFAULTS[0], limit: int = TOP_POSTS_DEFAULTS[1]
+    ) -> list[dict[str, Any]]:
+        fields = (
+            "id",
+            "title",
+            "score",
+            "url",
+            "selftext",
+            "author",
+            "permalink",
+            "created_utc",
+            "subreddit",
+            "subreddit_name_prefixed",
+        )
+        return [
+            {field: post.get(field) for field in fields}
+            for post in await self.client.top_posts(subreddit_name, time_filter, limit)
+        ]
+
+    async def _refresh(self, field: str, subreddit_name: str) -> Any:
+        """Fetch one field from Reddit and store it in the cache."""
+        data = await self._fetchers[field](subreddit_name)
+        if self.cache is not None:
+            self.cache.set(
+                CachedRedditTools._cache_key(field, subreddit_name),
+                {"fetched_at": time.time(), "data": data},
+                ttl_seconds=self.field_ttls[field],
+            )
+        return data
+
+    def _schedule_refresh(self, field: str, subreddit_name: str) -> None:
+        """Refresh a field in the background unless a refresh is already running."""
+        key = CachedRedditTools._cache_key(field, subreddit_name)
+        if key in self._refresh_tasks:
+            return
+
+        async def run() -> None:
+            try:
+                await self._refresh(field, subreddit_name)
+            except Exception as e:
+                # Keep serving the cached value; the entry expires normally if Reddit stays down
+                print(f"⚠️  Background refresh of {key} failed: {type(e).__name__}")
+            finally:
+                self._refresh_tasks.pop(key, None)
+
+        self._refresh_tasks[key] = asyncio.create_task(run())
+
+    async def get_field(self, field: str, subreddit_name: str) -> Any:
+        """Return one subreddit field, from the cache when possible."""
+        if self.cache is None:
+            return await self._fetchers[field](subreddit_name)
+
+        entry = self.cache.get(CachedRedditTools._cache_key(field, subreddit_name))
+        if entry is None:
+            return await self._refresh(field, subreddit_name)
+
+        # Serve the cached value, refreshing ahead of expiry once it gets old
+        if time.time() - entry["fetched_at"] >= self.field_ttls[field] * self.refresh_ratio:
+            self._schedule_refresh(field, subreddit_name)
+        return entry["data"]
+
+    async def get_subreddit_info(self, subreddit_name: str) -> str:
+        """Get information about a specific subreddit.
+
+        Args:
+            subreddit_name (str): Name of the subreddit.
+
+        Returns:
+            str: JSON string containing subreddit information.
+        """
+        try:
+            info, flairs = await asyncio.gather(
+                self.get_field("info", subreddit_name), self.get_field("flairs", subreddit_name)
+            )
+            return json.dumps({**info, "available_flairs": flairs})
+        except Exception as e:
+            return f"Error getting subreddit info: {e}"
+
+    async def get_subreddit_rules(self, subreddit_name: str) -> str:
+        """Get the rules, posting requirements and available flairs of a subreddit.
+
+        Args:
+            subreddit_name (str): Name of the subreddit.
+
+        Returns:
+            str: JSON string containing the subreddit rules and posting requirements.
+        """
+        try:
+            rules, requirements, flairs = await asyncio.gather(
+                self.get_field("rules", subreddit_name),
+                self.get_field("requirements", subreddit_name),
+                self.get_field("flairs", subreddit_name),
+            )
+            return json.dumps({"rules": rules, "post_requirements": requirements, "available_flairs": flairs})
+        except Exception as e:
+            return f"Error getting subreddit rules: {e}"
+
+    async def get_subreddit_stats(self, subreddit: str) -> str:
+        """Get statistics about a subreddit.
+
+        Args:
+            subreddit (str): Name of the subreddit.
+
+        Returns:
+            str: JSON string containing subreddit statistics.
+        """
+        try:
+            return json.dumps({"subreddit_stats": await self.get_field("stats", subreddit)})
+        except Exception as e:
+            return f"Error getting subreddit stats: {e}"
+
+    async def get_top_posts(self, subreddit: str, time_filter: str = "week", limit: int = 10) -> str:
+        """Get top posts from a subreddit for a specific time period.
+
+        Args:
+            subreddit (str): Name of the subreddit.
+            time_filter (str): Time period to filter posts.
+            limit (int): Number of posts to fetch.
+
+        Returns:
+            str: JSON string containing top posts.
+        """
+        try:
+            if (time_filter, limit) == TOP_POSTS_DEFAULTS:
+                return json.dumps({"top_posts": await self.get_field("top_posts", subreddit)})
+            return json.dumps({"top_posts": await self._fetch_top_posts(subreddit, time_filter, limit)})
+        except Exception as e:
+            return f"Error getting top posts: {e}"
+
+    async def create_post(
+        self,
+        subreddit: str,
+        title: str,
+        content: str,
+        flair: str | None = None,
+        is_self: bool = True,
+    ) -> str:
+        """
+        Create a new post in a subreddit.
+
+        Args:
+            subreddit (str): Name of the subreddit to post in.
+            title (str): Title of the post.
+            content (str): Content of the post (text for self posts, URL for link posts).
+            flair (Optional[str]): Flair to add to the post. Must be an available flair in the subreddit.
+            is_self (bool): Whether this is a self (text) post (True) or link post (False).
+        Returns:
+            str: JSON string containing the created post information.
+        """
+        if not (self.client.username and self.client.password):
+            return "User authentication required for posting. Please provide username and password."
+
+        try:
+            flair_id = None
+            if flair:
+                # Flair ids are never cached: posting with a stale id fails the submission
+                templates = await self.client.link_flairs(subreddit)
+                flair_id = next((t["id"] for t in templates if t["text"] == flair), None)
+                if flair_id is None:
+                    return f"Invalid flair. Available flairs: {', '.join(t['text'] for t in templates)}"
+
+            post = await self.client.submit(subreddit, title, content, is_self=is_self, flair_id=flair_id)
+            return json.dumps({
+                "post": {
+                    **post,
+                    "title": title,
+                    "created_utc": time.time(),
+                    "author": self.client.username,
+                    "flair": flair,
+                }
+            })
+        except Exception as e:
+            return f"Error creating post: {e}"
+
+
+def create_reddit_tools(
+    cache: Cache | None,
+    config: dict,
+    reddit_credentials: dict[str, str],
+    client: AsyncRedditClient | None = None,
+    **kwargs,
+) -> Toolkit:
+    """Build the Reddit toolkit: async over the shared client when there is one, otherwise PRAW."""
+    if client is not None:
+        return AsyncRedditTools.from_config(client, cache, config, **kwargs)
+    return CachedRedditTools.from_config(cache, config, **reddit_credentials, **kwargs)
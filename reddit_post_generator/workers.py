@@ -0,0 +1,212 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Pre-forked worker processes serving one listening socket."""
+
+import contextlib
+import importlib
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any
+from urllib.parse import urlsplit
+
+import uvicorn
+
+# A worker failing sooner than this after it started is a startup error, not a crash worth restarting
+MIN_UPTIME_SECONDS = 10.0
+
+# Same accept backlog uvicorn uses when it binds the socket itself
+SOCKET_BACKLOG = 2048
+
+
+def worker_count(config: dict) -> int:
+    """Return the number of server processes from the ``workers`` key of agent_config.json."""
+    count = config.get("workers", 1)
+    if not isinstance(count, int) or count < 1:
+        error_msg = f"workers must be a positive integer, got {count!r}"
+        raise ValueError(error_msg)
+    return count
+
+
+def prepare_workers(config: dict, count: int) -> dict:
+    """Check a config for running ``count`` workers and return the config each worker uses.
+
+    Workers always load the existing DID keys; regenerating them in every worker
+    would give each one a different identity.
+    """
+    if config.get("storage", {}).get("type", "memory") == "memory":
+        print(
+            "⚠️  Memory storage with several workers: a task is only visible to the worker that created it; "
+            "use postgres storage and a redis scheduler so any worker can answer tasks/get"
+        )
+    for namespace, section in config.get("cache", {}).items():
+        if isinstance(section, dict) and section.get("backend") == "memory":
+            print(f"⚠️  cache.{namespace} uses the memory backend: each worker keeps its own copy")
+    if config.get("recreate_keys", False):
+        print("⚠️  recreate_keys is ignored with several workers")
+    return {**config, "workers": count, "recreate_keys": False}
+
+
+def bind_socket(url: str) -> socket.socket:
+    """Bind and listen on the host and port of the deployment URL, before any worker is forked."""
+    parts = urlsplit(url)
+    host, port = parts.hostname or "127.0.0.1", parts.port or 3776
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(SOCKET_BACKLOG)
+    sock.set_inheritable(True)
+    return sock
+
+
+@contextmanager
+def serving_on(sock: socket.socket) -> Iterator[None]:
+    """Make bindufy serve on an already bound socket instead of binding its host and port.
+
+    bindufy always starts uvicorn through ``start_uvicorn_server(app, host, port)``,
+    so inside this block that runner is swapped for one serving ``sock``.
+    """
+    # bindu.penguin re-exports the bindufy function under its module's name
+    bindufy_module = importlib.import_module("bindu.penguin.bindufy")
+
+    def run_server(app: Any, host: str, port: int, display_info: bool = True) -> None:
+        uvicorn.Server(uvicorn.Config(app)).run(sockets=[sock])
+
+    original = bindufy_module.start_uvicorn_server
+    bindufy_module.start_uvicorn_server = run_server
+    try:
+        yield
+    finally:
+        bindufy_module.start_uvicorn_server = original
+
+
+@contextmanager
+def running_at_startup(startup: Callable[[], None]) -> Iterator[None]:
+    """Make bindufy call ``startup`` on the server's event loop, once bindu's own startup is done.
+
+    bindufy hands its application to ``start_uvicorn_server``, so inside this block
+    that runner first wraps the application's lifespan. It composes with
+    :func:`serving_on` when entered after it.
+    """
+    bindufy_module = importlib.import_module("bindu.penguin.bindufy")
+    original = bindufy_module.start_uvicorn_server
+
+    def run_server(app: Any, host: str, port: int, display_info: bool = True) -> None:
+        lifespan = app.router.lifespan_context
+
+        @asynccontextmanager
+        async def lifespan_with_startup(lifespan_app: Any) -> AsyncIterator[Any]:
+            async with lifespan(lifespan_app) as state:
+                startup()
+                yield state
+
+        app.router.lifespan_context = lifespan_with_startup
+        original(app, host=host, port=port, display_info=display_info)
+
+    bindufy_module.start_uvicorn_server = run_server
+    try:
+        yield
+    finally:
+        bindufy_module.start_uvicorn_server = original
+
+
+def _run_child(target: Callable[[int], None], index: int) -> int:
+    try:
+        target(index)
+    except KeyboardInterrupt:
+        return 0
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    finally:
+        # os._exit skips the interpreter's own flushing
+        sys.stdout.flush()
+        sys.stderr.flush()
+    return 0
+
+
+class WorkerSupervisor:
+    """Forks worker processes and restarts the ones that crash.
+
+    A worker that exits with an error is restarted, unless it failed within
+    ``min_uptime`` of starting; that is treated as a startup error and stops every
+    worker. SIGINT and SIGTERM are passed on to all workers for a graceful shutdown.
+    """
+
+    def __init__(self, target: Callable[[int], None], min_uptime: float = MIN_UPTIME_SECONDS) -> None:
+        """Run ``target(index)`` in each worker, restarting it unless it dies within ``min_uptime``."""
+        self.target = target
+        self.min_uptime = min_uptime
+        self.children: dict[int, tuple[int, float]] = {}
+        self.stopping = False
+        self.failed: str | None = None
+        self._previous_handlers: dict[int, Any] = {}
+
+    def spawn(self, index: int) -> None:
+        """Fork worker ``index``."""
+        pid = os.fork()
+        if pid == 0:
+            for sig, handler in self._previous_handlers.items():
+                signal.signal(sig, handler)
+            os._exit(_run_child(self.target, index))
+        self.children[pid] = (index, time.monotonic())
+
+    def stop(self, signum: int = signal.SIGTERM, frame: Any = None) -> None:
+        """Ask every worker to shut down; used as the SIGINT/SIGTERM handler."""
+        self.stopping = True
+        for pid in self.children:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+
+    def reap(self, pid: int, status: int) -> None:
+        """Handle one worker's exit, restarting it if it crashed while serving."""
+        index, started = self.children.pop(pid, (None, 0.0))
+        exit_code = os.waitstatus_to_exitcode(status)
+        if index is None or self.stopping or exit_code == 0:
+            return
+        if time.monotonic() - started < self.min_uptime:
+            self.failed = f"Worker {index} exited with {exit_code} right after starting"
+            print(f"❌ {self.failed}; stopping all workers")
+            self.stop()
+            return
+        print(f"⚠️  Worker {index} exited with {exit_code}; restarting it")
+        self.spawn(index)
+
+    def run(self, count: int) -> None:
+        """Start ``count`` workers and wait until all of them have stopped."""
+        self._previous_handlers = {sig: signal.signal(sig, self.stop) for sig in (signal.SIGINT, signal.SIGTERM)}
+        try:
+            for index in range(count):
+                self.spawn(index)
+            while self.children:
+                try:
+                    pid, status = os.wait()
+                except ChildProcessError:
+                    break
+                self.reap(pid, status)
+        finally:
+            for sig, handler in self._previous_handlers.items():
+                signal.signal(sig, handler)
+
+        if self.failed is not None:
+            raise RuntimeError(self.failed)
+
+
+def run_workers(count: int, target: Callable[[int], None], min_uptime: float = MIN_UPTIME_SECONDS) -> None:
+    """Fork ``count`` processes running ``target(index)`` and supervise them until they stop."""
+    WorkerSupervisor(target, min_uptime).run(count)
@@ -0,0 +1,51 @@
+"""Tests for storage and scheduler selection."""
+
+import pytest
+from bindu.settings import app_settings
+
+from reddit_post_generator.backends import configure_backends, resolve_scheduler, resolve_storage
+
+
+def test_memory_backends_are_the_default():
+    """Test that missing sections resolve to in-memory storage and scheduling."""
+    config = configure_backends({"name": "agent"})
+
+    assert config["storage"]["type"] == "memory"
+    assert config["scheduler"]["type"] == "memory"
+
+
+def test_urls_fall_back_to_environment(monkeypatch):
+    """Test that DATABASE_URL and REDIS_URL fill in missing URLs."""
+    monkeypatch.setenv("DATABASE_URL", "postgresql+asyncpg://db/agent")
+    monkeypatch.setenv("REDIS_URL", "redis://cache:6379/0")
+
+    assert resolve_storage({"type": "postgres"})["postgres_url"] == "postgresql+asyncpg://db/agent"
+    assert resolve_scheduler({"type": "redis", "redis_url": "redis://other"})["redis_url"] == "redis://other"
+    assert resolve_scheduler({"type": "redis"})["redis_url"] == "redis://cache:6379/0"
+
+
+def test_unsupported_or_incomplete_backends_raise(monkeypatch):
+    """Test that unknown types and missing URLs fail instead of silently using memory."""
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.delenv("REDIS_URL", raising=False)
+
+    with pytest.raises(ValueError, match="Unsupported storage type 'sqlite'"):
+        resolve_storage({"type": "sqlite"})
+    with pytest.raises(ValueError, match="DATABASE_URL"):
+        resolve_storage({"type": "postgres"})
+    with pytest.raises(ValueError, match="REDIS_URL"):
+        resolve_scheduler({"type": "redis"})
+
+
+def test_postgres_pool_settings_are_applied(monkeypatch):
+    """Test that pool sizing from agent_config.json reaches bindu's settings."""
+    for setting in ("postgres_pool_min", "postgres_pool_max", "postgres_timeout", "postgres_command_timeout"):
+        monkeypatch.setattr(app_settings.storage, setting, getattr(app_settings.storage, setting))
+
+    configure_backends({
+        "storage": {"type": "postgres", "postgres_url": "postgresql+asyncpg://db/agent", "pool_min": 4, "pool_max": 20},
+        "scheduler": {"type": "redis", "redis_url": "redis://cache:6379/0"},
+    })
+
+    assert app_settings.storage.postgres_pool_min == 4
+    assert app_settings.storage.postgres_pool_max == 20
@@ -0,0 +1,101 @@
+"""Tests for batch post generation."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from reddit_post_generator.batch import parse_batch_jobs, run_batch
+from reddit_post_generator.main import handler
+from reddit_post_generator.pool import AgentPool
+
+
+def test_parse_batch_jobs_detects_job_lists():
+    """Test that only JSON job lists are treated as batches."""
+    jobs = [{"topic": "AI ethics", "subreddit": "Futurology"}]
+
+    assert parse_batch_jobs([{"role": "user", "content": json.dumps({"jobs": jobs})}]) == jobs
+    assert parse_batch_jobs([{"role": "user", "content": json.dumps(jobs)}]) == jobs
+    assert parse_batch_jobs([{"role": "user", "content": "Create a post about AI"}]) is None
+    assert parse_batch_jobs([{"role": "user", "content": json.dumps({"topic": "AI"})}]) is None
+
+
+@pytest.mark.asyncio
+async def test_run_batch_shares_research_per_topic():
+    """Test that jobs with the same topic trigger a single research run."""
+    prompts = []
+
+    async def fake_run(messages):
+        prompts.append(messages[0]["content"])
+        return MagicMock(content="findings" if "RESEARCH ONLY" in messages[0]["content"] else "post")
+
+    jobs = [
+        {"topic": "Web frameworks 2025", "subreddit": "webdev"},
+        {"topic": "web frameworks 2025", "subreddit": "javascript"},
+        {"topic": "Rust adoption", "subreddit": "rust"},
+    ]
+
+    results = [json.loads(line) async for line in run_batch(jobs, fake_run)]
+
+    assert sum("RESEARCH ONLY" in p for p in prompts) == 2
+    assert sorted(r["subreddit"] for r in results) == ["javascript", "rust", "webdev"]
+    assert all(r["success"] and r["content"] == "post" for r in results)
+    assert all("findings" in p for p in prompts if "RESEARCH ONLY" not in p)
+
+
+@pytest.mark.asyncio
+async def test_run_batch_respects_concurrency_and_reports_failures():
+    """Test that runs stay under the semaphore and failed jobs are reported, not raised."""
+    active = 0
+    peak = 0
+
+    async def fake_run(messages):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if "fail" in messages[0]["content"] and "RESEARCH ONLY" not in messages[0]["content"]:
+            raise RuntimeError
+        return MagicMock(content="ok")
+
+    jobs = [{"topic": f"topic {i}", "subreddit": "fail" if i == 0 else f"sub{i}"} for i in range(6)]
+
+    results = [json.loads(line) async for line in run_batch(jobs, fake_run, max_concurrency=2)]
+
+    assert peak <= 2
+    assert [r["success"] for r in sorted(results, key=lambda r: r["job_index"])] == [False] + [True] * 5
+
+
+@pytest.mark.asyncio
+async def test_handler_streams_batch_results():
+    """Test that handler returns an async stream for batch requests."""
+    jobs = [{"topic": "AI ethics", "subreddit": "Futurology"}]
+    messages = [{"role": "user", "content": json.dumps({"jobs": jobs})}]
+    findings = "- Most AI labs now publish model cards (https://example.com/cards)"
+    researcher = MagicMock()
+    researcher.arun = AsyncMock(return_value=MagicMock(content=findings))
+    research_pool = AgentPool(lambda: researcher, size=1)
+    research_pool.start()
+
+    with (
+        patch("reddit_post_generator.main._initialized", True),
+        patch("reddit_post_generator.main.research_pool", research_pool),
+        patch(
+            "reddit_post_generator.main.run_agent",
+            new_callable=AsyncMock,
+            return_value=MagicMock(content="post"),
+        ) as mock_run,
+    ):
+        result = await handler(messages)
+        lines = [json.loads(line) async for line in result]
+
+    assert lines == [
+        {"job_index": 0, "topic": "AI ethics", "subreddit": "Futurology", "success": True, "content": "post"}
+    ]
+    # Shared research runs on the search-only pool, and drafting gets its notes verbatim
+    assert "RESEARCH ONLY" in researcher.arun.await_args.args[0][0]["content"]
+    (job,) = mock_run.await_args_list
+    assert not job.kwargs.get("dry_run")
+    assert job.args[0][0]["content"].endswith(f"searching the web again:\n{findings}")
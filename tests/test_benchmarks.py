@@ -0,0 +1,116 @@
+"""Smoke tests for the offline benchmark harness."""
+
+import sys
+from unittest.mock import patch
+
+import reddit_post_generator.main  # noqa: F401
+from benchmarks.bench_handler import compare, create_argument_parser, run_benchmark
+from benchmarks.bench_imports import compare as compare_imports
+from benchmarks.bench_imports import run_benchmark as run_import_benchmark
+from benchmarks.bench_memory import create_argument_parser as create_memory_parser
+from benchmarks.bench_memory import run_benchmark as run_memory_benchmark
+
+main_module = sys.modules["reddit_post_generator.main"]
+
+BENCHMARK_ENV = [
+    "OPENAI_API_KEY",
+    "OPENAI_BASE_URL",
+    "OPENROUTER_API_KEY",
+    "REDDIT_CLIENT_ID",
+    "REDDIT_CLIENT_SECRET",
+    "REDDIT_USERNAME",
+    "REDDIT_PASSWORD",
+]
+
+# Module state the benchmarks initialize, restored after each run
+MAIN_GLOBALS = {
+    "_config": None,
+    "_initialized": False,
+    "agent_pool": None,
+    "pipeline": None,
+    "research_cache": None,
+    "subreddit_cache": None,
+    "llm_cache": None,
+    "pipeline_cache": None,
+    "page_store": None,
+    "reddit_client": None,
+    "history": None,
+    "router": None,
+    "draft_pool": None,
+    "research_pool": None,
+    "coalescer": None,
+    "post_ledger": None,
+    "post_cache": None,
+    "job_queue": None,
+    "tool_compactor": None,
+    "result_projector": None,
+    "task_retention": None,
+    "prefetcher": None,
+    "_caches_created": False,
+}
+
+
+def test_benchmark_drives_handler_against_fakes(tmp_path, monkeypatch):
+    """Test that the harness runs the real agent stack end-to-end without network access."""
+    for key in BENCHMARK_ENV:
+        monkeypatch.setenv(key, "restore-me")
+    args = create_argument_parser().parse_args([
+        "--requests=4",
+        "--concurrency=2",
+        "--pool-size=2",
+        "--warmup=0",
+        "--model-latency-ms=0",
+        "--search-latency-ms=0",
+        "--reddit-latency-ms=0",
+        f"--output={tmp_path / 'results.json'}",
+    ])
+
+    with patch.multiple(main_module, **MAIN_GLOBALS):
+        result = run_benchmark(args)
+
+    assert result["results"]["errors"] == 0
+    assert result["results"]["requests_per_s"] > 0
+    # Each request searches, checks the subreddit twice, posts and then answers
+    assert result["results"]["model_calls"] == 4 * 5
+
+
+def test_compare_flags_regressions():
+    """Test that slower latency or lower throughput beyond the threshold is reported."""
+    baseline = {"results": {"p95_ms": 100.0, "requests_per_s": 50.0, "memory_per_request_kb": 10.0}}
+    current = {"results": {"p95_ms": 130.0, "requests_per_s": 48.0, "memory_per_request_kb": 10.5}}
+
+    assert compare(current, baseline, max_regression=0.2) == ["p95_ms: 100.0 -> 130.0"]
+    assert compare(current, baseline, max_regression=0.5) == []
+
+
+def test_memory_benchmark_bounds_stored_tasks(tmp_path, monkeypatch):
+    """Test that the bounded storage keeps max_tasks finished tasks while upstream's keeps every one."""
+    for key in BENCHMARK_ENV:
+        monkeypatch.setenv(key, "restore-me")
+    args = create_memory_parser().parse_args(["--requests=6", "--max-tasks=2", f"--output={tmp_path / 'memory.json'}"])
+
+    with patch.multiple(main_module, **MAIN_GLOBALS):
+        result = run_memory_benchmark(args)["results"]
+
+    assert (result["unbounded_stored_tasks"], result["bounded_stored_tasks"]) == (6, 2)
+    assert result["bounded_task_payload_kb"] > 0
+
+
+def test_imports_stay_light():
+    """Test that importing the package and main loads none of agno, bindu or the API clients."""
+    result = run_import_benchmark(repeat=1)
+
+    assert result["results"]["package_heavy_modules"] == []
+    assert result["results"]["main_heavy_modules"] == []
+    assert compare_imports(result, {"results": {}}, max_regression=0.2) == []
+
+
+def test_compare_imports_flags_slower_imports_and_heavy_modules():
+    """Test that a slower import or a heavy module loaded at import is reported."""
+    baseline = {"results": {"main_import_ms": 100.0}}
+    current = {"results": {"main_import_ms": 150.0, "main_heavy_modules": ["agno"]}}
+
+    assert compare_imports(current, baseline, max_regression=0.2) == [
+        "main_import_ms: 100.0 -> 150.0",
+        "main_heavy_modules: agno loaded at import",
+    ]
@@ -0,0 +1,109 @@
+"""Tests for the persistent SQLite cache."""
+
+from itertools import count
+from unittest.mock import patch
+
+import pytest
+
+from reddit_post_generator.cache import MemoryCache, SQLiteCache, create_cache
+
+
+def test_set_and_get_round_trip(tmp_path):
+    """Test that cached values are returned as stored."""
+    cache = SQLiteCache(tmp_path / "cache.sqlite3", namespace="research")
+
+    cache.set("webdev", {"results": ["a", "b"]})
+
+    assert cache.get("webdev") == {"results": ["a", "b"]}
+    assert cache.get("missing") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    """Test that entries older than the TTL are treated as misses."""
+    cache = SQLiteCache(tmp_path / "cache.sqlite3", ttl_seconds=60)
+
+    with patch("reddit_post_generator.cache.time.time", return_value=1000.0):
+        cache.set("topic", "results")
+    with patch("reddit_post_generator.cache.time.time", return_value=1059.0):
+        assert cache.get("topic") == "results"
+    with patch("reddit_post_generator.cache.time.time", return_value=1061.0):
+        assert cache.get("topic") is None
+
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    """Test that exceeding max_entries evicts the least recently used key."""
+    cache = SQLiteCache(tmp_path / "cache.sqlite3", max_entries=2)
+
+    with patch("reddit_post_generator.cache.time.time", side_effect=count(1)):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now the least recently used
+        cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_entries_survive_reopen_and_namespaces_are_isolated(tmp_path):
+    """Test that entries persist across instances and namespaces don't collide."""
+    path = tmp_path / "cache.sqlite3"
+    SQLiteCache(path, namespace="research").set("key", "persisted")
+
+    assert SQLiteCache(path, namespace="research").get("key") == "persisted"
+    assert SQLiteCache(path, namespace="other").get("key") is None
+
+
+def test_from_config_respects_enabled_flag(tmp_path):
+    """Test that a disabled cache section yields no cache."""
+    config = {
+        "cache": {
+            "path": str(tmp_path / "cache.sqlite3"),
+            "research": {"enabled": True, "ttl_seconds": 10, "max_entries": 5},
+            "subreddit": {"enabled": False},
+        }
+    }
+
+    research = SQLiteCache.from_config(config, "research")
+
+    assert research is not None
+    assert research.ttl_seconds == 10
+    assert research.max_entries == 5
+    assert SQLiteCache.from_config(config, "subreddit") is None
+
+
+def test_memory_cache_evicts_least_recently_used():
+    """Test that the in-memory backend enforces max_entries in LRU order."""
+    cache = MemoryCache(max_entries=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats.evictions == 1
+
+
+def test_create_cache_selects_backend(tmp_path):
+    """Test that the configured backend is used for each namespace."""
+    config = {
+        "cache": {
+            "path": str(tmp_path / "cache.sqlite3"),
+            "llm": {"backend": "memory", "max_entries": 10},
+            "research": {"backend": "sqlite"},
+            "subreddit": {"enabled": False},
+        }
+    }
+
+    assert isinstance(create_cache(config, "llm"), MemoryCache)
+    assert isinstance(create_cache(config, "research"), SQLiteCache)
+    assert create_cache(config, "subreddit") is None
+    with pytest.raises(ValueError, match="Unknown cache backend"):
+        create_cache({"cache": {"llm": {"backend": "redis"}}}, "llm")
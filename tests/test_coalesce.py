@@ -0,0 +1,112 @@
+"""Tests for request coalescing and idempotent posting."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from reddit_post_generator.cache import MemoryCache
+from reddit_post_generator.coalesce import PostLedger, RequestCoalescer, request_key, request_scope
+
+
+def user(payload) -> list[dict[str, str]]:
+    return [{"role": "user", "content": payload if isinstance(payload, str) else json.dumps(payload)}]
+
+
+def test_request_key_ignores_formatting_but_respects_idempotency_key():
+    """Test that equivalent requests share a key and an explicit idempotency_key wins."""
+    key = request_key(user({"topic": "rust", "subreddit": "rust"}))
+
+    assert request_key(user('{"subreddit": "rust",\n  "topic": "rust"}')) == key
+    assert request_key(user({"topic": "rust", "subreddit": "rust", "timeout_seconds": 30})) == key
+    assert request_key(user({"topic": "go", "subreddit": "golang"})) != key
+    assert request_key(user("  Write a post   about Rust ")) == request_key(user("Write a post about Rust"))
+    assert request_key(user({"topic": "rust", "idempotency_key": "abc"})) == "idempotency:abc"
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_run_once():
+    """Test that requests arriving while an identical one is in flight share its result."""
+    coalescer = RequestCoalescer()
+    calls = 0
+
+    async def generate():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "post"
+
+    results = await asyncio.gather(*(coalescer.run("key", generate) for _ in range(3)))
+
+    assert results == ["post", "post", "post"]
+    assert calls == 1
+    assert (coalescer.stats.runs, coalescer.stats.joined) == (1, 2)
+    assert await coalescer.run("key", generate) == "post"
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_run_is_cancelled_only_when_every_caller_leaves():
+    """Test that one caller going away leaves the shared run going for the others."""
+    coalescer = RequestCoalescer()
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def generate():
+        started.set()
+        await release.wait()
+        return "post"
+
+    first = asyncio.create_task(coalescer.run("key", generate))
+    await started.wait()
+    second = asyncio.create_task(coalescer.run("key", generate))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+    assert await second == "post"
+
+    release.clear()
+    lone = asyncio.create_task(coalescer.run("other", generate))
+    await asyncio.sleep(0.01)
+    run = coalescer._in_flight["other"]
+    lone.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await lone
+    await asyncio.sleep(0)
+    assert run.cancelled()
+
+
+def test_ledger_returns_the_earlier_post_on_retry():
+    """Test that a retried request gets its first post back and failures are not remembered."""
+    ledger = PostLedger(MemoryCache())
+    posted = json.dumps({"success": True, "post_id": "abc"})
+    create_post = MagicMock(side_effect=["Error: rate limited", posted, "unused"])
+    arguments = {"subreddit": "Rust", "title": "t", "content": "c"}
+
+    with request_scope("idempotency:1"):
+        assert ledger.tool_hook("create_post", create_post, arguments) == "Error: rate limited"
+        assert ledger.tool_hook("create_post", create_post, arguments) == posted
+        assert ledger.tool_hook("create_post", create_post, {**arguments, "subreddit": "rust"}) == posted
+    with request_scope("idempotency:2"):
+        assert ledger.tool_hook("create_post", create_post, arguments) == "unused"
+
+    assert create_post.call_count == 3
+    assert ledger.duplicates == 1
+
+
+def test_ledger_ignores_requests_without_an_idempotency_key():
+    """Test that identical plain requests, e.g. a recurring schedule, post every time."""
+    cache = MemoryCache()
+    ledger = PostLedger(cache)
+    posted = json.dumps({"success": True, "post_id": "abc"})
+    create_post = MagicMock(return_value=posted)
+    arguments = {"subreddit": "rust", "title": "t", "content": "c"}
+
+    for _ in range(2):
+        with request_scope(request_key(user({"topic": "rust", "subreddit": "rust"}))):
+            assert ledger.tool_hook("create_post", create_post, arguments) == posted
+
+    assert create_post.call_count == 2
+    assert len(cache) == 0
+    assert ledger.duplicates == 0
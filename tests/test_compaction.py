@@ -0,0 +1,120 @@
+"""Tests for tool output compaction."""
+
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+
+from benchmarks.fakes import FakeChatServer
+from reddit_post_generator.compaction import ToolOutputCompactor, fit_json
+from reddit_post_generator.deadlines import async_deadline_tool_hook
+from reddit_post_generator.metrics import async_tool_metrics_hook
+from reddit_post_generator.tools import CachedDuckDuckGoTools
+
+
+def test_unused_and_empty_fields_are_dropped():
+    """Test that subreddit payloads lose the sidebar markdown and empty values."""
+    compactor = ToolOutputCompactor()
+    info = {
+        "display_name": "rust",
+        "title": "The Rust Programming Language",
+        "description": "# Sidebar\n" + "Lots of markdown. " * 200,
+        "subscribers": 300000,
+        "created_utc": 1275000000.0,
+        "over18": False,
+        "public_description": "",
+        "url": "/r/rust/",
+        "available_flairs": ["News", "Discussion"],
+    }
+
+    compacted = json.loads(compactor.compact("get_subreddit_info", json.dumps(info)))
+
+    assert compacted == {
+        "display_name": "rust",
+        "title": "The Rust Programming Language",
+        "subscribers": 300000,
+        "over18": False,
+        "available_flairs": ["News", "Discussion"],
+    }
+    assert compactor.stats.tokens_saved > 0
+    assert compactor.stats.truncated == 0
+
+
+def test_fit_json_shortens_strings_then_lists():
+    """Test that oversized results stay valid JSON within the budget, keeping every item's keys."""
+    sources = [{"title": f"Source {i}", "url": f"https://example.com/{i}", "snippet": "word " * 100} for i in range(10)]
+
+    text = fit_json({"sources": sources}, max_chars=2000)
+    fitted = json.loads(text)
+
+    assert len(text) <= 2000
+    assert len(fitted["sources"]) == 10
+    assert all(source["snippet"].endswith("…") and source["url"] for source in fitted["sources"])
+
+    fitted = json.loads(fit_json({"sources": sources}, max_chars=600))
+    assert 1 <= len(fitted["sources"]) < 10
+    assert fitted["sources"][0]["title"] == "Source 0"
+
+
+def test_plain_text_is_cut_to_the_tool_budget():
+    """Test per-tool budgets and that non-JSON results are truncated, not parsed."""
+    compactor = ToolOutputCompactor(max_tokens=10, tool_tokens={"read_page": 50})
+
+    assert compactor.compact("web_search", "Error: " + "x" * 100) == "Error: " + "x" * 33 + "…"
+    assert len(compactor.compact("read_page", "y" * 1000)) == 201
+    assert compactor.compact("create_post", "Posted") == "Posted"
+    assert compactor.stats.truncated == 2
+
+
+@pytest.mark.asyncio
+async def test_tool_hook_compacts_async_results():
+    """Test that a coroutine passed through the hook is compacted once it finishes."""
+    compactor = ToolOutputCompactor()
+
+    async def get_subreddit_stats(subreddit):
+        return json.dumps({"subreddit_stats": {"display_name": subreddit, "description": "long sidebar"}})
+
+    result = compactor.tool_hook("get_subreddit_stats", get_subreddit_stats, {"subreddit": "rust"})
+
+    assert await result == '{"subreddit_stats":{"display_name":"rust"}}'
+
+
+@pytest.mark.asyncio
+async def test_async_hooks_run_sync_and_async_tools_in_agent_arun():
+    """Test that Agent.arun runs every tool through the async hooks, with sync tools off the event loop."""
+    compactor = ToolOutputCompactor()
+    search_threads = []
+
+    def web_search(self, query, max_results=5):
+        search_threads.append(threading.current_thread())
+        return '[{"title": "Rust 2025"}]'
+
+    async def get_subreddit_info(subreddit_name: str) -> str:
+        """Get information about a subreddit.
+
+        Args:
+            subreddit_name (str): Name of the subreddit.
+        """
+        return json.dumps({"display_name": subreddit_name, "description": "# Sidebar\n" + "markdown " * 100})
+
+    server = FakeChatServer().start()
+    agent = Agent(
+        model=OpenAIChat(id="gpt-4o-mini", api_key="test", base_url=server.base_url),
+        tools=[CachedDuckDuckGoTools(include_tools=["web_search"]), get_subreddit_info],
+        tool_hooks=[compactor.async_tool_hook, async_tool_metrics_hook, async_deadline_tool_hook],
+    )
+    try:
+        with patch("agno.tools.websearch.WebSearchTools.web_search", web_search):
+            result = await agent.arun('{"topic": "rust async", "subreddit": "rust"}')
+    finally:
+        server.stop()
+
+    assert {tool.tool_name: tool.result for tool in result.tools} == {
+        "web_search": '[{"title":"Rust 2025"}]',
+        "get_subreddit_info": '{"display_name":"rust"}',
+    }
+    assert search_threads and search_threads[0] is not threading.main_thread()
+    assert compactor.stats.calls == 2
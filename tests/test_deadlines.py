@@ -0,0 +1,111 @@
+"""Tests for per-request deadlines."""
+
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from reddit_post_generator.cache import MemoryCache
+from reddit_post_generator.deadlines import (
+    PARTIAL_RESEARCH_HEADER,
+    Deadline,
+    current_deadline,
+    deadline_scope,
+    deadline_tool_hook,
+)
+from reddit_post_generator.main import handler
+from reddit_post_generator.pipeline import PostDraft, PostPipeline
+from reddit_post_generator.pool import AgentPool
+
+SOURCES = json.dumps({
+    "topic": "rust",
+    "sources": [{"title": "Rust 2025", "url": "https://blog.rust-lang.org/2025", "snippet": "Async closures land"}],
+})
+
+
+class SlowResearchAgent:
+    """Agent that finds one source, then hangs until it is cancelled."""
+
+    async def arun(self, messages, **kwargs):
+        deadline_tool_hook("research_topic", lambda: SOURCES, {})
+        await asyncio.sleep(10)
+
+
+def test_sync_tools_give_up_after_their_budget():
+    """Test that a hung sync tool returns an error string once its budget is spent."""
+    with deadline_scope(Deadline(5, tool_seconds=0.05)) as deadline:
+        start = time.monotonic()
+        result = deadline_tool_hook("web_search", lambda query: time.sleep(1), {"query": "rust"})
+
+    assert result.startswith("Error: web_search timed out")
+    assert time.monotonic() - start < 0.5
+    assert deadline.findings == []
+
+
+@pytest.mark.asyncio
+async def test_async_tools_are_bounded_and_findings_kept():
+    """Test that async tool calls are cancelled after their budget and results are recorded."""
+
+    async def slow() -> str:
+        await asyncio.sleep(1)
+        return "late"
+
+    async def fast() -> str:
+        return SOURCES
+
+    with deadline_scope(Deadline(5, tool_seconds=0.05)) as deadline:
+        assert (await deadline_tool_hook("get_subreddit_info", slow, {})).startswith("Error: get_subreddit_info")
+        assert await deadline_tool_hook("research_topic", fast, {}) == SOURCES
+
+    assert deadline.findings == [("research_topic", SOURCES)]
+    assert current_deadline() is None
+
+
+@pytest.mark.asyncio
+async def test_handler_returns_partial_research_when_the_run_times_out():
+    """Test that a payload timeout_seconds bounds the run and partial findings come back."""
+    pool = AgentPool(SlowResearchAgent, size=1)
+    pool.start()
+    message = {"role": "user", "content": json.dumps({"topic": "rust", "timeout_seconds": 0.1})}
+
+    with (
+        patch("reddit_post_generator.main._initialized", True),
+        patch("reddit_post_generator.main.agent_pool", pool),
+        patch("reddit_post_generator.main.history", None),
+    ):
+        result = await asyncio.wait_for(handler([message]), timeout=2)
+
+    assert "ran out of time (0.1s)" in result
+    assert "- Rust 2025: Async closures land (https://blog.rust-lang.org/2025)" in result
+    assert pool.available == 1
+
+
+@pytest.mark.asyncio
+async def test_pipeline_drafts_from_partial_research():
+    """Test that research cut off by its share of the deadline still feeds the draft stage."""
+    drafts = []
+
+    class DraftAgent:
+        async def arun(self, messages):
+            drafts.append(messages[0]["content"])
+            return MagicMock(content=PostDraft(title="Rust", content="Body"))
+
+    cache = MemoryCache()
+    pipeline = PostPipeline(
+        AgentPool(SlowResearchAgent, size=1),
+        AgentPool(DraftAgent, size=1),
+        AgentPool(MagicMock, size=1),
+        cache=cache,
+    )
+    pipeline.start()
+
+    with deadline_scope(Deadline(0.4, research_share=0.25)):
+        report = await pipeline.run({"topic": "rust", "subreddit": "rust", "submit": False})
+
+    assert report["success"] is True
+    assert report["metadata"]["research_partial"] is True
+    assert PARTIAL_RESEARCH_HEADER in drafts[0]
+    assert report["research_summary"]["sources_used"] == 1
+    assert len(cache) == 1  # only the draft; partial research isn't cached
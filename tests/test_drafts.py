@@ -0,0 +1,110 @@
+"""Tests for draft-only (dry-run) requests."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from reddit_post_generator.batch import parse_dry_run
+from reddit_post_generator.drafts import DraftReport, draft_report
+from reddit_post_generator.main import create_argument_parser, create_dry_run_agent, handler
+from reddit_post_generator.models import CachedOpenAIChat
+from reddit_post_generator.pool import AgentPool
+from reddit_post_generator.reddit_client import AsyncRedditClient
+
+DRAFT = DraftReport(
+    subreddit="rust",
+    title="What's new in Rust 2025",
+    content="Async closures are here.",
+    flair="News",
+    key_findings=["Async closures are stable"],
+    sources=["https://blog.rust-lang.org/2025", "https://blog.rust-lang.org/2025"],
+)
+
+
+def user(payload) -> list[dict[str, str]]:
+    return [{"role": "user", "content": payload if isinstance(payload, str) else json.dumps(payload)}]
+
+
+def test_requests_opt_in_with_dry_run_or_submit_false():
+    """Test that dry_run and submit flags are read from structured requests only."""
+    assert parse_dry_run(user({"topic": "rust", "dry_run": True})) is True
+    assert parse_dry_run(user({"topic": "rust", "submit": False})) is True
+    assert parse_dry_run(user({"topic": "rust", "submit": True})) is False
+    assert parse_dry_run(user({"topic": "rust"})) is None
+    assert parse_dry_run(user("Draft a post about Rust")) is None
+    assert create_argument_parser().parse_args(["--dry-run"]).dry_run is True
+
+
+def test_dry_run_agent_has_no_posting_tools():
+    """Test that the draft-only agent can read subreddit info but never create posts."""
+    client = AsyncRedditClient("id", "secret")
+
+    agent = create_dry_run_agent(CachedOpenAIChat(id="gpt-4o-mini", api_key="test"), {}, reddit_client=client)
+
+    reddit_tools = agent.tools[1]
+    assert set(reddit_tools.async_functions) == {"get_subreddit_info", "get_subreddit_rules"}
+    assert agent.output_schema is DraftReport
+
+
+def test_report_follows_the_skill_output_format():
+    """Test that drafts are reported like skill.yaml's output_format, and failures say so."""
+    report = draft_report(MagicMock(content=DRAFT), "query", 1200)
+
+    assert report["success"] is True
+    assert report["post_details"]["post_length"] == len(DRAFT.content)
+    assert report["research_summary"]["sources_used"] == 1
+    assert report["compliance_check"] == {"subreddit_rules_passed": True, "warnings": []}
+    assert report["metadata"] == {"query": "query", "processing_time_ms": 1200, "post_status": "draft", "dry_run": True}
+    assert draft_report("Timed out", "query", 10)["success"] is False
+
+
+@pytest.mark.asyncio
+async def test_handler_sends_dry_runs_to_the_draft_pool():
+    """Test that a dry-run request never touches the posting agents."""
+    drafter = MagicMock()
+    drafter.arun = AsyncMock(return_value=MagicMock(content=DRAFT))
+    poster = MagicMock()
+    draft_pool, agent_pool = AgentPool(lambda: drafter, size=1), AgentPool(lambda: poster, size=1)
+    draft_pool.start()
+    agent_pool.start()
+
+    with (
+        patch("reddit_post_generator.main._initialized", True),
+        patch("reddit_post_generator.main.agent_pool", agent_pool),
+        patch("reddit_post_generator.main.draft_pool", draft_pool),
+        patch("reddit_post_generator.main.history", None),
+    ):
+        result = json.loads(await handler(user({"topic": "Rust 2025", "subreddit": "rust", "dry_run": True})))
+
+    assert result["post_details"]["title"] == DRAFT.title
+    assert result["metadata"]["post_status"] == "draft"
+    drafter.arun.assert_awaited_once()
+    poster.arun.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_dry_run_batch_jobs_return_the_json_report():
+    """Test that each dry-run batch job's content is skill.yaml's report, not a repr of the draft."""
+    drafter = MagicMock()
+    drafter.arun = AsyncMock(return_value=MagicMock(content=DRAFT))
+    researcher = MagicMock()
+    researcher.arun = AsyncMock(return_value=MagicMock(content="- Async closures are stable"))
+    draft_pool, research_pool = AgentPool(lambda: drafter, size=1), AgentPool(lambda: researcher, size=1)
+    draft_pool.start()
+    research_pool.start()
+
+    with (
+        patch("reddit_post_generator.main._initialized", True),
+        patch("reddit_post_generator.main.agent_pool", AgentPool(MagicMock, size=1)),
+        patch("reddit_post_generator.main.draft_pool", draft_pool),
+        patch("reddit_post_generator.main.research_pool", research_pool),
+        patch("reddit_post_generator.main.history", None),
+    ):
+        result = await handler(user({"jobs": [{"topic": "Rust 2025", "subreddit": "rust"}], "dry_run": True}))
+        (line,) = [json.loads(line) async for line in result]
+
+    report = json.loads(line["content"])
+    assert report["success"] is True
+    assert report["post_details"]["title"] == DRAFT.title
+    assert report["metadata"]["dry_run"] is True
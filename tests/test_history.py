@@ -0,0 +1,95 @@
+"""Tests for compacted session history."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from reddit_post_generator.history import HistoryManager, message_tokens
+from reddit_post_generator.main import run_agent
+from reddit_post_generator.pool import AgentPool
+
+REPORT = """# Reddit Post Generated Successfully
+
+## Post Details
+- **Subreddit:** rust
+- **Title:** What's new in Rust 2025
+- **Status:** Submitted
+
+## Research Summary
+Sources: https://blog.rust-lang.org/a https://example.com/b
+```json
+{"results": ["...long search payload..."]}
+```
+Link: https://www.reddit.com/r/rust/comments/abc123/whats_new/
+"""
+
+
+def test_earlier_reports_are_summarized_and_tool_payloads_dropped():
+    """Test that reports shrink to their key fields and tool messages disappear."""
+    manager = HistoryManager()
+    messages = [
+        {"role": "system", "content": "You are helpful."},
+        {"role": "user", "content": "Post about Rust 2025 in r/rust"},
+        {"role": "tool", "content": "x" * 5000},
+        {"role": "assistant", "content": REPORT},
+        {"role": "user", "content": "Now one for r/programming"},
+    ]
+
+    compacted = manager.compact(messages)
+
+    assert compacted[0] == messages[0]
+    assert compacted[-1] == messages[-1]
+    assert [m["role"] for m in compacted] == ["system", "user", "assistant", "user"]
+    assert compacted[2]["content"] == (
+        "Earlier post - Subreddit: rust | Title: What's new in Rust 2025 | Status: Submitted"
+        " | https://www.reddit.com/r/rust/comments/abc123/whats_new/"
+    )
+    assert manager.stats.tokens_saved > 1000
+    assert manager.stats.sent_tokens == message_tokens(compacted)
+
+
+def test_oldest_turns_are_evicted_first():
+    """Test the turn limit and the token budget both drop the oldest history."""
+    turns = [{"role": "user" if i % 2 == 0 else "assistant", "content": f"turn {i} " + "word " * 40} for i in range(10)]
+    latest = {"role": "user", "content": "latest request"}
+
+    by_turns = HistoryManager(max_turns=2, max_tokens=100_000).compact([*turns, latest])
+    assert [m["content"].split()[1] for m in by_turns[:-1]] == ["6", "7", "8", "9"]
+
+    by_budget = HistoryManager(max_turns=10, max_tokens=150, summary_chars=1000).compact([*turns, latest])
+    assert message_tokens(by_budget) <= 150
+    assert by_budget[-1] == latest
+    assert by_budget[-2]["content"].startswith("turn 9")
+
+
+def test_latest_message_is_never_trimmed():
+    """Test that an over-budget request is still sent whole, with no history."""
+    latest = {"role": "user", "content": "topic " * 2000}
+
+    compacted = HistoryManager(max_tokens=10).compact([{"role": "user", "content": "old"}, latest])
+
+    assert compacted == [latest]
+
+
+@pytest.mark.asyncio
+async def test_run_agent_sends_compacted_history():
+    """Test that run_agent passes the compacted history to the agent."""
+    agent = MagicMock()
+    agent.arun = AsyncMock(return_value="done")
+    pool = AgentPool(lambda: agent, size=1)
+    pool.start()
+    messages = [
+        {"role": "user", "content": "first"},
+        {"role": "assistant", "content": REPORT},
+        {"role": "user", "content": "second"},
+    ]
+
+    with (
+        patch("reddit_post_generator.main.agent_pool", pool),
+        patch("reddit_post_generator.main.history", HistoryManager()),
+    ):
+        await run_agent(messages)
+
+    sent = agent.arun.call_args.args[0]
+    assert sent[1]["content"].startswith("Earlier post - Subreddit: rust")
+    assert sent[-1] == {"role": "user", "content": "second"}
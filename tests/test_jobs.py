@@ -0,0 +1,171 @@
+"""Tests for the durable job queue."""
+
+import asyncio
+import importlib
+import json
+import sqlite3
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from starlette.applications import Starlette
+
+from reddit_post_generator.jobs import FAILED, QUEUED, RUNNING, SUCCEEDED, JobQueue, JobQueueFullError, JobStore
+from reddit_post_generator.main import handle_job_request, start_job_queue
+from reddit_post_generator.workers import running_at_startup
+
+main = sys.modules["reddit_post_generator.main"]
+
+
+def user(payload) -> list[dict[str, str]]:
+    return [{"role": "user", "content": json.dumps(payload)}]
+
+
+def test_submit_queues_by_priority_and_strips_queue_fields(tmp_path):
+    """Test that jobs are claimed highest priority first and run without their queueing fields."""
+    queue = JobQueue(JobStore(tmp_path / "jobs.sqlite3"), AsyncMock(), max_queued=2)
+
+    low = queue.submit(user({"topic": "go", "async": True}), {"topic": "go", "async": True})
+    urgent = queue.submit(user({"topic": "rust", "async": True}), {"topic": "rust", "async": True, "priority": 5})
+
+    assert queue.status(low.id)["position"] == 1
+    with pytest.raises(JobQueueFullError):
+        queue.submit(user({"topic": "c", "async": True}), {"topic": "c", "async": True})
+
+    claimed = queue.store.claim(lease_seconds=60)
+    assert claimed.id == urgent.id
+    assert (claimed.status, claimed.attempts) == (RUNNING, 1)
+    assert json.loads(claimed.messages[-1]["content"]) == {"topic": "rust", "idempotency_key": f"job:{urgent.id}"}
+
+
+@pytest.mark.asyncio
+async def test_runners_complete_jobs_and_watchers_see_every_change(tmp_path):
+    """Test that a queued job runs in the background and its result is reported when polled."""
+    run = AsyncMock(return_value='{"success": true, "post_id": "abc"}')
+    queue = JobQueue(JobStore(tmp_path / "jobs.sqlite3"), run, poll_interval=0.01)
+    job = queue.submit(user({"topic": "rust"}), {"topic": "rust", "async": True})
+
+    queue.start()
+    updates = [json.loads(line) async for line in queue.watch(job.id)]
+    await queue.stop()
+
+    assert updates[-1]["status"] == SUCCEEDED
+    assert updates[-1]["result"] == {"success": True, "post_id": "abc"}
+    assert queue.status(job.id)["result"] == {"success": True, "post_id": "abc"}
+    run.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_attempts_are_retried_until_max_attempts(tmp_path):
+    """Test that a failing job is retried, then marked failed with its last error."""
+    run = AsyncMock(side_effect=RuntimeError("model unavailable"))
+    queue = JobQueue(JobStore(tmp_path / "jobs.sqlite3"), run, max_attempts=2, retry_backoff=0, poll_interval=0.01)
+    job = queue.submit(user({"topic": "rust"}), {"topic": "rust", "async": True})
+
+    queue.start()
+    updates = [json.loads(line) async for line in queue.watch(job.id)]
+    await queue.stop()
+
+    assert run.await_count == 2
+    assert updates[-1]["status"] == FAILED
+    assert updates[-1]["attempts"] == 2
+    assert updates[-1]["error"] == "RuntimeError: model unavailable"
+    assert queue.stats.retried == 1
+
+
+@pytest.mark.asyncio
+async def test_runners_survive_claim_errors_and_are_replaced_not_added(tmp_path):
+    """Test that a locked database doesn't kill a runner and start() only replaces dead runners."""
+    run = AsyncMock(return_value='{"success": true}')
+    queue = JobQueue(JobStore(tmp_path / "jobs.sqlite3"), run, concurrency=2, poll_interval=0.01)
+    job = queue.submit(user({"topic": "rust"}), {"topic": "rust", "async": True})
+    claim = queue.store.claim
+    calls = iter([sqlite3.OperationalError("database is locked")])
+
+    def flaky_claim(lease_seconds):
+        error = next(calls, None)
+        if error is not None:
+            raise error
+        return claim(lease_seconds)
+
+    with patch.object(queue.store, "claim", side_effect=flaky_claim):
+        queue.start()
+        updates = [json.loads(line) async for line in queue.watch(job.id)]
+        assert updates[-1]["status"] == SUCCEEDED
+        assert not any(runner.done() for runner in queue._runners)
+
+        survivor = queue._runners[0]
+        queue._runners[1].cancel()
+        await asyncio.sleep(0)
+        queue.start()
+        assert len(queue._runners) == 2
+        assert queue._runners[0] is survivor
+        assert all(not runner.done() for runner in queue._runners)
+    await queue.stop()
+
+
+def test_jobs_survive_restarts_and_expired_leases(tmp_path):
+    """Test that queued jobs persist across stores and a dead worker's job is claimed again."""
+    path = tmp_path / "jobs.sqlite3"
+    store = JobStore(path)
+    store.add("a", user({"topic": "rust"}), priority=0, max_attempts=2)
+    assert store.claim(lease_seconds=60).id == "a"
+    store.close()
+
+    restarted = JobStore(path)
+    assert restarted.claim(lease_seconds=60) is None
+    with patch("reddit_post_generator.jobs.time.time", return_value=10**10):
+        reclaimed = restarted.claim(lease_seconds=60)
+    assert (reclaimed.id, reclaimed.attempts) == ("a", 2)
+
+    restarted.release("a")
+    assert restarted.get("a").status == QUEUED
+
+
+def test_handler_submits_and_polls_jobs(tmp_path):
+    """Test that async requests return a job id at once and job_id requests report on it."""
+    queue = JobQueue(JobStore(tmp_path / "jobs.sqlite3"), AsyncMock())
+
+    with patch("reddit_post_generator.main.job_queue", queue):
+        submitted = json.loads(handle_job_request(user({"topic": "rust", "async": True})))
+        polled = json.loads(handle_job_request(user({"job_id": submitted["job_id"]})))
+        assert handle_job_request(user({"topic": "rust"})) is None
+
+    assert submitted["status"] == QUEUED
+    assert polled["job_id"] == submitted["job_id"]
+    assert polled["position"] == 0
+    with patch("reddit_post_generator.main.job_queue", None), pytest.raises(ValueError, match="disabled"):
+        handle_job_request(user({"job_id": submitted["job_id"]}))
+
+
+def test_jobs_left_pending_resume_when_the_server_starts(tmp_path):
+    """Test that a job queued before a restart runs at server startup, with no new request."""
+    path = tmp_path / "jobs.sqlite3"
+    store = JobStore(path)
+    store.add("left", user({"topic": "rust"}), priority=0, max_attempts=1)
+    store.close()
+    bindufy_module = importlib.import_module("bindu.penguin.bindufy")
+    respond = AsyncMock(return_value='{"success": true}')
+
+    def serve_until_drained(app, host, port, display_info=True):
+        async def lifespan():
+            async with app.router.lifespan_context(app):
+                while main.job_queue.store.get("left").status != SUCCEEDED:
+                    await asyncio.sleep(0.01)
+                await main.job_queue.stop()
+
+        asyncio.run(asyncio.wait_for(lifespan(), timeout=5))
+
+    with (
+        patch.object(main, "_config", {"jobs": {"path": str(path), "poll_interval_seconds": 0.01}}),
+        patch.object(main, "job_queue", None),
+        patch.object(main, "ensure_initialized", AsyncMock()),
+        patch.object(main, "respond", respond),
+        patch.object(bindufy_module, "start_uvicorn_server", serve_until_drained),
+    ):
+        with running_at_startup(start_job_queue):
+            bindufy_module.start_uvicorn_server(Starlette(), host="127.0.0.1", port=0)
+        assert main.job_queue.store.get("left").status == SUCCEEDED
+        main.job_queue.close()
+
+    respond.assert_awaited_once_with(user({"topic": "rust"}))
@@ -1,10 +1,11 @@
 """Tests for the Reddit Post Generator Agent."""
 
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from reddit_post_generator.main import handler
+from reddit_post_generator.main import handler, run_agent_server
 
 
 @pytest.mark.asyncio
@@ -219,3 +220,73 @@ async def test_handler_with_research_and_post_query():
         "title": "The Ethical Implications of Advanced AI Systems",
         "engagement_prediction": {"estimated_upvotes": 300, "expected_comments": 75},
     }
+
+
+@pytest.mark.asyncio
+async def test_handler_skips_lock_once_initialized():
+    """Test that handler does not acquire the init lock after initialization."""
+    messages = [{"role": "user", "content": "Create a post about Rust for r/programming"}]
+
+    mock_response = MagicMock()
+    mock_response.run_id = "fast-path-run-id"
+
+    with (
+        patch("reddit_post_generator.main._initialized", True),
+        patch("reddit_post_generator.main.initialize_agent", new_callable=AsyncMock) as mock_init,
+        patch(
+            "reddit_post_generator.main.run_agent",
+            new_callable=AsyncMock,
+            return_value=mock_response,
+        ),
+        patch("reddit_post_generator.main._init_lock") as mock_lock,
+    ):
+        result = await handler(messages)
+
+    # The lock is never entered and the agent is not re-initialized
+    mock_lock.__aenter__.assert_not_called()
+    mock_init.assert_not_called()
+    assert result.run_id == "fast-path-run-id"
+
+
+def test_warm_up_initializes_before_server_start():
+    """Test that warm_up in config initializes the agent before bindufy runs."""
+    call_order = []
+
+    async def fake_initialize():
+        call_order.append("initialize")
+
+    with (
+        patch("reddit_post_generator.main._initialized", False),
+        patch("reddit_post_generator.main._config", None),
+        patch("reddit_post_generator.main.initialize_agent", side_effect=fake_initialize),
+        patch(
+            "reddit_post_generator.main.bindufy",
+            side_effect=lambda config, handler: call_order.append("bindufy"),
+        ),
+        patch("reddit_post_generator.main.cleanup", new_callable=AsyncMock),
+    ):
+        run_agent_server({"warm_up": True, "metrics": {"enabled": False}})
+        assert sys.modules["reddit_post_generator.main"]._initialized is True
+
+    assert call_order == ["initialize", "bindufy"]
+
+
+def test_server_starts_when_metrics_port_is_taken():
+    """Test that a busy metrics port is logged and the agent server still starts."""
+    main_module = sys.modules["reddit_post_generator.main"]
+    collectors = list(main_module.registry._collectors)
+
+    with (
+        patch("reddit_post_generator.main._config", None),
+        patch(
+            "reddit_post_generator.main.start_metrics_server",
+            side_effect=OSError(98, "Address already in use"),
+        ) as mock_metrics,
+        patch("reddit_post_generator.main.bindufy") as mock_bindufy,
+        patch("reddit_post_generator.main.cleanup", new_callable=AsyncMock),
+    ):
+        run_agent_server({"metrics": {"port": 9464}})
+
+    mock_metrics.assert_called_once_with("127.0.0.1", 9464)
+    mock_bindufy.assert_called_once()
+    assert main_module.registry._collectors == collectors
@@ -0,0 +1,133 @@
+"""Tests for latency, token and cache metrics."""
+
+import asyncio
+import urllib.request
+
+import pytest
+from agno.metrics import MessageMetrics
+from agno.models.response import ModelResponse
+
+from reddit_post_generator.metrics import MetricsRegistry, registry, start_metrics_server, timed, tool_metrics_hook
+from reddit_post_generator.models import MetricsMixin
+
+
+def test_quantiles_use_recent_window():
+    """Test that p50/p95/p99 are computed over the last window of samples."""
+    metrics = MetricsRegistry(window=100)
+    for ms in range(1, 201):
+        metrics.observe("tool", "web_search", ms / 1000)
+
+    quantiles = metrics.quantiles("tool", "web_search")
+
+    assert quantiles[0.5] == pytest.approx(0.151)
+    assert quantiles[0.99] == pytest.approx(0.2)
+    assert metrics.snapshot()["latency"]["tool:web_search"]["count"] == 200
+
+
+def test_render_prometheus_text():
+    """Test the exposition format for summaries, tokens and collectors."""
+    metrics = MetricsRegistry()
+    metrics.observe("model", "gpt-4o", 1.5, error=True)
+    metrics.record_tokens("gpt-4o", 100, 20)
+    metrics.add_collector(lambda: [("reddit_post_generator_cache_hit_ratio", {"cache": "llm"}, 0.5)])
+
+    text = metrics.render()
+
+    assert "# TYPE reddit_post_generator_latency_seconds summary" in text
+    assert 'reddit_post_generator_latency_seconds{phase="model",name="gpt-4o",quantile="0.95"} 1.500000' in text
+    assert 'reddit_post_generator_latency_seconds_count{phase="model",name="gpt-4o"} 1' in text
+    assert 'reddit_post_generator_errors_total{phase="model",name="gpt-4o"} 1' in text
+    assert 'reddit_post_generator_tokens_total{model="gpt-4o",kind="input"} 100' in text
+    assert 'reddit_post_generator_cache_hit_ratio{cache="llm"} 0.5' in text
+
+
+def test_collector_samples_are_grouped_into_described_families():
+    """Test that each collected family gets one HELP and TYPE line followed by all of its samples."""
+    metrics = MetricsRegistry()
+    metrics.add_collector(
+        lambda: [
+            (f"reddit_post_generator_cache_{metric}", {"cache": cache}, 1)
+            for cache in ("llm", "research")
+            for metric in ("hits_total", "hit_ratio")
+        ],
+        {"reddit_post_generator_cache_hits_total": "Cache hits", "reddit_post_generator_cache_hit_ratio": "Hit ratio"},
+    )
+
+    lines = metrics.render().splitlines()
+    start = lines.index("# HELP reddit_post_generator_cache_hits_total Cache hits")
+
+    assert lines[start:] == [
+        "# HELP reddit_post_generator_cache_hits_total Cache hits",
+        "# TYPE reddit_post_generator_cache_hits_total counter",
+        'reddit_post_generator_cache_hits_total{cache="llm"} 1',
+        'reddit_post_generator_cache_hits_total{cache="research"} 1',
+        "# HELP reddit_post_generator_cache_hit_ratio Hit ratio",
+        "# TYPE reddit_post_generator_cache_hit_ratio gauge",
+        'reddit_post_generator_cache_hit_ratio{cache="llm"} 1',
+        'reddit_post_generator_cache_hit_ratio{cache="research"} 1',
+    ]
+
+
+def test_tool_hook_and_timed_record_errors():
+    """Test that raised exceptions and "Error ..." tool results both count as errors."""
+    assert tool_metrics_hook("metrics_test_tool", lambda query: f"results for {query}", {"query": "ai"}) == (
+        "results for ai"
+    )
+    tool_metrics_hook("metrics_test_tool", lambda: "Error getting subreddit info: 404", {})
+    with pytest.raises(RuntimeError), timed("init", "metrics_test_init"):
+        raise RuntimeError
+
+    latency = registry.snapshot()["latency"]
+    assert latency["tool:metrics_test_tool"]["count"] == 2
+    assert latency["tool:metrics_test_tool"]["errors"] == 1
+    assert latency["init:metrics_test_init"]["errors"] == 1
+
+
+def test_model_mixin_times_calls_and_counts_tokens():
+    """Test that provider calls are timed and their token usage and prompt size per turn recorded."""
+
+    class FakeModel:
+        def invoke(self, *args, **kwargs):
+            return ModelResponse(response_usage=MessageMetrics(input_tokens=12, output_tokens=7))
+
+    class InstrumentedModel(MetricsMixin, FakeModel):
+        id = "metrics-test-model"
+
+    InstrumentedModel().invoke(messages=[])
+
+    snapshot = registry.snapshot()
+    assert snapshot["latency"]["model:metrics-test-model"]["count"] == 1
+    assert snapshot["tokens"]["metrics-test-model:input"] == 12
+    assert snapshot["tokens"]["metrics-test-model:output"] == 7
+    assert snapshot["prompt_tokens"]["metrics-test-model"] == {"turns": 1, "p50": 12, "p95": 12, "p99": 12}
+    assert 'reddit_post_generator_prompt_tokens_count{model="metrics-test-model"} 1' in registry.render()
+
+
+def test_metrics_server_serves_metrics():
+    """Test that /metrics is served and other paths are not."""
+    server = start_metrics_server(port=0)
+    try:
+        url = f"http://127.0.0.1:{server.server_port}"
+        with urllib.request.urlopen(f"{url}/metrics") as response:  # noqa: S310
+            assert "reddit_post_generator_latency_seconds" in response.read().decode()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{url}/other")  # noqa: S310
+    finally:
+        server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_tool_hook_times_async_tools_until_they_finish():
+    """Test that a coroutine passed through the hook is timed when awaited, not when created."""
+
+    async def slow_tool():
+        await asyncio.sleep(0.05)
+        return "Error creating post: 500"
+
+    result = tool_metrics_hook("metrics_async_tool", slow_tool, {})
+    assert await result == "Error creating post: 500"
+
+    latency = registry.snapshot()["latency"]["tool:metrics_async_tool"]
+    assert latency["count"] == 1
+    assert latency["errors"] == 1
+    assert latency["p50"] >= 0.05
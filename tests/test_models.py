@@ -0,0 +1,53 @@
+"""Tests for the cached chat models."""
+
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.tools.function import Function
+
+from reddit_post_generator.cache import MemoryCache
+from reddit_post_generator.models import CachedOpenAIChat, CachedOpenRouter
+
+
+def make_model(**kwargs) -> CachedOpenAIChat:
+    """Create a cached OpenAI model with an in-memory response cache."""
+    return CachedOpenAIChat(id="gpt-4o", api_key="test", cache_response=True, response_cache=MemoryCache(), **kwargs)
+
+
+def test_key_ignores_time_of_day_in_datetime_context():
+    """Test that agno's current-time line doesn't make every key unique."""
+    model = make_model()
+    morning = [Message(role="system", content="The current time is 2026-01-13 09:15:02.123456.")]
+    evening = [Message(role="system", content="The current time is 2026-01-13 21:40:55.654321.")]
+    next_day = [Message(role="system", content="The current time is 2026-01-14 09:15:02.123456.")]
+
+    assert model._get_model_cache_key(morning, stream=False) == model._get_model_cache_key(evening, stream=False)
+    assert model._get_model_cache_key(morning, stream=False) != model._get_model_cache_key(next_day, stream=False)
+
+
+def test_key_includes_model_id_and_tool_schema():
+    """Test that different models or tool schemas never share a cached response."""
+    messages = [Message(role="user", content="Create a post about AI for r/technology")]
+    search = Function(name="web_search", description="Search the web", parameters={"type": "object"})
+    news = Function(name="search_news", description="Search news", parameters={"type": "object"})
+
+    gpt = make_model()
+    router = CachedOpenRouter(id="openai/gpt-4o", api_key="test", response_cache=MemoryCache())
+
+    assert gpt._get_model_cache_key(messages, stream=False) != router._get_model_cache_key(messages, stream=False)
+    assert gpt._get_model_cache_key(messages, stream=False, tools=[search]) != gpt._get_model_cache_key(
+        messages, stream=False, tools=[search, news]
+    )
+
+
+def test_responses_round_trip_through_backend():
+    """Test that saved responses are served back with hit/miss counters updated."""
+    model = make_model()
+    key = model._get_model_cache_key([Message(role="user", content="hello")], stream=False)
+
+    assert model._get_cached_model_response(key) is None
+    model._save_model_response_to_cache(key, ModelResponse(role="assistant", content="Hi r/webdev!"))
+    cached = model._get_cached_model_response(key)
+
+    assert model._model_response_from_cache(cached).content == "Hi r/webdev!"
+    assert model.response_cache.stats.hits == 1
+    assert model.response_cache.stats.misses == 1
@@ -0,0 +1,153 @@
+"""Tests for the fetched page store."""
+
+import json
+
+import httpx
+import pytest
+
+from reddit_post_generator.pages import PageStore, UnsafeURLError, UnsupportedContentError, extract_text
+from reddit_post_generator.tools import CachedDuckDuckGoTools
+
+ARTICLE = """<html><head><title> Rust 2025 </title><script>track()</script></head>
+<body><nav>Home | About</nav>
+<article><h1>What's new in Rust</h1><p>The 2025 edition brings async closures.</p>
+<p>{filler}</p></article>
+<footer>Copyright</footer></body></html>""".replace("{filler}", "More details. " * 20)
+
+
+class FakeSite:
+    """httpx handler serving one page with an ETag and honouring If-None-Match."""
+
+    def __init__(self, etag: str | None = '"v1"') -> None:
+        self.etag = etag
+        self.downloads = 0
+        self.not_modified = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if self.etag and request.headers.get("If-None-Match") == self.etag:
+            self.not_modified += 1
+            return httpx.Response(304)
+        self.downloads += 1
+        headers = {"Content-Type": "text/html; charset=utf-8"}
+        if self.etag:
+            headers["ETag"] = self.etag
+        return httpx.Response(200, text=ARTICLE, headers=headers)
+
+
+# Public address every test host resolves to, unless a test says otherwise
+PUBLIC_IP = "93.184.215.14"
+
+
+def make_store(tmp_path, site, **kwargs) -> PageStore:
+    return PageStore(
+        tmp_path / "pages.sqlite3",
+        client=httpx.Client(transport=httpx.MockTransport(site)),
+        resolve=kwargs.pop("resolve", lambda host, port: [PUBLIC_IP]),
+        **kwargs,
+    )
+
+
+def test_extract_text_keeps_main_content_only():
+    """Test that navigation, scripts and footers are dropped and the article kept."""
+    title, text = extract_text(ARTICLE)
+
+    assert title == "Rust 2025"
+    assert text.startswith("What's new in Rust\nThe 2025 edition brings async closures.")
+    assert "Home" not in text
+    assert "track()" not in text
+    assert "Copyright" not in text
+
+
+def test_fresh_pages_skip_the_network_and_stale_ones_revalidate(tmp_path):
+    """Test that fresh pages are served locally and stale pages cost only a 304."""
+    site = FakeSite()
+    store = make_store(tmp_path, site, fresh_seconds=3600)
+    first = store.get("https://example.com/rust")
+    store.get("https://example.com/rust")
+    assert site.downloads == 1
+    assert store.stats.hits == 1
+
+    store.fresh_seconds = 0
+    again = store.get("https://example.com/rust")
+
+    assert site.not_modified == 1
+    assert site.downloads == 1
+    assert again.text == first.text
+    assert store.not_modified == 1
+
+
+def test_pages_survive_a_restart(tmp_path):
+    """Test that stored pages are read back from disk by a new store."""
+    site = FakeSite()
+    make_store(tmp_path, site).get("https://example.com/rust")
+
+    page = make_store(tmp_path, site).get("https://example.com/rust")
+
+    assert site.downloads == 1
+    assert page.title == "Rust 2025"
+
+
+def test_read_page_returns_truncated_text(tmp_path):
+    """Test that the tool hands the model extracted text cut to page_chars."""
+    tools = CachedDuckDuckGoTools(pages=make_store(tmp_path, FakeSite(etag=None)), page_chars=40)
+
+    result = json.loads(tools.read_page("https://example.com/rust"))
+
+    assert result["title"] == "Rust 2025"
+    assert result["text"] == "What's new in Rust\nThe 2025 edition brin"
+    assert result["truncated"] is True
+    assert "read_page" in tools.functions
+    assert "read_page" not in CachedDuckDuckGoTools().functions
+
+
+@pytest.mark.parametrize(
+    ("url", "address"),
+    [
+        ("file:///etc/passwd", PUBLIC_IP),
+        ("http://localhost:8080/admin", "127.0.0.1"),
+        ("http://metadata.internal/latest/meta-data/", "169.254.169.254"),
+        ("https://intranet.example.com/", "10.0.0.7"),
+        ("http://[::ffff:192.168.1.1]/", "::ffff:192.168.1.1"),
+    ],
+)
+def test_non_public_urls_are_refused_before_any_request(tmp_path, url, address):
+    """Test that other schemes and hosts resolving to internal addresses are never fetched."""
+    site = FakeSite()
+    store = make_store(tmp_path, site, resolve=lambda host, port: [PUBLIC_IP, address])
+
+    with pytest.raises(UnsafeURLError):
+        store.get(url)
+    assert site.downloads == 0
+
+
+def test_every_redirect_hop_is_checked(tmp_path):
+    """Test that a public page redirecting to an internal address is refused at that hop."""
+    requested = []
+
+    def site(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        if request.url.host == "example.com":
+            return httpx.Response(302, headers={"Location": "http://169.254.169.254/latest/meta-data/"})
+        return httpx.Response(200, text="secret")
+
+    addresses = {"example.com": PUBLIC_IP, "169.254.169.254": "169.254.169.254"}
+    store = make_store(tmp_path, site, resolve=lambda host, port: [addresses[host]])
+
+    with pytest.raises(UnsafeURLError):
+        store.get("https://example.com/rust")
+    assert requested == ["https://example.com/rust"]
+
+
+def test_non_text_pages_are_refused_before_reading_the_body(tmp_path):
+    """Test that binary content is rejected from its headers alone."""
+
+    def body():
+        pytest.fail("the body was read")
+        yield b""
+
+    store = make_store(
+        tmp_path, lambda request: httpx.Response(200, headers={"Content-Type": "application/pdf"}, content=body())
+    )
+
+    with pytest.raises(UnsupportedContentError):
+        store.get("https://example.com/paper.pdf")
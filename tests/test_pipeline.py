@@ -0,0 +1,131 @@
+"""Tests for the staged research → draft → post pipeline."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from reddit_post_generator.cache import MemoryCache
+from reddit_post_generator.main import handler
+from reddit_post_generator.pipeline import PostDraft, PostPipeline
+from reddit_post_generator.pool import AgentPool
+
+
+class FakeAgent:
+    """Agent stand-in that records prompts and returns a fixed result."""
+
+    def __init__(self, content, calls: list[str], delay: float = 0.0) -> None:
+        self.content = content
+        self.calls = calls
+        self.delay = delay
+
+    async def arun(self, messages):
+        self.calls.append(messages[0]["content"])
+        await asyncio.sleep(self.delay)
+        return MagicMock(content=self.content)
+
+
+def make_pipeline(cache=None, post_response=None, delay: float = 0.0):
+    """Create a started pipeline with fake stage agents and a fake Reddit client."""
+    calls = {"research": [], "draft": [], "post": []}
+    draft = PostDraft(title="Rust in 2025", content="Rust keeps growing.", flair="Discussion")
+
+    def create_post(**kwargs):
+        calls["post"].append(kwargs)
+        return post_response or json.dumps({"id": "abc", "permalink": "/r/rust/abc"})
+
+    pipeline = PostPipeline(
+        AgentPool(lambda: FakeAgent("- Adoption is up https://example.com/a", calls["research"], delay), size=2),
+        AgentPool(lambda: FakeAgent(draft, calls["draft"]), size=2),
+        AgentPool(lambda: MagicMock(create_post=create_post), size=1),
+        cache=cache,
+    )
+    pipeline.start()
+    return pipeline, calls
+
+
+@pytest.mark.asyncio
+async def test_run_goes_through_every_stage():
+    """Test that a job is researched, drafted and submitted, with a structured report."""
+    pipeline, calls = make_pipeline()
+
+    report = await pipeline.run({"topic": "Rust adoption", "subreddit": "rust"})
+
+    assert report["success"] is True
+    assert report["post_details"]["title"] == "Rust in 2025"
+    assert report["post_details"]["submission"]["id"] == "abc"
+    assert report["research_summary"]["sources_used"] == 1
+    assert report["research_summary"]["key_findings"] == ["Adoption is up https://example.com/a"]
+    assert report["metadata"]["post_status"] == "submitted"
+    assert set(report["metadata"]["stage_timings_ms"]) == {"research_ms", "draft_ms", "post_ms"}
+    assert calls["post"][0]["flair"] == "Discussion"
+    assert "https://example.com/a" in calls["draft"][0]
+
+
+@pytest.mark.asyncio
+async def test_run_stops_at_draft_when_not_submitting():
+    """Test that submit=false skips the post stage."""
+    pipeline, calls = make_pipeline()
+
+    report = await pipeline.run({"topic": "Rust adoption", "subreddit": "rust", "submit": False})
+
+    assert report["success"] is True
+    assert report["metadata"]["post_status"] == "draft"
+    assert calls["post"] == []
+
+
+@pytest.mark.asyncio
+async def test_intermediate_results_are_cached():
+    """Test that research and drafts are reused across runs of the same job."""
+    pipeline, calls = make_pipeline(cache=MemoryCache())
+    job = {"topic": "Rust adoption", "subreddit": "rust", "submit": False}
+
+    await pipeline.run(job)
+    await pipeline.run({**job, "topic": "  rust ADOPTION "})
+    await pipeline.run({**job, "subreddit": "programming"})
+
+    assert len(calls["research"]) == 1
+    assert len(calls["draft"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_jobs_share_in_flight_research():
+    """Test that concurrent jobs on one topic wait on a single research run."""
+    pipeline, calls = make_pipeline(delay=0.01)
+    jobs = [{"topic": "Rust adoption", "subreddit": sub} for sub in ("rust", "programming", "linux")]
+
+    results = [json.loads(line) async for line in pipeline.run_many(jobs)]
+
+    assert len(calls["research"]) == 1
+    assert sorted(r["job_index"] for r in results) == [0, 1, 2]
+    assert all(r["success"] for r in results)
+
+
+@pytest.mark.asyncio
+async def test_submission_errors_leave_post_pending_review():
+    """Test that a Reddit error string is reported against the post stage."""
+    pipeline, _ = make_pipeline(post_response="Invalid flair. Available flairs: Meta")
+
+    report = await pipeline.run({"topic": "Rust adoption", "subreddit": "rust"})
+
+    assert report["success"] is False
+    assert report["error"]["stage"] == "post"
+    assert "Invalid flair" in report["error"]["message"]
+    assert report["metadata"]["post_status"] == "pending_review"
+    assert report["post_details"]["title"] == "Rust in 2025"
+
+
+@pytest.mark.asyncio
+async def test_handler_routes_structured_jobs_to_pipeline():
+    """Test that handler sends JSON jobs through the pipeline when it is enabled."""
+    pipeline, _ = make_pipeline()
+    messages = [{"role": "user", "content": json.dumps({"topic": "Rust adoption", "subreddit": "rust"})}]
+
+    with (
+        patch("reddit_post_generator.main._initialized", True),
+        patch("reddit_post_generator.main.pipeline", pipeline),
+    ):
+        result = await handler(messages)
+
+    assert json.loads(result)["metadata"]["post_status"] == "submitted"
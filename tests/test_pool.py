@@ -0,0 +1,96 @@
+"""Tests for the agent pool."""
+
+import asyncio
+from itertools import count
+
+import pytest
+
+from reddit_post_generator.pool import AgentPool, AgentPoolExhaustedError
+
+
+def make_pool(**kwargs) -> AgentPool:
+    """Create a started pool whose agents are plain integers."""
+    ids = count()
+    pool = AgentPool(lambda: next(ids), **kwargs)
+    pool.start()
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_checkout_gives_each_run_its_own_agent():
+    """Test that concurrent checkouts receive distinct agent instances."""
+    pool = make_pool(size=2)
+
+    async with pool.checkout() as first, pool.checkout() as second:
+        assert first != second
+        assert pool.in_use == 2
+        assert pool.available == 0
+
+    assert pool.available == 2
+
+
+@pytest.mark.asyncio
+async def test_checkout_waits_for_release():
+    """Test that callers wait for a busy agent instead of sharing it."""
+    pool = make_pool(size=1)
+    order = []
+
+    async def run(name: str) -> None:
+        async with pool.checkout():
+            order.append(f"{name}-start")
+            await asyncio.sleep(0.01)
+            order.append(f"{name}-end")
+
+    await asyncio.gather(run("a"), run("b"))
+
+    assert order == ["a-start", "a-end", "b-start", "b-end"]
+
+
+@pytest.mark.asyncio
+async def test_back_pressure_rejects_excess_waiters():
+    """Test that the pool rejects callers beyond max_waiting."""
+    pool = make_pool(size=1, max_waiting=0)
+
+    async with pool.checkout():
+        with pytest.raises(AgentPoolExhaustedError):
+            async with pool.checkout():
+                pass
+
+
+@pytest.mark.asyncio
+async def test_acquire_timeout_raises():
+    """Test that waiting longer than acquire_timeout raises."""
+    pool = make_pool(size=1, acquire_timeout=0.01)
+
+    async with pool.checkout():
+        with pytest.raises(AgentPoolExhaustedError):
+            async with pool.checkout():
+                pass
+
+    assert pool.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_agent_is_rebuilt():
+    """Test that an agent failing max_failures runs in a row is replaced."""
+    pool = make_pool(size=1, max_failures=2)
+    error_msg = "model error"
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            async with pool.checkout():
+                raise RuntimeError(error_msg)
+
+    async with pool.checkout() as agent:
+        assert agent == 1
+
+    assert pool.stats()["replacements"] == 1
+    assert pool.stats()["unhealthy"] == 0
+
+
+def test_from_config_reads_agent_pool_section():
+    """Test that pool settings come from agent_config.json."""
+    pool = AgentPool.from_config(object, {"agent_pool": {"size": 5, "max_waiting": 10}})
+
+    assert pool.size == 5
+    assert pool.max_waiting == 10
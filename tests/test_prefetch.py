@@ -0,0 +1,112 @@
+"""Tests for the background cache prefetcher."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from reddit_post_generator.cache import SQLiteCache
+from reddit_post_generator.prefetch import PREFETCH_FIELDS, TrendPrefetcher
+from reddit_post_generator.tools import CachedDuckDuckGoTools
+
+
+class FakeResearchTools:
+    def __init__(self) -> None:
+        self.topics: list[str] = []
+
+    def refresh_topic(self, topic: str, keywords: list[str] | None = None) -> str:
+        self.topics.append(topic)
+        return json.dumps({"topic": topic, "sources": []})
+
+
+class FakeRedditTools:
+    def __init__(self, ratelimit_remaining: float | None = None) -> None:
+        self.client = SimpleNamespace(stats=SimpleNamespace(ratelimit_remaining=ratelimit_remaining))
+        self.refreshed: list[tuple[str, str]] = []
+
+    async def _refresh(self, field: str, subreddit_name: str) -> dict:
+        self.refreshed.append((field, subreddit_name))
+        return {}
+
+
+def test_due_orders_by_last_refresh_and_respects_ttls():
+    """Test that new entries come first, fresh ones wait for their refresh point and topics cost every search."""
+    prefetcher = TrendPrefetcher(["rust"], [{"topic": "async rust", "keywords": ["tokio"]}], max_queries=5)
+
+    due = prefetcher.due(now=0)
+    assert [key for key, _ in due] == [*(f"{field}:rust" for field in PREFETCH_FIELDS), "topic:async rust"]
+    assert prefetcher.cost(due[0][1]) == 1
+    # Two web searches and one news search
+    assert prefetcher.cost(due[-1][1]) == 3
+
+    prefetcher._refreshed = {key: 0.0 for key, _ in due}
+    prefetcher._refreshed["rules:rust"] = -100_000.0
+    assert [key for key, _ in prefetcher.due(now=3000)] == ["rules:rust", "top_posts:rust"]
+
+
+@pytest.mark.asyncio
+async def test_cycle_stays_within_budget_and_defers_to_live_requests():
+    """Test that a cycle spends at most its budget and stops once a request arrives."""
+    research, reddit = FakeResearchTools(), FakeRedditTools()
+    prefetcher = TrendPrefetcher(["rust", "python"], ["async rust"], max_requests=4)
+
+    assert await prefetcher.run_cycle(research, reddit) == 4
+    assert reddit.refreshed == [("info", "rust"), ("rules", "rust"), ("flairs", "rust"), ("requirements", "rust")]
+    assert research.topics == []
+
+    idle = iter([True, True, False])
+    prefetcher.idle = lambda: next(idle)
+    assert await prefetcher.run_cycle(research, reddit) == 2
+    assert (prefetcher.stats.cycles, prefetcher.stats.refreshed, prefetcher.stats.deferred) == (2, 6, 1)
+
+
+@pytest.mark.asyncio
+async def test_low_reddit_quota_skips_subreddits_but_not_research():
+    """Test that Reddit refreshes wait for quota while topic research still runs."""
+    research, reddit = FakeResearchTools(), FakeRedditTools(ratelimit_remaining=5)
+    prefetcher = TrendPrefetcher(["rust"], ["async rust"], min_ratelimit_remaining=30)
+
+    assert await prefetcher.run_cycle(research, reddit) == 2
+    assert reddit.refreshed == []
+    assert research.topics == ["async rust"]
+    assert [key for key, _ in prefetcher.due()] == [f"{field}:rust" for field in PREFETCH_FIELDS]
+
+    reddit.client.stats.ratelimit_remaining = 600
+    await prefetcher.run_cycle(research, reddit)
+    assert len(reddit.refreshed) == len(PREFETCH_FIELDS)
+
+
+def test_from_config_is_disabled_without_schedule():
+    """Test that no prefetcher is built unless it is enabled with something to prefetch."""
+    assert TrendPrefetcher.from_config({}) is None
+    assert TrendPrefetcher.from_config({"prefetch": {"enabled": True}}) is None
+
+    prefetcher = TrendPrefetcher.from_config({
+        "prefetch": {"enabled": True, "subreddits": ["rust"], "interval_seconds": 60},
+        "cache": {"subreddit": {"field_ttl_seconds": {"rules": 600}}},
+    })
+    assert prefetcher.interval == 60
+    assert prefetcher.field_ttls["rules"] == 600
+
+
+@pytest.mark.asyncio
+async def test_topic_refresh_searches_again_before_the_cache_expires(tmp_path):
+    """Test that refreshing a topic hits the search backend even while its cached results are still valid."""
+    tools = CachedDuckDuckGoTools(cache=SQLiteCache(tmp_path / "cache.sqlite3"))
+    prefetcher = TrendPrefetcher([], ["async rust"], topic_refresh=3600)
+
+    with (
+        patch("agno.tools.websearch.WebSearchTools.web_search", return_value="[]") as mock_search,
+        patch("agno.tools.websearch.WebSearchTools.search_news", return_value="[]") as mock_news,
+    ):
+        tools.research_topic("async rust")
+        tools.research_topic("async rust")
+        assert (mock_search.call_count, mock_news.call_count) == (1, 1)
+
+        await prefetcher.run_cycle(tools, None)
+        assert (mock_search.call_count, mock_news.call_count) == (2, 2)
+        tools.research_topic("async rust")
+
+    assert (mock_search.call_count, mock_news.call_count) == (2, 2)
+    assert prefetcher.stats.refreshed == 1
@@ -0,0 +1,167 @@
+"""Tests for the async Reddit client and toolkit."""
+
+import asyncio
+import json
+import sqlite3
+import time
+
+import httpx
+import pytest
+
+from reddit_post_generator.cache import MemoryCache
+from reddit_post_generator.reddit_client import AsyncRedditClient, SharedTokenBucket, TokenBucket
+from reddit_post_generator.tools import AsyncRedditTools
+
+
+class FakeRedditAPI:
+    """httpx transport handler recording calls and replaying scripted statuses."""
+
+    def __init__(self, statuses: list[int] | None = None) -> None:
+        self.statuses = list(statuses or [])
+        self.token_requests = 0
+        self.calls: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v1/access_token":
+            self.token_requests += 1
+            return httpx.Response(200, json={"access_token": f"token-{self.token_requests}", "expires_in": 3600})
+
+        self.calls.append(f"{request.method} {request.url.path}")
+        status = self.statuses.pop(0) if self.statuses else 200
+        headers = {"X-Ratelimit-Remaining": "50", "X-Ratelimit-Reset": "100", "Retry-After": "0.01"}
+        if request.url.path.endswith("/about"):
+            payload = {"data": {"display_name": "rust", "subscribers": 10, "active_user_count": 2}}
+        elif request.url.path.endswith("/api/link_flair_v2"):
+            payload = [{"text": "Discussion", "id": "flair-1"}]
+        elif request.url.path == "/api/submit":
+            form = dict(httpx.QueryParams(request.content.decode()))
+            assert form["flair_id"] == "flair-1"
+            payload = {
+                "json": {"errors": [], "data": {"id": "abc", "url": "https://www.reddit.com/r/rust/comments/abc/"}}
+            }
+        else:
+            payload = {}
+        return httpx.Response(status, json=payload, headers=headers)
+
+
+def make_client(api: FakeRedditAPI, **kwargs) -> AsyncRedditClient:
+    client = AsyncRedditClient("id", "secret", "user", "pass", **kwargs)
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(api))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_token_is_shared_by_concurrent_calls_and_refreshed_on_401():
+    """Test that concurrent requests authenticate once and a 401 fetches a new token."""
+    api = FakeRedditAPI()
+    client = make_client(api, requests_per_minute=6000)
+
+    await asyncio.gather(*(client.about("rust") for _ in range(5)))
+    assert api.token_requests == 1
+
+    api.statuses = [401]
+    await client.about("rust")
+    assert api.token_requests == 2
+    assert client.stats.requests == 7
+
+
+@pytest.mark.asyncio
+async def test_429_pauses_and_retries_and_headers_slow_the_bucket():
+    """Test that a 429 is retried after Retry-After and rate-limit headers lower the refill rate."""
+    api = FakeRedditAPI(statuses=[429])
+    client = make_client(api, requests_per_minute=6000)
+
+    assert (await client.about("rust"))["display_name"] == "rust"
+    assert client.stats.throttled == 1
+    assert api.calls == ["GET /r/rust/about", "GET /r/rust/about"]
+    # 50 calls left in a 100 second window
+    assert client.bucket.rate == pytest.approx(0.5)
+    assert client.stats.ratelimit_remaining == 50
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_bursts():
+    """Test that calls beyond the burst capacity wait for tokens to refill."""
+    bucket = TokenBucket(rate=50, capacity=2)
+
+    start = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+
+    assert time.monotonic() - start >= 0.07
+
+
+@pytest.mark.asyncio
+async def test_async_tools_cache_fields_and_post_with_flair():
+    """Test that subreddit info is served from the cache and posts map flair text to its id."""
+    api = FakeRedditAPI()
+    tools = AsyncRedditTools(make_client(api, requests_per_minute=6000), cache=MemoryCache())
+
+    first = json.loads(await tools.get_subreddit_info("rust"))
+    second = json.loads(await tools.get_subreddit_info("Rust"))
+    post = json.loads(await tools.create_post("rust", "Title", "Body", flair="Discussion"))
+
+    assert first == second
+    assert first["available_flairs"] == ["Discussion"]
+    assert api.calls.count("GET /r/rust/about") == 1
+    assert post["post"]["permalink"] == "/r/rust/comments/abc/"
+    assert post["post"]["flair"] == "Discussion"
+    assert await tools.create_post("rust", "Title", "Body", flair="Memes") == (
+        "Invalid flair. Available flairs: Discussion"
+    )
+
+
+@pytest.mark.asyncio
+async def test_shared_bucket_is_one_budget_for_all_workers(tmp_path):
+    """Test that buckets on the same database share tokens, pauses and header updates."""
+    path = tmp_path / "cache.sqlite3"
+    first = SharedTokenBucket(rate=0.01, capacity=2, path=path)
+    second = SharedTokenBucket(rate=0.01, capacity=2, path=path)
+
+    await first.acquire()
+    await second.acquire()
+    assert second._take() > 0
+
+    first.update(remaining=50, reset_seconds=100)
+    assert second._take() > 0
+    assert second.rate == pytest.approx(0.01)
+
+    second.pause(60)
+    assert first._take() > 59
+    first.close()
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_bucket_waits_for_other_workers_off_the_event_loop(tmp_path):
+    """Test that a bucket locked by another worker doesn't block the event loop while acquiring."""
+    path = tmp_path / "cache.sqlite3"
+    bucket = SharedTokenBucket(rate=10, capacity=2, path=path)
+    other_worker = sqlite3.connect(path, isolation_level=None)
+    other_worker.execute("BEGIN IMMEDIATE")
+
+    acquiring = asyncio.create_task(bucket.acquire())
+    # A blocking acquire would hold the loop here until SQLite's busy timeout
+    started = time.perf_counter()
+    await asyncio.sleep(0.05)
+    assert time.perf_counter() - started < 1
+    assert not acquiring.done()
+
+    other_worker.execute("COMMIT")
+    await asyncio.wait_for(acquiring, timeout=5)
+    other_worker.close()
+    bucket.close()
+
+
+def test_client_uses_shared_bucket_with_several_workers(tmp_path):
+    """Test that multi-worker configs get a rate limiter in the shared cache database."""
+    config = {"workers": 2, "cache": {"path": str(tmp_path / "cache.sqlite3")}, "reddit": {"requests_per_minute": 60}}
+
+    client = AsyncRedditClient.from_config(config, client_id="id", client_secret="secret")  # noqa: S106
+
+    assert isinstance(client.bucket, SharedTokenBucket)
+    assert client.bucket.rate == pytest.approx(1)
+    client.bucket.close()
+
+    single = AsyncRedditClient.from_config({}, client_id="id", client_secret="secret")  # noqa: S106
+    assert not isinstance(single.bucket, SharedTokenBucket)
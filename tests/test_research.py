@@ -0,0 +1,52 @@
+"""Tests for research query expansion, deduplication and ranking."""
+
+from datetime import UTC, datetime
+
+from reddit_post_generator.research import canonical_url, derive_queries, rank_results, recency
+
+
+def test_derive_queries_combines_topic_and_keywords():
+    """Test that each keyword is searched with the topic, without repeats."""
+    queries = derive_queries("  AI   ethics ", ["regulation", "Regulation", " ", "EU act"], max_queries=5)
+
+    assert queries == ["AI ethics", "AI ethics regulation", "AI ethics EU act"]
+    assert derive_queries("AI", ["a", "b", "c"], max_queries=2) == ["AI", "AI a"]
+
+
+def test_canonical_url_ignores_tracking_and_formatting():
+    """Test that tracking parameters, www, scheme and trailing slashes don't create new sources."""
+    assert canonical_url("http://www.Example.com/a/?utm_source=x&id=2#top") == canonical_url(
+        "https://example.com/a?id=2"
+    )
+    assert canonical_url("https://example.com/a?id=2") != canonical_url("https://example.com/a?id=3")
+
+
+def test_rank_results_dedupes_snippets_and_prefers_authority_and_recency():
+    """Test that near-identical snippets collapse and authoritative, recent sources rank first."""
+    story = "The new framework release improves build times and adds streaming server rendering support"
+    results = [
+        {"title": "Blog", "href": "https://someblog.net/post", "body": story},
+        {"title": "Mirror", "href": "https://mirror.net/post", "body": story + " today"},
+        {"title": "Docs", "href": "https://github.com/org/repo", "body": "Release notes"},
+        {"title": "Study", "href": "https://cs.stanford.edu/paper", "body": "A study of build systems"},
+        {
+            "title": "News",
+            "href": "https://reuters.com/tech",
+            "body": "Tech news",
+            "date": datetime.now(UTC).isoformat(),
+        },
+    ]
+
+    ranked = rank_results(results, max_sources=3)
+
+    assert [item["title"] for item in ranked] == ["News", "Study", "Docs"]
+    assert len(rank_results(results, max_sources=10)) == 4
+
+
+def test_recency_decays_with_age():
+    """Test that newer results score higher and undated ones get a neutral score."""
+    now = datetime(2026, 1, 31, tzinfo=UTC)
+
+    assert recency("2026-01-31T00:00:00Z", now) == 1
+    assert recency("2026-01-01", now) == 0.5
+    assert recency(None, now) == recency("not a date", now) == 0.3
@@ -0,0 +1,110 @@
+"""Tests for result projection and bounded task storage."""
+
+import json
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from reddit_post_generator.results import ResultProjector, post_report
+from reddit_post_generator.retention import BoundedMemoryStorage, RetentionStats, retaining_tasks
+
+REPORT = """# Reddit Post Generated Successfully
+
+## Post Details
+- **Subreddit:** r/rust
+- **Title:** Async Rust in 2026
+- **Status:** Posted
+
+## Research Summary
+- **Sources Researched:** 6
+- **Key Topics Covered:** tokio, async traits, cancellation
+- **Post Length:** 1,480 characters
+"""
+
+
+def run_output(content: str, tools: list | None = None) -> SimpleNamespace:
+    return SimpleNamespace(content=content, tools=tools or [], messages=["large", "transcript"], metrics={})
+
+
+def test_content_projection_returns_capped_text_and_keeps_json_valid():
+    """Test that only the final reply is kept and long replies are cut to the limit."""
+    projector = ResultProjector(max_chars=400)
+
+    assert projector.project(run_output("short post")) == "short post"
+    cut = projector.project(run_output("x" * 2000))
+    assert len(cut) <= 401
+    assert cut.endswith("…")
+
+    shaped = json.dumps({"success": True, "post_details": {"content": "y" * 2000}})
+    capped = projector.project(shaped)
+    assert len(capped) <= 400
+    assert json.loads(capped)["success"] is True
+    assert (projector.stats.results, projector.stats.truncated) == (3, 2)
+
+
+def test_output_format_projection_reads_the_report_and_the_post():
+    """Test that an agent run is shaped like skill.yaml's output_format, preferring what create_post sent."""
+    post = SimpleNamespace(
+        tool_name="create_post",
+        tool_args={"subreddit": "rust", "title": "Async Rust in 2026", "content": "body", "flair": None},
+        result=json.dumps({"post": {"id": "abc", "url": "https://reddit.com/r/rust/comments/abc"}}),
+    )
+
+    report = post_report(run_output(REPORT, [post]), "write about async rust", 1200)
+
+    assert report["success"] is True
+    assert report["post_details"]["subreddit"] == "rust"
+    assert report["post_details"]["url"] == "https://reddit.com/r/rust/comments/abc"
+    assert report["research_summary"] == {"sources_used": 6, "key_findings": ["tokio", "async traits", "cancellation"]}
+    assert report["metadata"]["post_status"] == "submitted"
+
+    draft = post_report(run_output(REPORT), "q", 5)
+    assert (draft["success"], draft["post_details"]["post_length"]) == (False, 1480)
+    assert post_report('{"success": false, "error": {}}', "q", 5) == {"success": False, "error": {}}
+    assert post_report("ran out of time", "q", 5)["error"]["message"] == "ran out of time"
+    with pytest.raises(ValueError, match="Unknown result projection"):
+        ResultProjector("everything")
+
+
+async def finish(storage: BoundedMemoryStorage, context_id=None) -> dict:
+    context_id = context_id or uuid4()
+    message = {"message_id": uuid4(), "task_id": uuid4(), "context_id": context_id, "role": "user", "parts": []}
+    task = await storage.submit_task(context_id, message)
+    await storage.update_task(task["id"], state="completed")
+    return task
+
+
+@pytest.mark.asyncio
+async def test_bounded_storage_evicts_finished_tasks_by_count_and_age():
+    """Test that the oldest finished tasks go first, running tasks stay and stale tasks expire."""
+    storage = BoundedMemoryStorage(max_tasks=2, max_age_seconds=60)
+    context_id = uuid4()
+    first = await finish(storage, context_id)
+    running = await storage.submit_task(
+        context_id, {"message_id": uuid4(), "task_id": uuid4(), "context_id": context_id, "role": "user", "parts": []}
+    )
+    second, third = await finish(storage), await finish(storage)
+
+    assert first["id"] not in storage.tasks
+    assert running["id"] in storage.tasks
+    assert storage.contexts[context_id] == [running["id"]]
+    assert list(storage.tasks) == [running["id"], third["id"]]
+    assert second["id"] not in storage.tasks
+
+    assert storage.evict(now=datetime.now(UTC) + timedelta(seconds=120)) == 1
+    assert list(storage.tasks) == [running["id"]]
+    assert (storage.stats.stored, storage.stats.evicted) == (1, 3)
+
+
+def test_retaining_tasks_swaps_the_memory_storage_backend():
+    """Test that bindu's storage factory builds the bounded storage only inside the block."""
+    from bindu.server.storage import factory
+
+    with retaining_tasks(max_tasks=5, max_age_seconds=None) as stats:
+        storage = factory.InMemoryStorage()
+    assert isinstance(storage, BoundedMemoryStorage)
+    assert storage.stats is stats
+    assert isinstance(stats, RetentionStats)
+    assert not isinstance(factory.InMemoryStorage(), BoundedMemoryStorage)
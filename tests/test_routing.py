@@ -0,0 +1,107 @@
+"""Tests for complexity-based model routing."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from reddit_post_generator.main import run_agent, stream_agent
+from reddit_post_generator.pool import AgentPool
+from reddit_post_generator.routing import ModelRouter
+
+
+def user(content) -> list[dict[str, str]]:
+    return [{"role": "user", "content": content if isinstance(content, str) else json.dumps(content)}]
+
+
+def make_router(**kwargs) -> ModelRouter:
+    pools = {route: AgentPool(MagicMock, size=1) for route in ("fast", "large")}
+    return ModelRouter(pools, **kwargs)
+
+
+def test_structured_requests_route_on_documented_fields():
+    """Test that quick, short discussion posts go fast and researched tutorials go large."""
+    router = make_router()
+
+    quick = {"topic": "tabs vs spaces", "post_type": "discussion", "research_depth": "quick", "post_length": "short"}
+    tutorial = {"topic": "async Rust", "post_type": "tutorial", "research_depth": "comprehensive"}
+
+    assert router.classify(user(quick)) == "fast"
+    assert router.classify(user(tutorial)) == "large"
+    # Unspecified fields count as medium complexity
+    assert router.classify(user({"topic": "tabs vs spaces", "post_type": "question"})) == "large"
+
+
+def test_plain_text_requests_are_classified_from_their_wording():
+    """Test that field values mentioned in free text drive the route."""
+    router = make_router()
+
+    assert router.classify(user("Write a short discussion prompt about remote work for r/jobs")) == "fast"
+    assert router.classify(user("Create a programming tutorial post for r/learnprogramming")) == "large"
+    assert make_router(fast_max_score=-1).classify(user("A short discussion prompt")) == "large"
+
+
+def test_without_a_fast_route_everything_goes_large():
+    """Test that a router with only the large route never picks a missing route."""
+    router = ModelRouter({"large": AgentPool(MagicMock, size=1)})
+
+    assert router.classify(user("A short discussion prompt")) == "large"
+    with pytest.raises(ValueError, match="'large' route"):
+        ModelRouter({"fast": AgentPool(MagicMock, size=1)})
+
+
+@pytest.mark.asyncio
+async def test_run_agent_uses_the_routed_pool_and_records_spend():
+    """Test that run_agent checks out from the chosen route's pool and tracks its tokens and cost."""
+    fast_agent = MagicMock()
+    fast_agent.arun = AsyncMock(
+        return_value=SimpleNamespace(metrics=SimpleNamespace(input_tokens=1000, output_tokens=500))
+    )
+    large_agent = MagicMock()
+    pools = {"fast": AgentPool(lambda: fast_agent, size=1), "large": AgentPool(lambda: large_agent, size=1)}
+    for pool in pools.values():
+        pool.start()
+    router = ModelRouter(pools, prices={"fast": (0.15, 0.6)})
+
+    with (
+        patch("reddit_post_generator.main.agent_pool", pools["large"]),
+        patch("reddit_post_generator.main.router", router),
+        patch("reddit_post_generator.main.history", None),
+    ):
+        await run_agent(user("Quick short question for r/rust: favourite crate?"))
+
+    fast_agent.arun.assert_awaited_once()
+    large_agent.arun.assert_not_called()
+    assert router.stats["fast"].requests == 1
+    assert router.stats["fast"].input_tokens == 1000
+    assert router.stats["fast"].cost_usd == pytest.approx(0.00045)
+    assert router.stats["large"].requests == 0
+
+
+@pytest.mark.asyncio
+async def test_streamed_runs_are_recorded_on_their_route():
+    """Test that a finished stream adds its run's tokens to the routed pool's spend."""
+    from agno.run.agent import RunCompletedEvent, RunContentEvent
+
+    class StreamingAgent:
+        async def arun(self, messages, **kwargs):
+            yield RunContentEvent(content="post")
+            yield RunCompletedEvent(metrics=SimpleNamespace(input_tokens=1000, output_tokens=500))
+
+    pools = {route: AgentPool(StreamingAgent, size=1) for route in ("fast", "large")}
+    for pool in pools.values():
+        pool.start()
+    router = ModelRouter(pools, prices={"fast": (0.15, 0.6)})
+
+    with (
+        patch("reddit_post_generator.main.agent_pool", pools["large"]),
+        patch("reddit_post_generator.main.router", router),
+        patch("reddit_post_generator.main.history", None),
+    ):
+        chunks = [chunk async for chunk in stream_agent(user("Quick short question for r/rust: favourite crate?"))]
+
+    assert json.loads(chunks[-1]) == {"event": "completed"}
+    assert router.stats["fast"].requests == 1
+    assert router.stats["fast"].cost_usd == pytest.approx(0.00045)
+    assert router.stats["large"].requests == 0
@@ -0,0 +1,83 @@
+"""Tests for streaming tokens and phase events."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from agno.models.response import ToolExecution
+from agno.run.agent import RunContentEvent, ToolCallCompletedEvent, ToolCallStartedEvent
+
+from reddit_post_generator.main import stream_handler
+from reddit_post_generator.pool import AgentPool
+from reddit_post_generator.streaming import translate
+
+
+class StreamingAgent:
+    """Agent stand-in whose streaming run replays a fixed list of events."""
+
+    def __init__(self, events) -> None:
+        self.events = events
+        self.kwargs = None
+
+    async def _replay(self):
+        for event in self.events:
+            yield event
+
+    def arun(self, messages, **kwargs):
+        self.kwargs = kwargs
+        return self._replay()
+
+
+def decode(chunks: list[str]) -> list[dict]:
+    return [json.loads(chunk) for chunk in chunks]
+
+
+def test_translate_maps_tool_calls_to_phase_events():
+    """Test that search, draft and submit tool calls become phase events."""
+    search = ToolExecution(tool_name="web_search", tool_args={"query": "rust 2025"})
+    search_done = ToolExecution(tool_name="web_search", result="https://a.com https://b.com https://a.com")
+    post = ToolExecution(tool_name="create_post", tool_args={"subreddit": "rust", "title": "Rust in 2025"})
+    posted = ToolExecution(tool_name="create_post", result=json.dumps({"post": {"permalink": "/r/rust/x", "url": "u"}}))
+
+    assert decode(translate(ToolCallStartedEvent(tool=search))) == [{"event": "search_started", "query": "rust 2025"}]
+    assert decode(translate(ToolCallCompletedEvent(tool=search_done))) == [{"event": "sources_found", "count": 2}]
+    assert decode(translate(ToolCallStartedEvent(tool=post)))[0]["event"] == "draft_ready"
+    assert decode(translate(ToolCallCompletedEvent(tool=posted)))[0] == {
+        "event": "submitted",
+        "permalink": "/r/rust/x",
+        "url": "u",
+    }
+    assert decode(translate(RunContentEvent(content="Hel"))) == [{"event": "token", "content": "Hel"}]
+    assert translate(RunContentEvent(content="")) == []
+
+
+def test_translate_reports_failed_submission():
+    """Test that a RedditTools error string is surfaced as submit_failed."""
+    failed = ToolExecution(tool_name="create_post", result="Invalid flair. Available flairs: Meta")
+
+    assert decode(translate(ToolCallCompletedEvent(tool=failed))) == [
+        {"event": "submit_failed", "error": "Invalid flair. Available flairs: Meta"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_handler_yields_events_as_they_arrive():
+    """Test that stream_handler streams the agent's run and releases the agent afterwards."""
+    agent = StreamingAgent([
+        ToolCallStartedEvent(tool=ToolExecution(tool_name="web_search", tool_args={"query": "ai"})),
+        RunContentEvent(content="Hello"),
+        RunContentEvent(content=" world"),
+    ])
+    pool = AgentPool(lambda: agent, size=1)
+    pool.start()
+
+    with (
+        patch("reddit_post_generator.main._initialized", True),
+        patch("reddit_post_generator.main.agent_pool", pool),
+    ):
+        events = decode([chunk async for chunk in stream_handler([{"role": "user", "content": "Post about AI"}])])
+
+    assert [e["event"] for e in events] == ["started", "search_started", "token", "token", "completed"]
+    assert "".join(e.get("content", "") for e in events) == "Hello world"
+    assert agent.kwargs == {"stream": True, "stream_events": True}
+    assert pool.available == 1
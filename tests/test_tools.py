@@ -0,0 +1,209 @@
+"""Tests for the cached toolkits."""
+
+import json
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from reddit_post_generator.cache import SQLiteCache
+from reddit_post_generator.tools import CachedDuckDuckGoTools, CachedRedditTools
+
+
+def test_repeated_search_is_served_from_cache(tmp_path):
+    """Test that the same normalized query only hits DuckDuckGo once."""
+    tools = CachedDuckDuckGoTools(cache=SQLiteCache(tmp_path / "cache.sqlite3"))
+
+    with patch(
+        "agno.tools.websearch.WebSearchTools.web_search",
+        return_value='[{"title": "Web frameworks 2025"}]',
+    ) as mock_search:
+        first = tools.web_search("Web frameworks 2025")
+        second = tools.web_search("  web   FRAMEWORKS 2025 ")
+
+    mock_search.assert_called_once()
+    assert first == second == '[{"title": "Web frameworks 2025"}]'
+
+
+def test_region_and_time_filter_are_part_of_the_key(tmp_path):
+    """Test that searches with different filters are cached separately."""
+    cache = SQLiteCache(tmp_path / "cache.sqlite3")
+    us_tools = CachedDuckDuckGoTools(cache=cache, region="us-en", timelimit="w")
+    uk_tools = CachedDuckDuckGoTools(cache=cache, region="uk-en", timelimit="w")
+
+    with patch("agno.tools.websearch.WebSearchTools.search_news", return_value="[]") as mock_news:
+        us_tools.search_news("ai ethics")
+        uk_tools.search_news("ai ethics")
+        us_tools.search_news("ai ethics")
+
+    assert mock_news.call_count == 2
+
+
+def test_search_errors_are_not_cached(tmp_path):
+    """Test that a failed search is retried on the next call."""
+    tools = CachedDuckDuckGoTools(cache=SQLiteCache(tmp_path / "cache.sqlite3"))
+
+    with patch(
+        "agno.tools.websearch.WebSearchTools.web_search",
+        side_effect=[TimeoutError(), "[]"],
+    ) as mock_search:
+        with pytest.raises(TimeoutError):
+            tools.web_search("rust")
+        assert tools.web_search("rust") == "[]"
+
+    assert mock_search.call_count == 2
+
+
+def test_reported_search_errors_are_not_cached(tmp_path):
+    """Test that an error string from the search backend isn't replayed from the cache."""
+    tools = CachedDuckDuckGoTools(cache=SQLiteCache(tmp_path / "cache.sqlite3"))
+
+    with patch(
+        "agno.tools.websearch.WebSearchTools.search_news",
+        side_effect=["Error searching news: 202 Ratelimit", "[]"],
+    ) as mock_news:
+        assert tools.search_news("rust").startswith("Error")
+        assert tools.search_news("rust") == "[]"
+        assert tools.search_news("rust") == "[]"
+
+    assert mock_news.call_count == 2
+
+
+def test_research_topic_runs_queries_concurrently_and_dedupes():
+    """Test that research_topic searches every query in parallel and merges duplicate sources."""
+    barrier = threading.Barrier(4, timeout=5)
+
+    def search(self, query, max_results=5):
+        # Every search waits for the others, so this only passes if they run at once
+        barrier.wait()
+        return json.dumps([
+            {"title": "Shared", "href": "https://www.example.com/post/?utm_source=ddg", "body": "shared story"},
+            {"title": query, "href": f"https://example.org/{query.replace(' ', '-')}", "body": f"about {query}"},
+        ])
+
+    tools = CachedDuckDuckGoTools(max_sources=10)
+    with (
+        patch("agno.tools.websearch.WebSearchTools.web_search", search),
+        patch("agno.tools.websearch.WebSearchTools.search_news", search),
+    ):
+        bundle = json.loads(tools.research_topic("rust async", keywords=["tokio", "performance"]))
+
+    assert bundle["queries"] == ["rust async", "rust async tokio", "rust async performance"]
+    urls = [source["url"] for source in bundle["sources"]]
+    assert len(urls) == len({source["title"] for source in bundle["sources"]}) == 4
+    assert bundle["sources"][0]["title"] == "Shared"
+    assert bundle["sources"][0]["hits"] == 4
+    assert "research_topic" in tools.functions
+
+
+def make_reddit_tools(tmp_path, **kwargs) -> tuple[CachedRedditTools, MagicMock]:
+    """Create CachedRedditTools backed by a mocked PRAW client."""
+    reddit = MagicMock()
+    subreddit = reddit.subreddit.return_value
+    subreddit.configure_mock(
+        display_name="webdev",
+        title="Web Development",
+        description="",
+        public_description="",
+        subscribers=2_000_000,
+        created_utc=1_230_000_000.0,
+        over18=False,
+        url="/r/webdev/",
+    )
+    subreddit.flair.link_templates = [{"text": "Discussion"}, {"text": "Resource"}]
+    subreddit.rules = [MagicMock(short_name="No spam", description="", kind="all", violation_reason="Spam")]
+    subreddit.post_requirements.return_value = {"title_text_min_length": 10}
+
+    cache = SQLiteCache(tmp_path / "cache.sqlite3", namespace="subreddit")
+    return CachedRedditTools(cache=cache, reddit_instance=reddit, **kwargs), reddit
+
+
+def test_subreddit_rules_are_cached(tmp_path):
+    """Test that repeat lookups for the same subreddit skip the Reddit API."""
+    tools, reddit = make_reddit_tools(tmp_path)
+
+    first = json.loads(tools.get_subreddit_rules("webdev"))
+    second = json.loads(tools.get_subreddit_rules("WebDev"))
+
+    assert first == second
+    assert first["rules"][0]["short_name"] == "No spam"
+    assert first["available_flairs"] == ["Discussion", "Resource"]
+    assert first["post_requirements"] == {"title_text_min_length": 10}
+    reddit.subreddit.return_value.post_requirements.assert_called_once()
+    assert "get_subreddit_rules" in tools.functions
+
+
+def test_prefetched_top_posts_are_served_from_cache(tmp_path):
+    """Test that a refreshed top-of-week snapshot answers get_top_posts with default arguments."""
+    tools, reddit = make_reddit_tools(tmp_path)
+    top = reddit.subreddit.return_value.top
+    top.return_value = [
+        SimpleNamespace(
+            id="abc",
+            title="Tokio 2.0",
+            score=900,
+            url="https://tokio.rs",
+            selftext="",
+            author="alice",
+            permalink="/r/rust/comments/abc",
+            created_utc=1_760_000_000.0,
+            subreddit="rust",
+            subreddit_name_prefixed="r/rust",
+        )
+    ]
+
+    tools._refresh("top_posts", "rust")
+    posts = json.loads(tools.get_top_posts("rust"))["top_posts"]
+    tools.get_top_posts("rust", time_filter="day")
+
+    assert posts[0]["title"] == "Tokio 2.0"
+    assert top.call_count == 2
+
+
+def test_subreddit_info_keeps_upstream_shape(tmp_path):
+    """Test that cached subreddit info has the same keys as RedditTools."""
+    tools, _ = make_reddit_tools(tmp_path)
+
+    info = json.loads(tools.get_subreddit_info("webdev"))
+
+    assert info["display_name"] == "webdev"
+    assert info["available_flairs"] == ["Discussion", "Resource"]
+
+
+def test_invalidate_forces_refetch(tmp_path):
+    """Test that invalidating a subreddit refetches it on the next call."""
+    tools, reddit = make_reddit_tools(tmp_path)
+    requirements = reddit.subreddit.return_value.post_requirements
+
+    tools.get_subreddit_rules("webdev")
+    tools.invalidate("webdev", fields=["requirements"])
+    tools.get_subreddit_rules("webdev")
+
+    assert requirements.call_count == 2
+
+
+def test_stale_entry_is_served_and_refreshed_in_background(tmp_path):
+    """Test that an entry past the refresh threshold is served while refreshing."""
+    tools, reddit = make_reddit_tools(tmp_path, field_ttls={"requirements": 100}, refresh_ratio=0.5)
+    requirements = reddit.subreddit.return_value.post_requirements
+
+    with patch("reddit_post_generator.tools.time.time", return_value=1000.0):
+        tools.get_field("requirements", "webdev")
+    with (
+        patch("reddit_post_generator.tools.time.time", return_value=1060.0),
+        patch.object(tools, "_schedule_refresh") as mock_refresh,
+    ):
+        assert tools.get_field("requirements", "webdev") == {"title_text_min_length": 10}
+
+    mock_refresh.assert_called_once_with("requirements", "webdev")
+    requirements.assert_called_once()
+
+
+def test_reddit_errors_are_not_cached(tmp_path):
+    """Test that failed lookups return an error string and are retried."""
+    tools, reddit = make_reddit_tools(tmp_path)
+    reddit.subreddit.return_value.post_requirements.side_effect = [RuntimeError("503"), {}]
+
+    assert tools.get_subreddit_rules("webdev").startswith("Error getting subreddit rules")
+    assert json.loads(tools.get_subreddit_rules("webdev"))["post_requirements"] == {}
@@ -0,0 +1,59 @@
+"""Tests for pre-forked worker processes."""
+
+import os
+import socket
+
+import pytest
+
+from reddit_post_generator.workers import bind_socket, prepare_workers, run_workers, worker_count
+
+
+def test_workers_run_and_crashed_workers_are_restarted(tmp_path):
+    """Test that every worker runs once and a worker failing after startup is restarted."""
+
+    def target(index: int) -> None:
+        marker = tmp_path / f"worker-{index}"
+        runs = int(marker.read_text()) if marker.exists() else 0
+        marker.write_text(str(runs + 1))
+        if index == 1 and runs == 0:
+            os._exit(3)
+
+    run_workers(3, target, min_uptime=0)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["worker-0", "worker-1", "worker-2"]
+    assert (tmp_path / "worker-1").read_text() == "2"
+    assert (tmp_path / "worker-0").read_text() == "1"
+
+
+def test_worker_failing_at_startup_stops_the_server():
+    """Test that a worker erroring right after it starts is not restarted forever."""
+
+    def target(index: int) -> None:
+        error_msg = "bad config"
+        raise ValueError(error_msg)
+
+    with pytest.raises(RuntimeError, match="right after starting"):
+        run_workers(2, target)
+
+
+def test_prepare_workers_keeps_keys_and_validates_count():
+    """Test that workers never regenerate DID keys and that the worker count is validated."""
+    config = prepare_workers({"recreate_keys": True, "storage": {"type": "postgres"}}, 4)
+
+    assert config["recreate_keys"] is False
+    assert worker_count(config) == 4
+    assert worker_count({}) == 1
+    with pytest.raises(ValueError, match="positive integer"):
+        worker_count({"workers": 0})
+
+
+def test_bound_socket_is_inherited_and_accepts():
+    """Test that the parent's socket listens on the deployment port and survives a fork."""
+    sock = bind_socket("http://127.0.0.1:0")
+    try:
+        assert sock.get_inheritable()
+        with socket.create_connection(sock.getsockname(), timeout=1):
+            conn, _ = sock.accept()
+            conn.close()
+    finally:
+        sock.close()